@@ -53,6 +53,9 @@ class AccessToken(NonCompletableGithubObject):
 
     _created: datetime
 
+    # the creation time is taken when decoding the attributes
+    _supports_lazy_attributes = False
+
     def _initAttributes(self) -> None:
         self._expires_in: Attribute[int | None] = NotSet
         self._refresh_expires_in: Attribute[int | None] = NotSet
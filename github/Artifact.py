@@ -45,10 +45,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, overload
 
 import github.WorkflowRun
+from github import Consts
 from github.GithubObject import Attribute, NonCompletableGithubObject, NotSet
 
 if TYPE_CHECKING:
@@ -142,6 +144,55 @@ class Artifact(NonCompletableGithubObject):
         status, headers, data = self._requester.requestBlob("DELETE", self.url)
         return status == 204
 
+    @overload
+    def download(
+        self, path: None = None, chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE
+    ) -> tuple[int, dict[str, Any], Iterator]:
+        ...
+
+    @overload
+    def download(
+        self,
+        path: str,
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int | None], None] | None = None,
+        workers: int = 1,
+        max_resumes: int = Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
+    ) -> None:
+        ...
+
+    def download(
+        self,
+        path: None | str = None,
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int | None], None] | None = None,
+        workers: int = 1,
+        max_resumes: int = Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
+    ) -> tuple[int, dict[str, Any], Iterator] | None:
+        """
+        :calls: `GET /repos/{owner}/{repo}/actions/artifacts/{artifact_id}/{archive_format} <https://docs.github.com/en/rest/actions/artifacts#download-an-artifact>`_
+
+        Download the zip archive of the artifact to the path or return an iterator for the stream.
+
+        :param path: file to download the archive to, returns an iterator for the stream if not given
+        :param chunk_size: size of chunks read from the stream
+        :param progress: callable called with the number of bytes downloaded so far and the total size
+        :param workers: number of parallel Range requests used to download the archive to the path
+        :param max_resumes: number of times a dropped download to the path is resumed with a Range request
+        """
+        if path is None:
+            return self._requester.getStream(self.archive_download_url, chunk_size=chunk_size)
+        self._requester.getFile(
+            self.archive_download_url,
+            path=path,
+            chunk_size=chunk_size,
+            progress=progress,
+            size=self.size_in_bytes if workers > 1 else None,
+            workers=workers,
+            max_resumes=max_resumes,
+        )
+        return None
+
     def _useAttributes(self, attributes: dict[str, Any]) -> None:
         if "archive_download_url" in attributes:  # pragma no branch
             self._archive_download_url = self._makeStringAttribute(attributes["archive_download_url"])
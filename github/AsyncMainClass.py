@@ -0,0 +1,231 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import urllib.parse
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from urllib3.util import Retry
+
+import github.NamedUser
+import github.RateLimitOverview
+from github import Consts
+from github.AsyncPaginatedList import AsyncPaginatedList
+from github.AsyncRequester import AsyncRequester
+from github.GithubObject import (
+    CompletableGithubObject,
+    CompletableGithubObjectWithPaginatedProperty,
+    GithubObject,
+    NotSet,
+    Opt,
+    is_defined,
+)
+from github.MainClass import Github
+from github.PaginatedList import PaginatedList
+
+if TYPE_CHECKING:
+    from github.Auth import Auth
+    from github.AuthenticatedUser import AuthenticatedUser
+    from github.NamedUser import NamedUser
+    from github.Organization import Organization
+    from github.RateLimitOverview import RateLimitOverview
+    from github.RateLimitScheduler import RateLimitScheduler
+    from github.Repository import Repository
+    from github.ResponseCache import ResponseCache
+
+T = TypeVar("T", bound=GithubObject)
+T_completable = TypeVar("T_completable", bound=CompletableGithubObject)
+
+
+class AsyncGithub:
+    """
+    This is the main class you instantiate to access the Github API v3 from an asyncio event loop.
+
+    All requests are sent via an :class:`github.AsyncRequester.AsyncRequester`, which uses a single ``aiohttp``
+    connection pool. Requires the ``aiohttp`` package (``pip install PyGithub[async]``).
+
+    The returned objects are the usual PyGithub classes. Any PyGithub object or paginated list obtained from
+    :attr:`github` does not send requests until used, and can be fetched asynchronously via :meth:`complete` and
+    :meth:`paginate`::
+
+        async with github.AsyncGithub(auth=github.Auth.Token("token")) as gh:
+            repo = await gh.get_repo("PyGithub/PyGithub")
+            async for issue in gh.paginate(repo.get_issues(state="open")):
+                print(issue.title)
+
+            pull = await gh.complete(repo.get_pull(3403))
+
+    Note that accessing attributes that have not been fetched, or calling methods of the returned objects, sends
+    blocking requests.
+
+    """
+
+    default_retry = Github.default_retry
+
+    def __init__(
+        self,
+        auth: Auth | None = None,
+        *,
+        base_url: str = Consts.DEFAULT_BASE_URL,
+        timeout: int = Consts.DEFAULT_TIMEOUT,
+        user_agent: str = Consts.DEFAULT_USER_AGENT,
+        per_page: int = Consts.DEFAULT_PER_PAGE,
+        verify: bool | str = True,
+        retry: int | Retry | None = default_retry,
+        pool_size: int | None = None,
+        seconds_between_requests: float | None = Consts.DEFAULT_SECONDS_BETWEEN_REQUESTS,
+        seconds_between_writes: float | None = Consts.DEFAULT_SECONDS_BETWEEN_WRITES,
+        api_version: str | None = None,
+        response_cache: ResponseCache | None = None,
+        rate_limit_scheduler: RateLimitScheduler | None = None,
+    ) -> None:
+        """
+        :param auth: authentication method
+        :param base_url: string
+        :param timeout: integer
+        :param user_agent: string
+        :param per_page: int
+        :param verify: boolean or string
+        :param retry: int or urllib3.util.retry.Retry object,
+                      defaults to github.AsyncGithub.default_retry,
+                      set to None to disable retries
+        :param pool_size: int, maximum number of concurrent connections, defaults to 100
+        :param seconds_between_requests: float
+        :param seconds_between_writes: float
+        :param api_version: string, GitHub API version to use (see https://docs.github.com/en/rest/about-the-rest-api/api-versions).
+                            Set to None to not specify any version
+        :param response_cache: github.ResponseCache.ResponseCache, caches responses of GET requests and revalidates
+                               them with conditional requests, see :class:`github.ResponseCache.ResponseCache`
+        :param rate_limit_scheduler: github.RateLimitScheduler.RateLimitScheduler, paces requests to spread the
+                                     remaining rate limit, see :class:`github.RateLimitScheduler.RateLimitScheduler`
+        """
+        # objects created by the blocking Github instance do not send requests on creation
+        self.__github = Github(
+            auth=auth,
+            base_url=base_url,
+            timeout=timeout,
+            user_agent=user_agent,
+            per_page=per_page,
+            verify=verify,
+            retry=retry,
+            pool_size=pool_size,
+            seconds_between_requests=seconds_between_requests,
+            seconds_between_writes=seconds_between_writes,
+            lazy=True,
+            api_version=api_version,
+            response_cache=response_cache,
+            rate_limit_scheduler=rate_limit_scheduler,
+        )
+        self.__requester = AsyncRequester(self.__github.requester)
+
+    async def close(self) -> None:
+        """
+        Close connections to the server. Alternatively, use the AsyncGithub object as an asynchronous context manager:
+
+        .. code-block:: python
+
+          async with github.AsyncGithub(...) as gh:
+            # do something
+        """
+        await self.__requester.close()
+        self.__github.close()
+
+    async def __aenter__(self) -> AsyncGithub:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    @property
+    def requester(self) -> AsyncRequester:
+        """
+        Return my AsyncRequester object.
+
+        For example, to make requests to API endpoints not yet supported by PyGitHub.
+
+        """
+        return self.__requester
+
+    @property
+    def github(self) -> Github:
+        """
+        A lazy :class:`github.MainClass.Github` instance with identical configuration. Objects and lists obtained
+        from this instance do not send requests on creation.
+        """
+        return self.__github
+
+    async def complete(self, obj: T_completable) -> T_completable:
+        """
+        Fetch all attributes of the given object, unless it is already completed.
+
+        :param obj: a completable PyGithub object, e.g. obtained from :attr:`github`
+        :return: the given object
+
+        """
+        if not obj.completed:
+            parameters = None
+            if isinstance(obj, CompletableGithubObjectWithPaginatedProperty):
+                parameters = obj._pagination_parameters
+            headers, data = await self.__requester.requestJsonAndCheck(
+                "GET", obj._url.value, parameters=parameters, headers=obj._completeHeaders
+            )
+            obj._storeAndUseAttributes(headers, data)
+            obj._set_complete()
+        return obj
+
+    def paginate(self, paginated_list: PaginatedList[T]) -> AsyncPaginatedList[T]:
+        """
+        Iterate the given paginated list asynchronously.
+
+        :param paginated_list: a REST API paginated list, e.g. obtained from :attr:`github`
+        :return: asynchronous paginated list
+
+        """
+        return paginated_list.withAsyncRequester(self.__requester)
+
+    async def get_rate_limit(self) -> RateLimitOverview:
+        """
+        :calls: `GET /rate_limit <https://docs.github.com/en/rest/reference/rate-limit>`_
+        """
+        return await self.__requester.requestClass(github.RateLimitOverview.RateLimitOverview, "/rate_limit")
+
+    async def get_user(self, login: Opt[str] = NotSet) -> NamedUser | AuthenticatedUser:
+        """
+        :calls: `GET /users/{user} <https://docs.github.com/en/rest/reference/users>`_ or `GET /user <https://docs.github.com/en/rest/reference/users>`_
+        """
+        if is_defined(login):
+            assert isinstance(login, str), login
+            login = urllib.parse.quote(login)
+            return await self.complete(github.NamedUser.NamedUser(self.__github.requester, url=f"/users/{login}"))
+        return await self.complete(self.__github.get_user())
+
+    async def get_organization(self, org: str) -> Organization:
+        """
+        :calls: `GET /orgs/{org} <https://docs.github.com/en/rest/reference/orgs>`_
+        """
+        return await self.complete(self.__github.get_organization(org))
+
+    async def get_repo(self, full_name_or_id: int | str) -> Repository:
+        """
+        :calls: `GET /repos/{owner}/{repo} <https://docs.github.com/en/rest/reference/repos>`_ or `GET /repositories/{repository_id} <https://docs.github.com/en/rest/reference/repos>`_
+        """
+        return await self.complete(self.__github.get_repo(full_name_or_id))
@@ -0,0 +1,157 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any, Generic, TypeVar
+
+from github import Consts
+from github.AsyncRequester import AsyncRequester
+from github.GithubObject import GithubObject
+from github.PaginatedList import PaginatedList
+from github.Requester import Requester
+
+T = TypeVar("T", bound=GithubObject)
+
+
+class AsyncPaginatedList(Generic[T]):
+    """
+    This class abstracts the `pagination of the REST API <https://docs.github.com/en/rest/guides/traversing-with-pagination>`_
+    for the :class:`github.AsyncRequester.AsyncRequester`, with the semantics of :class:`github.PaginatedList.PaginatedList`.
+
+    You can asynchronously enumerate through instances of this class::
+
+        async for issue in gh.paginate(repo.get_issues()):
+            print(issue.title)
+
+    Elements are fetched in pages, fetched pages are kept, so iterating the list again does not send requests.
+
+    """
+
+    def __init__(
+        self,
+        contentClass: type[T],
+        requester: AsyncRequester,
+        firstUrl: str,
+        firstParams: dict[str, Any] | None = None,
+        *,
+        headers: dict[str, str] | None = None,
+        list_item: str = "items",
+        total_count_item: str = "total_count",
+        attributesTransformer: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ):
+        firstParams = dict(firstParams) if firstParams else {}
+        # we add the per_page parameter if that value is not the default
+        # but only if there is no per_page parameter in the firstParams
+        if "per_page" not in firstParams and requester.per_page != Consts.DEFAULT_PER_PAGE:
+            firstParams["per_page"] = requester.per_page
+
+        self.__contentClass = contentClass
+        self.__requester = requester
+        self.__firstUrl = firstUrl
+        self.__firstParams = firstParams
+        self.__nextUrl: str | None = firstUrl
+        self.__nextParams: dict[str, Any] = firstParams
+        self.__headers = headers
+        self.__list_item = list_item
+        self.__total_count_item = total_count_item
+        self.__attributesTransformer = attributesTransformer
+        self.__elements: list[T] = []
+        self.__totalCount: int | None = None
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.__iterate()
+
+    async def __iterate(self) -> AsyncIterator[T]:
+        for element in list(self.__elements):
+            yield element
+        while self.__nextUrl is not None:
+            newElements = await self.__fetchNextPage()
+            self.__elements += newElements
+            for element in newElements:
+                yield element
+
+    async def totalCount(self) -> int:
+        """
+        The number of elements of this list, fetches the first element to determine it if needed.
+        """
+        if self.__totalCount is None:
+            params = dict(self.__firstParams)
+            # set per_page = 1 so the totalCount is just the number of pages
+            params["per_page"] = 1
+            headers, data = await self.__requester.requestJsonAndCheck(
+                "GET", self.__firstUrl, parameters=params, headers=self.__headers
+            )
+            lastUrl = PaginatedList.parse_link_header(headers).get("last")
+            if lastUrl:
+                self.__totalCount = int(self.__parameterOfUrl(lastUrl, "page") or 0)
+            elif data and isinstance(data, dict) and self.__total_count_item in data:
+                self.__totalCount = data[self.__total_count_item]
+            elif data:
+                self.__totalCount = len(data[self.__list_item] if isinstance(data, dict) else data)
+            else:
+                self.__totalCount = 0
+        return self.__totalCount
+
+    async def get_page(self, page: int) -> list[T]:
+        """
+        Fetches the page with the given zero-based index.
+        """
+        params = dict(self.__firstParams)
+        if page != 0:
+            params["page"] = page + 1
+        headers, data = await self.__requester.requestJsonAndCheck(
+            "GET", self.__firstUrl, parameters=params, headers=self.__headers
+        )
+        return self.__elementsOfPage(headers, data)
+
+    async def __fetchNextPage(self) -> list[T]:
+        assert self.__nextUrl is not None
+        headers, data = await self.__requester.requestJsonAndCheck(
+            "GET", self.__nextUrl, parameters=self.__nextParams, headers=self.__headers
+        )
+        data = data if data else []
+        self.__nextUrl = None
+        if len(data) > 0:
+            self.__nextUrl = PaginatedList.parse_link_header(headers).get("next")
+        self.__nextParams = {}
+        return self.__elementsOfPage(headers, data)
+
+    def __elementsOfPage(self, headers: dict[str, Any], data: Any) -> list[T]:
+        if isinstance(data, dict) and self.__list_item in data:
+            self.__totalCount = data.get(self.__total_count_item)
+            data = data[self.__list_item]
+        return [
+            self.__contentClass(self.__requester.requester, headers, self.__transformAttributes(element))
+            for element in data
+            if element is not None
+        ]
+
+    def __transformAttributes(self, element: dict[str, Any]) -> dict[str, Any]:
+        if self.__attributesTransformer is None:
+            return element
+        return self.__attributesTransformer(element)
+
+    @staticmethod
+    def __parameterOfUrl(url: str, parameter: str) -> str | None:
+        values = Requester.get_parameters_of_url(url).get(parameter)
+        return values[0] if values else None
@@ -0,0 +1,396 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import ssl
+import urllib.parse
+from typing import TYPE_CHECKING, Any
+
+from urllib3 import Retry
+from urllib3.response import HTTPResponse
+
+import github.GithubException as GithubException
+from github import Consts
+from github.Requester import Requester
+from github.ResponseCache import CachedResponse
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from github.GithubObject import GithubObject
+    from github.RateLimitScheduler import RateLimitScheduler
+
+
+class AsyncRequester:
+    """
+    Sends requests to the GitHub API from an asyncio event loop.
+
+    All requests are sent through a single ``aiohttp`` connection pool, so many concurrent API calls run on one event
+    loop without a thread per call. Requires the ``aiohttp`` package (``pip install PyGithub[async]``).
+
+    Configuration (authentication, base url, timeout, user agent, verify, retry, pool size and API version) is taken
+    from the given :class:`github.Requester.Requester`. PyGithub objects returned via this requester use that
+    requester to complete themselves, which is a blocking call.
+
+    Requests are paced by the ``seconds_between_requests`` and ``seconds_between_writes`` settings, the rate limit
+    scheduler and the response cache of the given requester, which are shared with its blocking requests. Waiting
+    happens via ``asyncio.sleep``. Calls into the authentication, the rate limit scheduler and the response cache may
+    block (e.g. refreshing an installation token or locking a state file), so they run in a worker thread via
+    ``asyncio.to_thread``.
+
+    Failed requests are retried following the rules of the configured retry (e.g. :class:`github.GithubRetry`), with
+    backoff happening via ``asyncio.sleep``. GET requests answered with ``202 Accepted`` are retried
+    ``processing_202_retries`` times like blocking requests, after which ``requestJsonAndCheck`` raises a
+    :class:`github.GithubException.GithubException`.
+
+    """
+
+    def __init__(self, requester: Requester):
+        assert isinstance(requester, Requester), requester
+        self.__requester = requester
+        kwargs = requester.kwargs
+        self.__timeout = kwargs["timeout"]
+        self.__userAgent = kwargs["user_agent"]
+        self.__verify = kwargs["verify"]
+        self.__pool_size = kwargs["pool_size"]
+        self.__apiVersion = kwargs["api_version"]
+        self.__processing_202_retries = kwargs["processing_202_retries"]
+        self.__pacer = requester.pacer
+        self.__rate_limit_scheduler = requester.rate_limit_scheduler
+        self.__response_cache = requester.response_cache
+        self.__graphql_path = urllib.parse.urlparse(requester.graphql_url).path
+        self.__json = requester.json_backend
+        retry = kwargs["retry"]
+        self.__retry: Retry | None = Retry.from_int(retry) if isinstance(retry, int) else retry
+        self.__session: aiohttp.ClientSession | None = None
+        self.rate_limiting = (-1, -1)
+        self.rate_limiting_resettime = 0
+        self.oauth_scopes: list[str] | None = None
+
+    @property
+    def requester(self) -> Requester:
+        """
+        The blocking requester this requester takes its configuration from.
+        """
+        return self.__requester
+
+    @property
+    def per_page(self) -> int:
+        return self.__requester.per_page
+
+    @property
+    def is_not_lazy(self) -> bool:
+        return self.__requester.is_not_lazy
+
+    async def close(self) -> None:
+        """
+        Close the connection pool.
+        """
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    def __getSession(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            try:
+                import aiohttp
+            except ImportError as e:  # pragma no cover (aiohttp installed in tests)
+                raise ImportError("AsyncRequester requires the aiohttp package: pip install PyGithub[async]") from e
+
+            ssl_context: ssl.SSLContext | bool = True
+            if self.__verify is False:
+                ssl_context = False
+            elif isinstance(self.__verify, str):
+                ssl_context = ssl.create_default_context(cafile=self.__verify)
+
+            connector = aiohttp.TCPConnector(limit=self.__pool_size or 100, ssl=ssl_context)
+            self.__session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.__timeout),
+                # authentication is added per request
+                auth=None,
+            )
+        return self.__session
+
+    def __makeAbsoluteUrl(self, url: str) -> str:
+        # URLs generated locally are relative to base_url
+        # URLs returned from the server must be on the same host, so we do not leak authentication
+        if url.startswith("/"):
+            return f"{self.__requester.base_url.rstrip('/')}{url}"
+        o = urllib.parse.urlparse(url)
+        if o.hostname != self.__requester.hostname:
+            raise RuntimeError(f"Requesting {url} is not allowed, host must be {self.__requester.hostname}")
+        return url
+
+    async def requestJsonAndCheck(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        input: Any | None = None,
+    ) -> tuple[dict[str, Any], Any]:
+        """
+        Send a request with JSON body.
+
+        :param input: request body, serialized to JSON if specified
+
+        :return: ``(headers: dict, JSON Response: Any)``, the response is ``None`` while a GET request is still
+            computed (status 202) and ``processing_202_retries`` is 0
+        :raises: :class:`GithubException` for error status codes, and for status 202 after
+            ``processing_202_retries`` retries
+
+        """
+        status, responseHeaders, output = await self.__requestJson(verb, url, parameters, headers, input)
+        data = self.__structuredFromJson(output)
+        if status >= 400:
+            raise Requester.createException(status, responseHeaders, data)
+        if status == 202 and verb in ["GET", "HEAD"]:
+            if self.__processing_202_retries > 0:
+                raise Requester.createProcessing202Exception(
+                    status, responseHeaders, data, self.__processing_202_retries
+                )
+            return responseHeaders, None
+        # make GET url available as "url" attribute
+        if verb == "GET" and isinstance(data, dict) and "url" not in data:
+            data["url"] = url
+        return responseHeaders, data
+
+    async def requestJson(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        input: Any | None = None,
+    ) -> tuple[int, dict[str, Any], str]:
+        """
+        Send a request with JSON input.
+
+        :param input: request body, will be serialized as JSON
+        :returns:``(status, headers, body)``
+
+        """
+        status, responseHeaders, output = await self.__requestJson(verb, url, parameters, headers, input)
+        return status, responseHeaders, output.decode("utf-8", errors="replace")
+
+    async def __requestJson(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        input: Any | None,
+    ) -> tuple[int, dict[str, Any], bytes]:
+        # the body is returned undecoded, so the JSON backend parses the bytes read from the connection
+        assert verb in ["HEAD", "GET", "POST", "PATCH", "PUT", "DELETE"]
+        requestHeaders = dict(headers) if headers else {}
+        auth = self.__requester.auth
+        if auth is not None:
+            # may request a new token from GitHub
+            await asyncio.to_thread(auth.authentication, requestHeaders)
+        requestHeaders["User-Agent"] = self.__userAgent
+        if self.__apiVersion is not None:
+            requestHeaders[Consts.headerApiVersion] = self.__apiVersion
+
+        url = Requester.add_parameters_to_url(self.__makeAbsoluteUrl(url), parameters or {})
+
+        body = None
+        if input is not None:
+            requestHeaders["Content-Type"] = "application/json"
+            body = self.__json.dumps(input)
+
+        # requests with conditional headers given by the caller bypass the cache, they expect to see a 304 response
+        cache_key: str | None = None
+        cached: CachedResponse | None = None
+        if (
+            self.__response_cache is not None
+            and verb == "GET"
+            and Consts.REQ_IF_NONE_MATCH not in requestHeaders
+            and Consts.REQ_IF_MODIFIED_SINCE not in requestHeaders
+        ):
+            o = urllib.parse.urlparse(url)
+            path = f"{o.path}?{o.query}" if o.query else o.path
+            cache_key = self.__requester.responseCacheKey(path, requestHeaders, o.hostname, o.port)
+            cached = await asyncio.to_thread(self.__response_cache.get, cache_key)
+            if cached is not None:
+                if cached.etag is not None:
+                    requestHeaders[Consts.REQ_IF_NONE_MATCH] = cached.etag
+                elif cached.last_modified is not None:
+                    requestHeaders[Consts.REQ_IF_MODIFIED_SINCE] = cached.last_modified
+
+        status, responseHeaders, output = await self.__requestRaw(verb, url, requestHeaders, body, self.__retry)
+
+        if cache_key is not None:
+            assert self.__response_cache is not None
+            if status == 304 and cached is not None:
+                # the 304 response carries current rate limit headers, everything else comes from the cache
+                status, responseHeaders = cached.status, {**cached.headers, **responseHeaders}
+                output = cached.body.encode("utf-8")
+            elif status == 200 and (Consts.RES_ETAG in responseHeaders or Consts.RES_LAST_MODIFIED in responseHeaders):
+                await asyncio.to_thread(
+                    self.__response_cache.set,
+                    cache_key,
+                    CachedResponse(status, responseHeaders, output.decode("utf-8", errors="replace")),
+                )
+
+        if Consts.headerRateRemaining in responseHeaders and Consts.headerRateLimit in responseHeaders:
+            self.rate_limiting = (
+                int(float(responseHeaders[Consts.headerRateRemaining])),
+                int(float(responseHeaders[Consts.headerRateLimit])),
+            )
+        if Consts.headerRateReset in responseHeaders:
+            self.rate_limiting_resettime = int(float(responseHeaders[Consts.headerRateReset]))
+        if Consts.headerOAuthScopes in responseHeaders:
+            self.oauth_scopes = responseHeaders[Consts.headerOAuthScopes].split(", ")
+
+        return status, responseHeaders, output
+
+    async def __requestRaw(
+        self,
+        verb: str,
+        url: str,
+        requestHeaders: dict[str, str],
+        body: str | None,
+        retry: Retry | None,
+        processing_202_retry: int = 0,
+    ) -> tuple[int, dict[str, Any], bytes]:
+        import aiohttp
+
+        resource = None
+        if self.__rate_limit_scheduler is not None:
+            resource = self.__rate_limit_scheduler.resource(url, self.__graphql_path)
+            await self.__awaitRateLimitBudget(self.__rate_limit_scheduler, resource)
+        await self.__deferRequest(verb)
+
+        try:
+            try:
+                async with self.__getSession().request(verb, url, headers=requestHeaders, data=body) as response:
+                    status = response.status
+                    responseHeaders = {k.lower(): v for k, v in response.headers.items()}
+                    output = await response.read()
+                    reason = response.reason
+            finally:
+                # the next requests are paced from the end of this request, not its start
+                self.__pacer.release(verb)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            # like urllib3, a request that may have reached the server is only resent if its method is idempotent,
+            # a request that failed to connect is always resent
+            if retry is None or not (isinstance(e, aiohttp.ClientConnectorError) or retry._is_method_retryable(verb)):
+                raise
+            # raises MaxRetryError when retries are exhausted
+            retry = retry.increment(verb, url, error=e)
+            await asyncio.sleep(retry.get_backoff_time())
+            return await self.__requestRaw(verb, url, requestHeaders, body, retry, processing_202_retry)
+
+        if self.__rate_limit_scheduler is not None and resource is not None:
+            await asyncio.to_thread(self.__rate_limit_scheduler.update, resource, responseHeaders)
+
+        self.__log(verb, url, status, responseHeaders)
+
+        if status == 202 and verb in ["GET", "HEAD"] and processing_202_retry < self.__processing_202_retries:
+            await asyncio.sleep(
+                min(Consts.PROCESSING_202_WAIT_TIME * 2**processing_202_retry, Consts.PROCESSING_202_MAX_WAIT_TIME)
+            )
+            return await self.__requestRaw(verb, url, requestHeaders, body, retry, processing_202_retry + 1)
+
+        if retry is not None and retry.is_retry(verb, status, "retry-after" in responseHeaders):
+            # let the retry inspect the response the way urllib3 does for blocking requests
+            urllib3_response = HTTPResponse(
+                body=io.BytesIO(output),
+                headers=responseHeaders,
+                status=status,
+                reason=reason,
+                preload_content=False,
+            )
+            # raises MaxRetryError or GithubException when the response should not be retried
+            retry = retry.increment(verb, url, response=urllib3_response)
+            backoff = retry.get_retry_after(urllib3_response) if retry.respect_retry_after_header else None
+            await asyncio.sleep(backoff if backoff is not None else retry.get_backoff_time())
+            return await self.__requestRaw(verb, url, requestHeaders, body, retry, processing_202_retry)
+
+        return status, responseHeaders, output
+
+    async def __deferRequest(self, verb: str) -> None:
+        # Waits for the next slot of the pacer, shared with the blocking requests of the requester
+        defer = self.__pacer.reserve(verb)
+        if defer > 0:
+            logging.getLogger(__name__).debug(f"sleeping {defer}s before next GitHub request")
+            await asyncio.sleep(defer)
+
+    async def __awaitRateLimitBudget(self, scheduler: RateLimitScheduler, resource: str) -> None:
+        # Waits until the scheduler grants a request of the given resource
+        defer = await asyncio.to_thread(scheduler.acquire, resource)
+        if defer > 0:
+            logging.getLogger(__name__).debug(
+                f"sleeping {defer}s before next GitHub request to spread {resource} rate limit"
+            )
+            await asyncio.sleep(defer)
+
+    def __structuredFromJson(self, data: bytes) -> Any:
+        if len(data) == 0:
+            return None
+        try:
+            return self.__json.loads(data)
+        except ValueError:
+            text = data.decode("utf-8", errors="replace")
+            if text.startswith("{") or text.startswith("["):
+                raise
+            return {"data": text}
+
+    async def graphql_query(self, query: str, variables: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Queries the GraphQL API.
+
+        :param query: GraphQL query
+        :param variables: GraphQL variables
+        :return: ``(headers: dict, JSON Response: dict)``
+        :raises: :class:`GithubException` for error status codes
+
+        """
+        input_ = {"query": query, "variables": variables}
+
+        response_headers, data = await self.requestJsonAndCheck("POST", self.__requester.graphql_url, input=input_)
+        if "errors" in data:
+            if len(data["errors"]) == 1:
+                error = data["errors"][0]
+                if error.get("type") == "NOT_FOUND":
+                    raise GithubException.UnknownObjectException(404, data, response_headers, error.get("message"))
+            raise Requester.createException(400, response_headers, data)
+        return response_headers, data
+
+    async def requestClass(
+        self, klass: type[GithubObject], url: str, parameters: dict[str, Any] | None = None, **kwargs: Any
+    ) -> Any:
+        """
+        GET the given url and return an instance of the PyGithub class populated with the response.
+        """
+        headers, data = await self.requestJsonAndCheck("GET", url, parameters)
+        return klass(self.__requester, headers, data, **kwargs)
+
+    def __log(self, verb: str, url: str, status: int, responseHeaders: dict[str, Any]) -> None:
+        logger = logging.getLogger(__name__)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s ==> %i %s", verb, url, status, responseHeaders)
@@ -32,6 +32,7 @@ from __future__ import annotations
 
 import abc
 import base64
+import threading
 import time
 from abc import ABC
 from collections.abc import Callable
@@ -42,7 +43,9 @@ import jwt
 from requests import utils
 
 from github import Consts
+from github.Concurrency import LockPicklingMixin
 from github.InstallationAuthorization import InstallationAuthorization
+from github.InstallationTokenCache import InstallationTokenCache
 from github.Requester import Requester, WithRequester
 
 if TYPE_CHECKING:
@@ -203,14 +206,20 @@ class JwtSigner:
         return jwt.encode(payload, key=private_key, algorithm=self._jwt_algorithm)
 
 
-class AppAuth(JWT):
+class AppAuth(JWT, LockPicklingMixin):
     """
     This class is used to authenticate as a GitHub App.
 
+    The signed JWT returned by ``token`` is cached and reused until ``jwt_refresh_threshold`` seconds before it
+    expires, so that requests do not each require a signature.
+
     https://docs.github.com/en/apps/creating-github-apps/authenticating-with-a-github-app/authenticating-as-a-github-app
 
     """
 
+    _locks = ("_AppAuth__jwt_lock",)
+    _lock_factory = threading.RLock
+
     @staticmethod
     def create_jwt_sign(private_key_or_func: str | PrivateKeyGenerator, jwt_algorithm: str) -> DictSignFunction:
         return JwtSigner(private_key_or_func, jwt_algorithm).jwt_sign
@@ -224,6 +233,7 @@ class AppAuth(JWT):
         sign_func: DictSignFunction | None = None,
         jwt_expiry: int = Consts.DEFAULT_JWT_EXPIRY,
         jwt_issued_at: int = Consts.DEFAULT_JWT_ISSUED_AT,
+        jwt_refresh_threshold: int = Consts.DEFAULT_JWT_REFRESH_THRESHOLD,
     ):
         assert isinstance(app_id, (int, str)), app_id
         if isinstance(app_id, str):
@@ -237,11 +247,18 @@ class AppAuth(JWT):
             sign_func = AppAuth.create_jwt_sign(private_key, Consts.DEFAULT_JWT_ALGORITHM)
         assert isinstance(jwt_expiry, int), jwt_expiry
         assert Consts.MIN_JWT_EXPIRY <= jwt_expiry <= Consts.MAX_JWT_EXPIRY, jwt_expiry
+        assert isinstance(jwt_refresh_threshold, int), jwt_refresh_threshold
+        assert jwt_refresh_threshold >= 0, jwt_refresh_threshold
 
         self._app_id = str(app_id)
         self._sign_func = sign_func
         self._jwt_expiry = jwt_expiry
         self._jwt_issued_at = jwt_issued_at
+        self._jwt_refresh_threshold = jwt_refresh_threshold
+        self.__jwt: str | None = None
+        self.__jwt_expires_at = 0
+        self.__jwt_lock = threading.RLock()
+        self.__signature_count = 0
 
     @property
     def app_id(self) -> int | str:
@@ -249,13 +266,24 @@ class AppAuth(JWT):
 
     @property
     def token(self) -> str:
-        return self.create_jwt()
+        with self.__jwt_lock:
+            if self.__jwt is None or time.time() >= self.__jwt_expires_at - self._jwt_refresh_threshold:
+                self.__jwt, self.__jwt_expires_at = self.__sign_jwt(self._jwt_expiry)
+            return self.__jwt
+
+    @property
+    def signature_count(self) -> int:
+        """
+        :return: number of JWTs signed by this instance so far
+        """
+        return self.__signature_count
 
     def get_installation_auth(
         self,
         installation_id: int,
         token_permissions: dict[str, str] | None = None,
         requester: Requester | None = None,
+        token_cache: InstallationTokenCache | None = None,
     ) -> AppInstallationAuth:
         """
         Creates a github.Auth.AppInstallationAuth instance for an installation.
@@ -263,34 +291,44 @@ class AppAuth(JWT):
         :param installation_id: installation id
         :param token_permissions: optional permissions
         :param requester: optional requester with app authentication
+        :param token_cache: optional cache to share access tokens with other instances
         :return:
 
         """
-        return AppInstallationAuth(self, installation_id, token_permissions, requester)
+        return AppInstallationAuth(self, installation_id, token_permissions, requester, token_cache)
 
     def create_jwt(self, expiration: int | None = None) -> str:
         """
         Create a signed JWT
         https://docs.github.com/en/developers/apps/building-github-apps/authenticating-with-github-apps#authenticating-as-a-github-app
 
+        This always signs a new JWT, use ``token`` to get a cached JWT.
+
         :return string: jwt
         """
         if expiration is not None:
             assert isinstance(expiration, int), expiration
             assert Consts.MIN_JWT_EXPIRY <= expiration <= Consts.MAX_JWT_EXPIRY, expiration
 
+        token, _ = self.__sign_jwt(expiration if expiration is not None else self._jwt_expiry)
+        return token
+
+    def __sign_jwt(self, expiration: int) -> tuple[str, int]:
         now = int(time.time())
+        expires_at = now + expiration
         payload = {
             "iat": now + self._jwt_issued_at,
-            "exp": now + (expiration if expiration is not None else self._jwt_expiry),
+            "exp": expires_at,
             "iss": self._app_id,
         }
         assert self._sign_func is not None
         encrypted = self._sign_func(payload)
+        with self.__jwt_lock:
+            self.__signature_count += 1
 
         if isinstance(encrypted, bytes):
-            return encrypted.decode("utf-8")
-        return encrypted
+            encrypted = encrypted.decode("utf-8")
+        return encrypted, expires_at
 
 
 class AppAuthToken(JWT):
@@ -317,6 +355,10 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
 
     https://docs.github.com/en/apps/creating-github-apps/authenticating-with-a-github-app/authenticating-as-a-github-app-installation
 
+    Given a :class:`github.InstallationTokenCache.InstallationTokenCache`, access tokens are shared between all
+    instances of the same app, base url, installation and permissions that use that cache. By default, each instance
+    creates its own access token.
+
     """
 
     # used to fetch live access token when calling self.token
@@ -329,6 +371,7 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
         installation_id: int,
         token_permissions: dict[str, str] | None = None,
         requester: Requester | None = None,
+        token_cache: InstallationTokenCache | None = None,
     ):
         super().__init__()
 
@@ -336,10 +379,12 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
         assert isinstance(installation_id, int), installation_id
         assert token_permissions is None or isinstance(token_permissions, dict), token_permissions
         assert requester is None or isinstance(requester, Requester), requester
+        assert token_cache is None or isinstance(token_cache, InstallationTokenCache), token_cache
 
         self._app_auth = app_auth
         self._installation_id = installation_id
         self._token_permissions = token_permissions
+        self._token_cache = token_cache
 
         if requester is not None:
             self.withRequester(requester)
@@ -371,18 +416,43 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
     def token_type(self) -> str:
         return "token"
 
+    @property
+    def token_cache(self) -> InstallationTokenCache | None:
+        return self._token_cache
+
     @property
     def token(self) -> str:
         if self.__installation_authorization is None or self._is_expired:
-            self.__installation_authorization = self._get_installation_authorization()
+            if self._token_cache is None:
+                self.__installation_authorization = self._get_installation_authorization()
+            else:
+                self.__installation_authorization = self._get_cached_installation_authorization(self._token_cache)
         return self.__installation_authorization.token
 
     @property
     def _is_expired(self) -> bool:
         assert self.__installation_authorization is not None
-        token_expires_at = self.__installation_authorization.expires_at - TOKEN_REFRESH_THRESHOLD_TIMEDELTA
+        return self.__is_expired(self.__installation_authorization)
+
+    @staticmethod
+    def __is_expired(installation_authorization: InstallationAuthorization) -> bool:
+        token_expires_at = installation_authorization.expires_at - TOKEN_REFRESH_THRESHOLD_TIMEDELTA
         return token_expires_at < datetime.now(timezone.utc)
 
+    def _get_cached_installation_authorization(self, cache: InstallationTokenCache) -> InstallationAuthorization:
+        assert self.__integration is not None, "Method withRequester(Requester) must be called first"
+        key = cache.key(self.app_id, self.requester.base_url, self._installation_id, self._token_permissions)
+        # only one caller creates a new access token, all others wait and then read that token from the cache
+        with cache.lock(key):
+            attributes = cache.get(key)
+            if attributes is not None:
+                installation_authorization = InstallationAuthorization(self.requester, {}, attributes)
+                if not self.__is_expired(installation_authorization):
+                    return installation_authorization
+            installation_authorization = self._get_installation_authorization()
+            cache.set(key, installation_authorization.raw_data)
+            return installation_authorization
+
     def _get_installation_authorization(self) -> InstallationAuthorization:
         assert self.__integration is not None, "Method withRequester(Requester) must be called first"
         return self.__integration.get_access_token(
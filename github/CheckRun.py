@@ -86,6 +86,9 @@ class CheckRun(CompletableGithubObject):
 
     """
 
+    # the url of the check suite is derived from the url of the check run
+    _supports_lazy_attributes = False
+
     def _initAttributes(self) -> None:
         self._app: Attribute[GithubApp] = NotSet
         self._check_suite: Attribute[CheckSuite] = NotSet
@@ -0,0 +1,69 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import IO, Any, ClassVar
+
+
+class LockPicklingMixin:
+    """
+    Mixin for classes that guard their state with locks, which are not picklable.
+
+    The lock attributes named by ``_locks``, e.g. ``"_MemoryResponseCache__lock"``, are left out when the object is
+    pickled, and new locks are created by ``_lock_factory``, e.g. ``threading.RLock``, when it is unpickled.
+
+    """
+
+    _locks: tuple[str, ...] = ()
+    _lock_factory: ClassVar[Callable[[], Any]] = threading.Lock
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self._locks:
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        for name in self._locks:
+            setattr(self, name, type(self)._lock_factory())
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "wb", encoding: str | None = None) -> Iterator[IO[Any]]:
+    """
+    Opens a temporary file next to ``path`` for writing, which replaces ``path`` once the block exits without an
+    exception, so that readers never see a partially written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or None, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
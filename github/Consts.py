@@ -60,6 +60,10 @@ from __future__ import annotations
 REQ_IF_NONE_MATCH = "If-None-Match"
 REQ_IF_MODIFIED_SINCE = "If-Modified-Since"
 PROCESSING_202_WAIT_TIME = 2
+# the wait time doubles with every retry of a 202 response, up to this number of seconds
+PROCESSING_202_MAX_WAIT_TIME = 60
+# number of retries of GET requests while the response is 202, after which a GithubException is raised
+DEFAULT_PROCESSING_202_RETRIES = 10
 
 # ##############################################################################
 # Response Header                                                              #
@@ -67,6 +71,7 @@ PROCESSING_202_WAIT_TIME = 2
 # ##############################################################################
 RES_ETAG = "etag"
 RES_LAST_MODIFIED = "last-modified"
+RES_X_POLL_INTERVAL = "x-poll-interval"
 
 # Inspired by https://github.com/google/go-github
 
@@ -75,6 +80,7 @@ RES_LAST_MODIFIED = "last-modified"
 headerRateLimit = "x-ratelimit-limit"
 headerRateRemaining = "x-ratelimit-remaining"
 headerRateReset = "x-ratelimit-reset"
+headerRateResource = "x-ratelimit-resource"
 headerOAuthScopes = "x-oauth-scopes"
 headerOTP = "x-github-otp"
 
@@ -184,6 +190,8 @@ MAX_JWT_EXPIRY = 600
 # https://docs.github.com/en/developers/apps/building-github-apps/authenticating-with-github-apps#generating-a-json-web-token-jwt
 # "The time the JWT was created. To protect against clock drift, we recommend you set this 60 seconds in the past."
 DEFAULT_JWT_ISSUED_AT = -60
+# A cached JWT is re-signed this many seconds before it expires.
+DEFAULT_JWT_REFRESH_THRESHOLD = 30
 # https://docs.github.com/en/apps/creating-github-apps/authenticating-with-a-github-app/generating-a-json-web-token-jwt-for-a-github-app
 # "Your JWT must be signed using the RS256 algorithm"
 DEFAULT_JWT_ALGORITHM = "RS256"
@@ -191,3 +199,48 @@ DEFAULT_JWT_ALGORITHM = "RS256"
 # https://docs.github.com/en/rest/guides/best-practices-for-integrators?apiVersion=2022-11-28#dealing-with-secondary-rate-limits
 DEFAULT_SECONDS_BETWEEN_REQUESTS = 0.25
 DEFAULT_SECONDS_BETWEEN_WRITES = 1.0
+
+# number of pages fetched at the same time by PaginatedList.prefetch
+DEFAULT_PREFETCH_WORKERS = 8
+
+# size of chunks read from streamed downloads and written to files
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# number of times a dropped download is resumed via a Range request
+DEFAULT_DOWNLOAD_MAX_RESUMES = 3
+# size of chunks read from uploaded files and iterables
+DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024
+# number of release assets uploaded at the same time
+DEFAULT_UPLOAD_WORKERS = 4
+
+# maximum number of ids of a GraphQL nodes(ids: ...) query
+MAX_GRAPHQL_NODES = 100
+# https://docs.github.com/en/graphql/overview/rate-limits-and-node-limits-for-the-graphql-api#node-limit
+# "Individual calls cannot request more than 500,000 total nodes"
+MAX_GRAPHQL_QUERY_NODES = 500_000
+# number of queries merged into a single GraphQL request by GraphQlBatcher
+DEFAULT_GRAPHQL_BATCH_SIZE = 50
+# number of GraphQL query documents kept by a GraphQlQueryRegistry
+DEFAULT_GRAPHQL_QUERY_REGISTRY_SIZE = 1024
+# number of objects completed at the same time by CompletableGithubObject.complete_all
+DEFAULT_COMPLETE_WORKERS = 8
+# number of elements mapped at the same time by PaginatedList.map_concurrent
+DEFAULT_MAP_WORKERS = 8
+
+# https://docs.github.com/en/rest/search/search#about-search
+# "the REST API provides up to 1,000 results for each search"
+MAX_SEARCH_RESULTS = 1000
+MAX_PER_PAGE = 100
+# number of search shards counted or fetched at the same time by ShardedSearch
+DEFAULT_SEARCH_SHARD_WORKERS = 4
+# number of repositories synchronized at the same time by RepositorySync.sync_all
+DEFAULT_SYNC_WORKERS = 8
+# seconds between polls of event feeds when the response has no X-Poll-Interval header
+DEFAULT_POLL_INTERVAL = 60
+# number of most recent event ids an EventFeed remembers to detect events seen before
+DEFAULT_POLL_SEEN_SIZE = 1000
+# number of statistics requests sent at the same time by StatsPoller
+DEFAULT_STATS_WORKERS = 8
+# number of blobs fetched at the same time by TreeSnapshot
+DEFAULT_SNAPSHOT_WORKERS = 8
+# number of blobs missing from the blob cache above which TreeSnapshot downloads the tarball of the ref instead
+DEFAULT_SNAPSHOT_ARCHIVE_THRESHOLD = 100
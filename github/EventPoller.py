@@ -0,0 +1,280 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import github.PaginatedList
+from github import Consts
+
+if TYPE_CHECKING:
+    from github.GithubObject import GithubObject
+    from github.Requester import Requester
+
+T = TypeVar("T", bound="GithubObject")
+
+
+class EventFeed(Generic[T]):
+    """
+    This class polls a list of events or notifications for elements that have not been seen before.
+
+    Each poll sends a conditional request of the first page with the ``ETag`` of the previous poll. Unchanged feeds
+    respond with ``304 Not Modified``, which does not count against the rate limit. Otherwise, pages are fetched until
+    an element seen before is reached. The first poll returns the first page only.
+
+    GitHub tells the number of seconds to wait between polls in the ``X-Poll-Interval`` header, which is available as
+    :attr:`poll_interval`, and :attr:`next_poll` is the :func:`time.monotonic` time when the feed should be polled
+    next. Use an :class:`EventPoller` to poll many feeds when they are due.
+
+    Events are identified by their id, notifications by their id and ``updated_at``, so that updated notification
+    threads are returned again.
+
+    """
+
+    def __init__(
+        self,
+        contentClass: type[T],
+        requester: Requester,
+        url: str,
+        parameters: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        seen_size: int = Consts.DEFAULT_POLL_SEEN_SIZE,
+    ):
+        assert isinstance(seen_size, int) and seen_size > 0, seen_size
+        self.__contentClass = contentClass
+        self.__requester = requester
+        self.__url = url
+        self.__parameters = parameters or {}
+        self.__headers = headers or {}
+        self.__etag: str | None = None
+        self.__poll_interval: int = Consts.DEFAULT_POLL_INTERVAL
+        self.__next_poll = 0.0
+        self.__seen: deque[Hashable] = deque(maxlen=seen_size)
+        self.__seen_keys: set[Hashable] = set()
+        self.__lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @property
+    def poll_interval(self) -> int:
+        """
+        :type: int, seconds to wait between polls as requested by the last response
+        """
+        return self.__poll_interval
+
+    @property
+    def next_poll(self) -> float:
+        """
+        :type: float, :func:`time.monotonic` time when this feed is due, 0 if it has not been polled yet
+        """
+        return self.__next_poll
+
+    def poll(self) -> list[T]:
+        """
+        :return: elements not seen before, oldest first
+        """
+        with self.__lock:
+            try:
+                return self.__poll()
+            finally:
+                self.__next_poll = time.monotonic() + self.__poll_interval
+
+    def __poll(self) -> list[T]:
+        headers = dict(self.__headers)
+        if self.__etag is not None:
+            headers[Consts.REQ_IF_NONE_MATCH] = self.__etag
+        status, response_headers, output = self.__requester.requestJson(
+            "GET", self.__url, parameters=self.__parameters, headers=headers
+        )
+        if Consts.RES_X_POLL_INTERVAL in response_headers:
+            self.__poll_interval = int(response_headers[Consts.RES_X_POLL_INTERVAL])
+        if status == 304:
+            return []
+        data = self.__requester.json_backend.loads(output) if output else None
+        if status >= 400:
+            raise self.__requester.createException(status, response_headers, data or {})
+        etag = response_headers.get(Consts.RES_ETAG)
+
+        initial = not self.__seen_keys
+        elements: list[T] = []
+        keys: set[Hashable] = set()
+        while True:
+            reached = False
+            for attributes in data or []:
+                element = self.__contentClass(self.__requester, response_headers, attributes)  # type: ignore
+                key = _key(element)
+                if key in self.__seen_keys:
+                    reached = True
+                elif key not in keys:
+                    # elements move to the next page when new elements arrive while paging
+                    keys.add(key)
+                    elements.append(element)
+            next_url = github.PaginatedList.PaginatedList.parse_link_header(response_headers).get("next")
+            if reached or initial or next_url is None:
+                break
+            response_headers, data = self.__requester.requestJsonAndCheck("GET", next_url, headers=self.__headers)
+
+        elements.reverse()
+        for element in elements:
+            key = _key(element)
+            if len(self.__seen) == self.__seen.maxlen:
+                self.__seen_keys.discard(self.__seen[0])
+            self.__seen.append(key)
+            self.__seen_keys.add(key)
+        self.__etag = etag
+        return elements
+
+
+class EventPoller:
+    """
+    This class polls many :class:`EventFeed` on a single thread, each when it is due according to its
+    ``X-Poll-Interval``, and passes new elements to the callback of the feed::
+
+        with EventPoller() as poller:
+            poller.add(repo.get_events(), lambda event: print(event.type))
+            poller.add(g.get_user().get_notifications(), lambda notification: print(notification.subject.title))
+            time.sleep(3600)
+
+    Exceptions raised by polls and callbacks are passed to ``on_error``, or logged if it is not given. The feed is
+    polled again when it is due, and the callback is called with the remaining new elements.
+
+    """
+
+    def __init__(self, on_error: Callable[[EventFeed, Exception], None] | None = None):
+        self.__on_error = on_error
+        self.__feeds: dict[EventFeed, Callable[[Any], None]] = {}
+        self.__condition = threading.Condition()
+        self.__thread: threading.Thread | None = None
+        self.__stopped = False
+        self.__logger = logging.getLogger(__name__)
+
+    def __enter__(self) -> EventPoller:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def feeds(self) -> list[EventFeed]:
+        with self.__condition:
+            return list(self.__feeds)
+
+    def add(
+        self, feed: EventFeed[T] | github.PaginatedList.PaginatedList[T], callback: Callable[[T], None]
+    ) -> EventFeed[T]:
+        """
+        :param feed: feed or paginated list of events or notifications
+        :param callback: called with each new element, oldest first
+        :return: the polled feed
+        """
+        if isinstance(feed, github.PaginatedList.PaginatedList):
+            feed = feed.feed()
+        with self.__condition:
+            self.__feeds[feed] = callback
+            self.__condition.notify_all()
+        return feed
+
+    def remove(self, feed: EventFeed) -> None:
+        with self.__condition:
+            del self.__feeds[feed]
+
+    def poll_due(self) -> int:
+        """
+        Polls all feeds that are due and calls their callbacks.
+
+        :return: number of new elements
+        """
+        now = time.monotonic()
+        count = 0
+        for feed in self.feeds:
+            if feed.next_poll > now:
+                continue
+            try:
+                elements = feed.poll()
+            except Exception as e:
+                self.__error(feed, e, f"Polling {feed.url} failed: {e}")
+                continue
+            with self.__condition:
+                callback = self.__feeds.get(feed)
+            # the feed may have been removed during the poll
+            if callback is not None:
+                for element in elements:
+                    # elements are already seen by the feed, a failing callback must not lose the remaining elements
+                    try:
+                        callback(element)
+                    except Exception as e:
+                        self.__error(feed, e, f"Callback of {feed.url} failed: {e}")
+                count += len(elements)
+        return count
+
+    def __error(self, feed: EventFeed, exception: Exception, message: str) -> None:
+        if self.__on_error is None:
+            self.__logger.warning(message)
+        else:
+            self.__on_error(feed, exception)
+
+    def start(self) -> None:
+        """
+        Starts polling on a daemon thread.
+        """
+        with self.__condition:
+            if self.__thread is not None:
+                raise RuntimeError("Poller is already started")
+            self.__stopped = False
+            self.__thread = threading.Thread(target=self.__run, name="EventPoller", daemon=True)
+            self.__thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops polling and waits for the thread to finish the current poll.
+        """
+        with self.__condition:
+            thread, self.__thread = self.__thread, None
+            self.__stopped = True
+            self.__condition.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def __run(self) -> None:
+        while True:
+            self.poll_due()
+            with self.__condition:
+                if self.__stopped:
+                    return
+                next_poll = min((feed.next_poll for feed in self.__feeds), default=None)
+                timeout = None if next_poll is None else max(0.0, next_poll - time.monotonic())
+                self.__condition.wait(timeout)
+                if self.__stopped:
+                    return
+
+
+def _key(element: Any) -> Hashable:
+    # notifications are updated in place, events are immutable
+    return element.id, getattr(element, "updated_at", None)
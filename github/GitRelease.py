@@ -60,6 +60,8 @@
 from __future__ import annotations
 
 import urllib.parse
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from os.path import basename
 from typing import TYPE_CHECKING, Any, BinaryIO
@@ -70,6 +72,7 @@ import github.GitReleaseAsset
 import github.NamedUser
 from github.GithubObject import Attribute, CompletableGithubObject, NotSet, Opt, is_optional
 from github.PaginatedList import PaginatedList
+from github.UploadStream import UploadStream
 
 from . import Consts
 
@@ -321,10 +324,16 @@ class GitRelease(CompletableGithubObject):
         return github.GitRelease.GitRelease(self._requester, headers, data, completed=True)
 
     def upload_asset(
-        self, path: str, label: str = "", content_type: Opt[str] = NotSet, name: Opt[str] = NotSet
+        self,
+        path: str,
+        label: str = "",
+        content_type: Opt[str] = NotSet,
+        name: Opt[str] = NotSet,
+        progress: Callable[[int, int], None] | None = None,
     ) -> GitReleaseAsset:
         """
         :calls: `POST /repos/{owner}/{repo}/releases/{release_id}/assets <https://docs.github.com/en/rest/releases/assets?apiVersion=2022-11-28#upload-a-release-assett>`__
+        :param progress: callable called with the number of bytes uploaded so far and the total size
         """
         assert isinstance(path, str), path
         assert isinstance(label, str), label
@@ -344,9 +353,51 @@ class GitRelease(CompletableGithubObject):
             parameters=post_parameters,
             headers=headers,
             input=path,
+            progress=progress,
         )
         return github.GitReleaseAsset.GitReleaseAsset(self._requester, resp_headers, data, completed=True)
 
+    def upload_assets(
+        self,
+        paths: list[str],
+        content_type: Opt[str] = NotSet,
+        workers: int = Consts.DEFAULT_UPLOAD_WORKERS,
+        labels: dict[str, str] | None = None,
+        progress: dict[str, Callable[[int, int], None]] | None = None,
+    ) -> list[GitReleaseAsset]:
+        """
+        Uploads several assets concurrently. Each file is streamed from disk like in ``upload_asset()``, and the name
+        of each asset is the file name.
+
+        :calls: `POST /repos/{owner}/{repo}/releases/{release_id}/assets <https://docs.github.com/en/rest/releases/assets?apiVersion=2022-11-28#upload-a-release-assett>`__
+        :param paths: list of strings, paths of the files to upload
+        :param content_type: string
+        :param workers: int, number of assets uploaded at the same time
+        :param labels: dict of strings, label of the asset of a path, assets of other paths have no label
+        :param progress: dict of callables, called with the number of bytes of the file of a path uploaded so far and
+            the total size
+        :rtype: list of :class:`github.GitReleaseAsset.GitReleaseAsset`, in the order of ``paths``
+        """
+        assert isinstance(paths, list) and all(isinstance(path, str) for path in paths), paths
+        assert isinstance(workers, int) and workers > 0, workers
+        labels = labels or {}
+        progress = progress or {}
+        assert isinstance(labels, dict) and set(labels) <= set(paths), labels
+        assert isinstance(progress, dict) and set(progress) <= set(paths), progress
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths) or 1)) as executor:
+            futures = [
+                executor.submit(
+                    self.upload_asset,
+                    path,
+                    label=labels.get(path, ""),
+                    content_type=content_type,
+                    progress=progress.get(path),
+                )
+                for path in paths
+            ]
+            return [future.result() for future in futures]
+
     def upload_asset_from_memory(
         self,
         file_like: BinaryIO,
@@ -354,6 +405,7 @@ class GitRelease(CompletableGithubObject):
         name: str,
         content_type: Opt[str] = NotSet,
         label: str = "",
+        progress: Callable[[int, int], None] | None = None,
     ) -> GitReleaseAsset:
         """
         Uploads an asset.
@@ -363,22 +415,46 @@ class GitRelease(CompletableGithubObject):
         :calls: `POST /repos/{owner}/{repo}/releases/{release_id}/assets <https://docs.github.com/en/rest/reference/repos#upload-a-release-asset>`__
         :param file_like: binary file-like object, such as those returned by ``open("file_name", "rb")``. At the very minimum, this object must implement ``read()``.
         :param file_size: int, size in bytes of ``file_like``
+        :param progress: callable called with the number of bytes uploaded so far and the total size
 
         """
-        assert isinstance(name, str), name
         assert isinstance(file_size, int), file_size
+        return self.upload_asset_from_stream(
+            UploadStream(file_like, size=file_size, progress=progress), name, content_type, label
+        )
+
+    def upload_asset_from_stream(
+        self,
+        stream: UploadStream,
+        name: str,
+        content_type: Opt[str] = NotSet,
+        label: str = "",
+    ) -> GitReleaseAsset:
+        """
+        Uploads an asset from a stream, which reads a local file, a file-like object or an iterable of ``bytes`` in
+        chunks while it is being sent. ``stream.digest`` holds the digest of the uploaded content afterwards.
+
+        :calls: `POST /repos/{owner}/{repo}/releases/{release_id}/assets <https://docs.github.com/en/rest/releases/assets?apiVersion=2022-11-28#upload-a-release-assett>`__
+        :param stream: :class:`github.UploadStream.UploadStream`
+        :param name: string
+        :param content_type: string
+        :param label: string
+        :rtype: :class:`github.GitReleaseAsset.GitReleaseAsset`
+        """
+        assert isinstance(stream, UploadStream), stream
+        assert isinstance(name, str), name
         assert isinstance(label, str), label
 
         post_parameters = {"label": label, "name": name}
         content_type = content_type if content_type is not NotSet else Consts.defaultMediaType
-        headers = {"Content-Type": content_type, "Content-Length": str(file_size)}
+        headers = {"Content-Type": content_type, "Content-Length": str(stream.size)}
 
         resp_headers, data = self._requester.requestMemoryBlobAndCheck(
             "POST",
             self.upload_url.split("{?")[0],
             parameters=post_parameters,
             headers=headers,
-            file_like=file_like,
+            file_like=stream,
         )
         return github.GitReleaseAsset.GitReleaseAsset(self._requester, resp_headers, data, completed=True)
 
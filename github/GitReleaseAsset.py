@@ -45,12 +45,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, overload
 
 import github.NamedUser
 import github.Organization
+from github import Consts
 from github.GithubObject import Attribute, CompletableGithubObject, NotSet
 
 if TYPE_CHECKING:
@@ -167,22 +168,50 @@ class GitReleaseAsset(CompletableGithubObject):
         return True
 
     @overload
-    def download_asset(self, path: None = None, chunk_size: int | None = 1) -> tuple[int, dict[str, Any], Iterator]:
+    def download_asset(
+        self, path: None = None, chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE
+    ) -> tuple[int, dict[str, Any], Iterator]:
         ...
 
     @overload
-    def download_asset(self, path: str, chunk_size: int | None = 1) -> None:
+    def download_asset(
+        self,
+        path: str,
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int | None], None] | None = None,
+        workers: int = 1,
+        max_resumes: int = Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
+    ) -> None:
         ...
 
     def download_asset(
-        self, path: None | str = None, chunk_size: int | None = 1
+        self,
+        path: None | str = None,
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int | None], None] | None = None,
+        workers: int = 1,
+        max_resumes: int = Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
     ) -> tuple[int, dict[str, Any], Iterator] | None:
         """
         Download asset to the path or return an iterator for the stream.
+
+        :param path: file to download the asset to, returns an iterator for the stream if not given
+        :param chunk_size: size of chunks read from the stream
+        :param progress: callable called with the number of bytes downloaded so far and the total size
+        :param workers: number of parallel Range requests used to download the asset to the path
+        :param max_resumes: number of times a dropped download to the path is resumed with a Range request
         """
         if path is None:
             return self._requester.getStream(self.url, chunk_size=chunk_size)
-        self._requester.getFile(self.url, path=path, chunk_size=chunk_size)
+        self._requester.getFile(
+            self.url,
+            path=path,
+            chunk_size=chunk_size,
+            progress=progress,
+            size=self.size if workers > 1 else None,
+            workers=workers,
+            max_resumes=max_resumes,
+        )
         return None
 
     def update_asset(self, name: str, label: str = "") -> GitReleaseAsset:
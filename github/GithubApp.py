@@ -74,6 +74,9 @@ class GithubApp(CompletableGithubObject):
 
     """
 
+    # the url depends on the presence of the slug attribute
+    _supports_lazy_attributes = False
+
     def _initAttributes(self) -> None:
         self._client_id: Attribute[str] = NotSet
         self._client_secret: Attribute[str] = NotSet
@@ -48,10 +48,16 @@ from github import Consts
 from github.Auth import AppAuth
 from github.GithubApp import GithubApp
 from github.GithubException import GithubException
+from github.GithubObject import NotSet, Opt, is_undefined
+from github.IdentityMap import IdentityMap
 from github.Installation import Installation
 from github.InstallationAuthorization import InstallationAuthorization
+from github.InstallationTokenCache import InstallationTokenCache, MemoryInstallationTokenCache
+from github.JsonBackend import JsonBackend
 from github.PaginatedList import PaginatedList
+from github.RateLimitScheduler import RateLimitScheduler
 from github.Requester import Requester
+from github.ResponseCache import ResponseCache
 
 
 class GithubIntegration:
@@ -67,6 +73,7 @@ class GithubIntegration:
     #     added here to force named parameters because new parameters have been added
     auth: AppAuth
     base_url: str
+    token_cache: InstallationTokenCache | None
     __requester: Requester
 
     def __init__(
@@ -90,6 +97,15 @@ class GithubIntegration:
         # v3: set lazy = True as the default
         lazy: bool = False,
         api_version: str | None = None,
+        response_cache: ResponseCache | None = None,
+        rate_limit_scheduler: RateLimitScheduler | None = None,
+        json_backend: JsonBackend | None = None,
+        lazy_attributes: bool = False,
+        retain_raw_data: bool = True,
+        identity_map: IdentityMap | None = None,
+        persisted_graphql_queries: bool = False,
+        processing_202_retries: int = Consts.DEFAULT_PROCESSING_202_RETRIES,
+        token_cache: Opt[InstallationTokenCache | None] = NotSet,
     ) -> None:
         """
         :param integration_id: int deprecated, use auth=github.Auth.AppAuth(...) instead
@@ -112,6 +128,29 @@ class GithubIntegration:
         :param api_version: string, GitHub API version to use (see https://docs.github.com/en/rest/about-the-rest-api/api-versions).
                             Note that some PyGithub methods might downgrade this version if it is not supported by the implementation.
                             Set to None to not specify any version
+        :param response_cache: github.ResponseCache.ResponseCache, caches responses of GET requests and revalidates
+                               them with conditional requests, see :class:`github.ResponseCache.ResponseCache`
+        :param rate_limit_scheduler: github.RateLimitScheduler.RateLimitScheduler, paces requests to spread the
+                                     remaining rate limit, see :class:`github.RateLimitScheduler.RateLimitScheduler`
+        :param json_backend: github.JsonBackend.JsonBackend, decodes and encodes JSON bodies, defaults to the json
+                             module of the standard library, see :class:`github.JsonBackend.JsonBackend`
+        :param lazy_attributes: attributes of objects created from this instance are decoded from the raw data
+                                on first access instead of when the object is created
+        :param retain_raw_data: objects created from this instance keep their raw data and response headers,
+                                set to False to discard them once decoded, see :attr:`GithubObject.raw_data`
+        :param identity_map: github.IdentityMap.IdentityMap, shares nested objects of the same resource created from
+                             this instance, see :class:`github.IdentityMap.IdentityMap`
+        :param persisted_graphql_queries: GraphQL requests refer to query documents by hash, which requires a GraphQL
+                                          server or proxy that supports persisted queries,
+                                          see :class:`github.GraphQlQuery.GraphQlQueryRegistry`
+        :param processing_202_retries: int, number of retries of GET requests while GitHub is computing the response
+                                       (status 202), waiting exponentially longer, then a GithubException is raised,
+                                       0 returns no data right away, see :class:`github.StatsPoller.StatsPoller` to
+                                       not block on statistics
+        :param token_cache: github.InstallationTokenCache.InstallationTokenCache, shares installation access tokens
+                            between the Github instances returned by :meth:`get_github_for_installation`,
+                            defaults to a new :class:`github.InstallationTokenCache.MemoryInstallationTokenCache`,
+                            set to None to create a new access token for every Github instance
         """
         if integration_id is not None:
             assert isinstance(integration_id, (int, str)), integration_id
@@ -131,6 +170,19 @@ class GithubIntegration:
         assert isinstance(jwt_issued_at, int)
         assert isinstance(lazy, bool), lazy
         assert api_version is None or isinstance(api_version, str), api_version
+        assert response_cache is None or isinstance(response_cache, ResponseCache), response_cache
+        assert rate_limit_scheduler is None or isinstance(
+            rate_limit_scheduler, RateLimitScheduler
+        ), rate_limit_scheduler
+        assert json_backend is None or isinstance(json_backend, JsonBackend), json_backend
+        assert isinstance(lazy_attributes, bool), lazy_attributes
+        assert isinstance(retain_raw_data, bool), retain_raw_data
+        assert identity_map is None or isinstance(identity_map, IdentityMap), identity_map
+        assert isinstance(persisted_graphql_queries, bool), persisted_graphql_queries
+        assert isinstance(processing_202_retries, int) and processing_202_retries >= 0, processing_202_retries
+        assert (
+            is_undefined(token_cache) or token_cache is None or isinstance(token_cache, InstallationTokenCache)
+        ), token_cache
 
         self.base_url = base_url
 
@@ -168,6 +220,7 @@ class GithubIntegration:
         ), f"GithubIntegration requires github.Auth.AppAuth authentication, not {type(auth)}"
 
         self.auth = auth
+        self.token_cache = MemoryInstallationTokenCache() if is_undefined(token_cache) else token_cache  # type: ignore
 
         self.__requester = Requester(
             auth=auth,
@@ -182,6 +235,14 @@ class GithubIntegration:
             seconds_between_writes=seconds_between_writes,
             lazy=lazy,
             api_version=api_version,
+            response_cache=response_cache,
+            rate_limit_scheduler=rate_limit_scheduler,
+            json_backend=json_backend,
+            lazy_attributes=lazy_attributes,
+            retain_raw_data=retain_raw_data,
+            identity_map=identity_map,
+            persisted_graphql_queries=persisted_graphql_queries,
+            processing_202_retries=processing_202_retries,
         )
 
     def withLazy(self, lazy: bool) -> GithubIntegration:
@@ -194,7 +255,7 @@ class GithubIntegration:
 
         """
         kwargs = self.__requester.kwargs
-        kwargs.update(lazy=lazy)
+        kwargs.update(lazy=lazy, token_cache=self.token_cache)
         return GithubIntegration(**kwargs)
 
     def close(self) -> None:
@@ -218,7 +279,7 @@ class GithubIntegration:
         self, installation_id: int, token_permissions: dict[str, str] | None = None
     ) -> github.Github:
         # The installation has to authenticate as an installation, not an app
-        auth = self.auth.get_installation_auth(installation_id, token_permissions, self.__requester)
+        auth = self.auth.get_installation_auth(installation_id, token_permissions, self.__requester, self.token_cache)
         return github.Github(**self.__requester.withAuth(auth).kwargs)
 
     @property
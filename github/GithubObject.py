@@ -53,10 +53,13 @@
 from __future__ import annotations
 
 import email.utils
+import functools
 import re
+import sys
 import typing
 from abc import ABC
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 from operator import itemgetter
@@ -66,6 +69,7 @@ from typing_extensions import ParamSpec, Protocol, Self, TypeVar
 
 from . import Consts
 from .GithubException import BadAttributeException, IncompletableObject
+from .IdentityMap import IdentityMap
 
 if TYPE_CHECKING:
     from .Requester import Requester
@@ -76,7 +80,60 @@ T_co = typing.TypeVar("T_co", covariant=True)
 T_gh = typing.TypeVar("T_gh", bound="GithubObject")
 
 
+class _SingleAttributeView(dict):
+    """
+    The raw attributes of an object as seen by ``_useAttributes`` when decoding a single lazy attribute.
+
+    Only the decoded key is contained, so ``_useAttributes`` decodes only that attribute, while all keys can be read,
+    as attributes may depend on other keys of the raw attributes.
+
+    """
+
+    def __init__(self, attributes: dict[str, Any], key: str):
+        super().__init__({key: attributes[key]})
+        self.__attributes = attributes
+
+    def __getitem__(self, key: str) -> Any:
+        return self.__attributes[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.__attributes.get(key, default)
+
+
+# number of lazy attributes decoded individually, before all remaining attributes of an object are decoded at once,
+# as decoding all attributes at once is cheaper than decoding many individually
+_LAZY_ATTRIBUTES_DECODED_INDIVIDUALLY = 8
+
+# response headers kept by objects that discard their raw data, as required by etag, last_modified and api_version
+_RETAINED_HEADERS = (Consts.RES_ETAG, Consts.RES_LAST_MODIFIED, Consts.headerApiVersionSelected)
+
+
+def _retained_headers(headers: dict[str, str | int]) -> dict[str, str | int]:
+    """
+    The response headers kept by an object that discards its raw data.
+
+    Objects created from the same response share a single instance of these headers.
+
+    """
+    return _interned_headers(tuple((key, headers[key]) for key in _RETAINED_HEADERS if key in headers))
+
+
+# number of distinct timestamps memoized, timestamps repeat across the objects of a page, e.g. in created_at and
+# updated_at of the same object or pushed_at of repositories of a busy organization
+_DATETIME_CACHE_SIZE = 4096
+# string attributes up to this length are interned, short values like state, conclusion and type repeat across objects
+_INTERNED_STRING_MAX_LENGTH = 32
+
+
+@functools.lru_cache(maxsize=1024)
+def _interned_headers(headers: tuple[tuple[str, str | int], ...]) -> dict[str, str | int]:
+    return dict(headers)
+
+
 class Attribute(Protocol[T_co]):
+    # attributes are held by every GithubObject, slots keep them small
+    __slots__ = ()
+
     @property
     def value(self) -> T_co:
         raise NotImplementedError
@@ -97,23 +154,27 @@ def _datetime_from_http_date(value: str) -> datetime:
     return dt
 
 
+@functools.lru_cache(maxsize=_DATETIME_CACHE_SIZE)
 def _datetime_from_github_isoformat(value: str) -> datetime:
     """
     Convert an GitHub API timestamps to a datetime object.
 
-    Raises ValueError for invalid timestamps.
+    Raises ValueError for invalid timestamps. Results are memoized, datetime objects are immutable and shared by all
+    attributes of the same timestamp.
 
     """
 
     # Github always returns YYYY-MM-DDTHH:MM:SSZ, so we can use the stdlib parser
     # with some minor adjustments for Python < 3.11 which doesn't support "Z"
     # https://docs.github.com/en/rest/overview/resources-in-the-rest-api#schema
-    if value.endswith("Z"):
+    if sys.version_info < (3, 11) and value.endswith("Z"):
         value = value[:-1] + "+00:00"
     return datetime.fromisoformat(value)
 
 
 class _NotSetType(Attribute[Any]):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "NotSet"
 
@@ -208,20 +269,42 @@ def as_rest_api_attributes_list(graphql_attributes: list[dict[str, Any] | None])
 
 
 class _ValuedAttribute(Attribute[T]):
+    __slots__ = ("_value",)
+
+    # attributes of the most frequent values are immutable and shared by all GithubObjects
+    __shared: dict[Any, _ValuedAttribute] = {}
+
+    def __new__(cls, value: T) -> _ValuedAttribute[T]:
+        if value is None or value is True or value is False:
+            shared = cls.__shared.get(value)
+            if shared is None:
+                shared = cls.__shared.setdefault(value, super().__new__(cls))
+                shared._value = value
+            return shared
+        return super().__new__(cls)
+
     def __init__(self, value: T):
         self._value = value
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _ValuedAttribute, (self._value,)
+
     @property
     def value(self) -> T:
         return self._value
 
 
 class _BadAttribute(Attribute[T]):
+    __slots__ = ("__value", "__expectedType", "__exception")
+
     def __init__(self, value: Any, expectedType: Any, exception: Exception | None = None):
         self.__value = value
         self.__expectedType = expectedType
         self.__exception = exception
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _BadAttribute, (self.__value, self.__expectedType, self.__exception)
+
     @property
     def value(self) -> T:
         raise BadAttributeException(self.__value, self.__expectedType, self.__exception)
@@ -239,6 +322,16 @@ class GithubObject(ABC):
     """
     CHECK_AFTER_INIT_FLAG = False
     _url: Attribute[str]
+    # None once discarded, see retain_raw_data
+    _rawData: Any
+
+    # attributes of classes that depend on the presence of other raw attributes or on the time of decoding
+    # cannot be decoded individually, such classes decode their attributes when created even with lazy_attributes
+    _supports_lazy_attributes = True
+
+    # classes that read their raw data after decoding, e.g. to provide paginated attributes, keep their raw data
+    # even with retain_raw_data=False
+    _supports_discarding_raw_data = True
 
     @classmethod
     def is_rest(cls) -> bool:
@@ -259,21 +352,126 @@ class GithubObject(ABC):
         attributes: Any,
     ):
         self._requester = requester
-        self._initAttributes()
-        self._storeAndUseAttributes(headers, attributes)
+        self.__pendingAttributes: dict[str, Any] | None = None
+        if (
+            requester is not None
+            and requester.lazy_attributes
+            and self._supports_lazy_attributes
+            and isinstance(attributes, dict)
+        ):
+            # attributes are decoded from the raw data on first access, see __getattr__
+            self._api_version = headers.get(Consts.headerApiVersionSelected)
+            self._headers = headers
+            self._rawData = attributes
+            self.__pendingAttributes = attributes
+            self.__individuallyDecoded = 0
+        else:
+            self._initAttributes()
+            self._storeAndUseAttributes(headers, attributes)
 
         # Ask requester to do some checking, for debug and test purpose
         # Since it's most handy to access and kinda all-knowing
         if self.CHECK_AFTER_INIT_FLAG:  # pragma no branch (Flag always set in tests)
             requester.check_me(self)
 
+    if not TYPE_CHECKING:
+        # hidden from type checkers, which would otherwise accept any attribute of any GithubObject
+
+        def __getattr__(self, name: str) -> Any:
+            # only called for attributes that are not set, which are the attributes not decoded yet
+            # for objects created by a requester with lazy_attributes=True
+            if name.startswith("__") or not name.startswith("_"):
+                raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+            # decoding is idempotent and publishes attributes only once fully decoded, concurrent readers may decode the
+            # same attribute, in which case the value published first wins
+            state = self.__dict__
+            if name in state:
+                # decoded by a concurrent reader
+                return state[name]
+            pending = state.get("_GithubObject__pendingAttributes")
+            if (
+                pending is not None
+                and name[1:] in pending
+                and state["_GithubObject__individuallyDecoded"] < _LAZY_ATTRIBUTES_DECODED_INDIVIDUALLY
+            ):
+                # decode only the attribute of the same name, ignoring attributes derived from it as a side effect
+                state["_GithubObject__individuallyDecoded"] += 1
+                decoded = self.__decodeAttributes(_SingleAttributeView(pending, name[1:]))
+                if name in decoded:
+                    return state.setdefault(name, decoded[name])
+            self.__decodePendingAttributes()
+            if name in state:
+                return state[name]
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __decodeAttributes(self, attributes: dict[str, Any], initialize: bool = False) -> dict[str, Any]:
+        # decodes into a copy of this object, so that concurrent readers never see attributes while being decoded
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        if initialize:
+            clone._initAttributes()
+        clone._useAttributes(attributes)
+        return clone.__dict__
+
+    def __decodePendingAttributes(self) -> None:
+        pending = self.__dict__.get("_GithubObject__pendingAttributes")
+        if pending is None:
+            return
+        # attributes decoded before, individually or by a concurrent reader, take precedence, they are identical to
+        # the decoded ones
+        for name, value in self.__decodeAttributes(pending, initialize=True).items():
+            self.__dict__.setdefault(name, value)
+        self.__pendingAttributes = None
+        self.__discardRawDataIfNotRetained()
+
+    def __discardRawDataIfNotRetained(self) -> None:
+        if self._requester is not None and not self._requester.retain_raw_data and self._supports_discarding_raw_data:
+            self._rawData = None
+            self._headers = _retained_headers(self._headers)
+
+    def __currentRawData(self) -> Any:
+        # does not complete the object, discarded raw data are reconstructed from the decoded attributes
+        self.__decodePendingAttributes()
+        if self._rawData is not None:
+            return self._rawData
+        # attributes of raw keys with a leading underscore are private, e.g. _links is held by __links
+        prefixes = tuple(f"_{cls.__name__}_" for cls in type(self).__mro__)
+        raw_data = {}
+        for name, attribute in self.__dict__.items():
+            if isinstance(attribute, (_ValuedAttribute, _BadAttribute)):
+                key = name[1:]
+                for prefix in prefixes:
+                    if name.startswith(prefix + "_"):
+                        key = name[len(prefix) :]
+                raw_data[key] = self.__serialize(attribute)
+        return raw_data
+
+    @staticmethod
+    def __serialize(value: Any) -> Any:
+        if isinstance(value, _ValuedAttribute):
+            return GithubObject.__serialize(value.value)
+        if isinstance(value, _BadAttribute):
+            # the value as given in the raw data, which could not be decoded
+            return value._BadAttribute__value  # type: ignore
+        if isinstance(value, GithubObject):
+            return value.__currentRawData()
+        if isinstance(value, datetime):
+            return value.isoformat().replace("+00:00", "Z")
+        if isinstance(value, list):
+            return [GithubObject.__serialize(element) for element in value]
+        if isinstance(value, dict):
+            return {key: GithubObject.__serialize(element) for key, element in value.items()}
+        return value
+
     def _storeAndUseAttributes(self, headers: dict[str, str | int], attributes: Any) -> None:
+        self.__decodePendingAttributes()
         # Make sure headers are assigned before calling _useAttributes
         # (Some derived classes will use headers in _useAttributes)
         self._api_version = headers.get(Consts.headerApiVersionSelected)
         self._headers = headers
         self._rawData = attributes
         self._useAttributes(attributes)
+        self.__discardRawDataIfNotRetained()
 
     @property
     def requester(self) -> Requester:
@@ -288,16 +486,28 @@ class GithubObject(ABC):
     @property
     def raw_data(self) -> dict[str, Any]:
         """
+        The attributes of this object as returned by the API.
+
+        Objects created with ``retain_raw_data=False`` reconstruct these from the decoded attributes. Then, only
+        attributes known to PyGithub are contained, and timestamps are given in ISO 8601 format.
+
         :type: dict
         """
-        return self._rawData
+        # decoding attributes may add attributes to the raw data
+        return self.__currentRawData()
 
     @property
     def raw_headers(self) -> dict[str, str | int]:
         """
+        The headers of the response this object was created from.
+
+        Objects created with ``retain_raw_data=False`` only keep the ``ETag``, ``Last-Modified`` and
+        ``X-GitHub-Api-Version-Selected`` headers.
+
         :type: dict
         """
-        return self._headers
+        # a copy, as objects share their headers
+        return dict(self._headers)
 
     @property
     def api_version(self) -> str | None:
@@ -343,6 +553,8 @@ class GithubObject(ABC):
 
     @staticmethod
     def _makeStringAttribute(value: int | str | None) -> Attribute[str]:
+        if isinstance(value, str) and len(value) <= _INTERNED_STRING_MAX_LENGTH:
+            value = sys.intern(value)
         return GithubObject.__makeSimpleAttribute(value, str)
 
     @staticmethod
@@ -381,11 +593,18 @@ class GithubObject(ABC):
     def _makeHttpDatetimeAttribute(value: str | None) -> Attribute[datetime]:
         return GithubObject.__makeTransformedAttribute(value, str, _datetime_from_http_date)  # type: ignore
 
+    def __makeNestedObject(self, klass: type[T_gh], attributes: Any) -> T_gh:
+        # completable objects complete attributes missing in the shared object of the same resource
+        identity_map = self._requester.identity_map if self._requester is not None else None
+        if isinstance(identity_map, IdentityMap) and issubclass(klass, CompletableGithubObject):
+            return identity_map.get(klass, self._requester, self._headers, attributes)
+        return klass(self._requester, self._headers, attributes)
+
     def _makeClassAttribute(self, klass: type[T_gh], value: Any) -> Attribute[T_gh]:
         return GithubObject.__makeTransformedAttribute(
             value,
             dict,
-            lambda value: klass(self._requester, self._headers, value),
+            lambda value: self.__makeNestedObject(klass, value),
         )
 
     def _makeUnionClassAttributeFromTypeName(
@@ -470,7 +689,7 @@ class GithubObject(ABC):
 
     def _makeListOfClassesAttribute(self, klass: type[T_gh], value: Any) -> Attribute[list[T_gh]]:
         if isinstance(value, list) and all(isinstance(element, dict) for element in value):
-            return _ValuedAttribute([klass(self._requester, self._headers, element) for element in value])
+            return _ValuedAttribute([self.__makeNestedObject(klass, element) for element in value])
         else:
             return _BadAttribute(value, [dict])
 
@@ -494,7 +713,7 @@ class GithubObject(ABC):
         if isinstance(value, list) and all(isinstance(element, dict) for element in value):
             return _ValuedAttribute(
                 [
-                    klass(self._requester, self._headers, element)
+                    self.__makeNestedObject(klass, element)
                     for element in value
                     for type_name in [element.get(type_key, default_type)]
                     for klass in [class_and_name_index.get(type_name, fallback_class)]
@@ -514,9 +733,7 @@ class GithubObject(ABC):
         if isinstance(value, dict) and all(
             isinstance(key, str) and isinstance(element, dict) for key, element in value.items()
         ):
-            return _ValuedAttribute(
-                {key: klass(self._requester, self._headers, element) for key, element in value.items()}
-            )
+            return _ValuedAttribute({key: self.__makeNestedObject(klass, element) for key, element in value.items()})
         else:
             return _BadAttribute(value, {str: dict})
 
@@ -584,6 +801,11 @@ class NonCompletableGithubObject(GithubObject, ABC):
 
 
 class CompletableGithubObject(GithubObject, ABC):
+    # GraphQL node type and schema of the attributes retrieved by complete_all(..., graphql=True),
+    # fields are aliased to REST API attribute names or translated by as_rest_api_attributes
+    _graphql_node_type: str | None = None
+    _graphql_schema: str | None = None
+
     def __init__(
         self,
         requester: Requester,
@@ -652,6 +874,10 @@ class CompletableGithubObject(GithubObject, ABC):
     def completed(self) -> bool:
         return self.__completed
 
+    @property
+    def _completeHeaders(self) -> dict[str, str] | None:
+        return self.__completeHeaders
+
     @property
     def raw_data(self) -> dict[str, Any]:
         """
@@ -677,6 +903,82 @@ class CompletableGithubObject(GithubObject, ABC):
         self._completeIfNeeded()
         return self
 
+    @staticmethod
+    def complete_all(
+        objects: Iterable[T], workers: int = Consts.DEFAULT_COMPLETE_WORKERS, graphql: bool = False
+    ) -> list[T]:
+        """
+        Completes all given objects that are not completed yet, sending ``workers`` requests concurrently, instead of
+        one request after the other when attributes of the objects are accessed::
+
+            users = CompletableGithubObject.complete_all(issue.user for issue in repo.get_issues())
+
+        With ``graphql=True``, objects of classes that support it retrieve their most common attributes via GraphQL
+        ``nodes`` queries instead, for up to 100 objects per request. This requires objects to know their ``node_id``,
+        as nested objects do. Such objects are not completed, accessing attributes not retrieved via GraphQL completes
+        them as usual. All other objects are completed via the REST API.
+
+        :param objects: objects to complete, objects that are not completable are ignored
+        :param workers: number of concurrent requests
+        :param graphql: retrieve attributes via GraphQL where supported
+        :return: the given objects
+        :raises: :class:`GithubException` of the first failing request
+
+        """
+        assert isinstance(workers, int) and workers > 0, workers
+        objects = list(objects)
+        incomplete: list[CompletableGithubObject] = [
+            obj for obj in objects if isinstance(obj, CompletableGithubObject) and not obj.completed
+        ]
+        if graphql:
+            incomplete = CompletableGithubObject.__retrieveGraphQlAttributes(incomplete)
+        if incomplete:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="complete_all") as executor:
+                for _ in executor.map(CompletableGithubObject._completeIfNeeded, incomplete):
+                    pass
+        return objects
+
+    @staticmethod
+    def __retrieveGraphQlAttributes(objects: list[CompletableGithubObject]) -> list[CompletableGithubObject]:
+        # returns the objects whose attributes could not be retrieved via GraphQL
+        remaining = []
+        batches: dict[tuple[type[CompletableGithubObject], int], list[tuple[str, CompletableGithubObject]]] = {}
+        for obj in objects:
+            node_id = obj.__nodeId()
+            if obj._graphql_schema is None or node_id is None:
+                remaining.append(obj)
+            else:
+                # objects of different requesters may authenticate differently
+                batches.setdefault((type(obj), id(obj.requester)), []).append((node_id, obj))
+
+        for (klass, _), batch in batches.items():
+            assert klass._graphql_schema is not None and klass._graphql_node_type is not None
+            for start in range(0, len(batch), Consts.MAX_GRAPHQL_NODES):
+                chunk = batch[start : start + Consts.MAX_GRAPHQL_NODES]
+                headers, data = chunk[0][1].requester.graphql_nodes(
+                    [node_id for node_id, _ in chunk], klass._graphql_schema, klass._graphql_node_type
+                )
+                for (_, obj), node in zip(chunk, data["data"]["nodes"]):
+                    if node is None or node.get("__typename") != klass._graphql_node_type:
+                        remaining.append(obj)
+                    else:
+                        attributes = as_rest_api_attributes(node)
+                        del attributes["__typename"]
+                        obj.__useNodeAttributes(attributes)
+        return remaining
+
+    def __nodeId(self) -> str | None:
+        if isinstance(self._rawData, dict) and isinstance(self._rawData.get("node_id"), str):
+            return self._rawData["node_id"]
+        # the raw data may have been discarded
+        node_id = getattr(self, "_node_id", NotSet)
+        return node_id.value if isinstance(node_id, _ValuedAttribute) else None
+
+    def __useNodeAttributes(self, attributes: dict[str, Any]) -> None:
+        # adds to the attributes of this object, which remains incomplete
+        raw_data = self._rawData if isinstance(self._rawData, dict) else {}
+        self._storeAndUseAttributes(self._headers, {**raw_data, **attributes})
+
     def _completeIfNotSet(self, value: Attribute) -> None:
         if isinstance(value, _NotSetType):
             self._completeIfNeeded()
@@ -747,6 +1049,9 @@ class CompletableGithubObjectWithPaginatedProperty(CompletableGithubObject):
 
     """
 
+    # the paginated property reads its first page from the raw data
+    _supports_discarding_raw_data = False
+
     def __init__(
         self,
         requester: Requester,
@@ -0,0 +1,337 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Container, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import github
+from github import Consts
+
+if TYPE_CHECKING:
+    from github.GithubException import GithubException
+    from github.Requester import Requester
+
+# a string, parenthesized arguments, a curly bracket or a name of a GraphQL selection
+_TOKENS = re.compile(r'"(?:\\.|[^"\\])*"|\((?:[^()"]|"(?:\\.|[^"\\])*")*\)|[{}]|[_A-Za-z]\w*')
+_FIELD = re.compile(r"\s*(?:([_A-Za-z]\w*)\s*:\s*)?([_A-Za-z]\w*)")
+_PAGE_SIZE = re.compile(r"\b(?:first|last)\s*:\s*(?:(\d+)|\$([_A-Za-z]\w*))")
+
+
+def _parse_field(selection: str) -> tuple[str, str]:
+    """
+    Returns the key of the selected field in the response and the field without its alias.
+    """
+    match = _FIELD.match(selection)
+    if match is None:
+        raise ValueError(f"Selection must start with a field: {selection!r}")
+    field = selection[match.start(2) :].strip()
+    fields = 0
+    depth = 0
+    for token in _TOKENS.finditer(field):
+        text = token.group()
+        if text == "{":
+            depth += 1
+        elif text == "}":
+            depth -= 1
+        elif depth == 0 and text[0] not in '("' and field[token.start() - 1 : token.start()] != "@":
+            fields += 1
+    if fields != 1 or depth != 0:
+        raise ValueError(f"Selection must select exactly one top-level field: {selection!r}")
+    return match.group(1) or match.group(2), field
+
+
+def _rename_variables(selection: str, names: Container[str], prefix: str) -> str:
+    """
+    Prefixes the given variables used in the arguments of a selection, leaving strings untouched.
+    """
+    parts = []
+    end = 0
+    for token in _TOKENS.finditer(selection):
+        if not token.group().startswith("("):
+            continue
+        # names within the arguments, strings are separate tokens
+        for name in _TOKENS.finditer(selection, token.start() + 1, token.end() - 1):
+            if selection[name.start() - 1] == "$" and name.group() in names:
+                parts.append(selection[end : name.start()])
+                parts.append(f"{prefix}{name.group()}")
+                end = name.end()
+    parts.append(selection[end:])
+    return "".join(parts)
+
+
+def estimate_nodes(query: str, variables: dict[str, Any]) -> int:
+    """
+    Estimates the nodes requested by a GraphQL query or field the way GitHub counts them against its node limit: each
+    connection requests its page size times the page sizes of all enclosing connections. Page size variables that are
+    not given are ``null``.
+
+    :param query: GraphQL query or selection
+    :param variables: values of the variables used by the query
+    :return: estimated number of nodes, at least 1
+
+    """
+    nodes = 0
+    multipliers = [1]
+    page_size: int | None = None
+    for token in _TOKENS.finditer(query):
+        text = token.group()
+        if text.startswith("("):
+            page_sizes = [
+                int(match.group(1)) if match.group(1) is not None else variables.get(match.group(2))
+                for match in _PAGE_SIZE.finditer(text)
+            ]
+            page_size = max((int(size) for size in page_sizes if size is not None), default=None)
+        elif text == "{":
+            multiplier = multipliers[-1] * (page_size or 1)
+            if page_size:
+                nodes += multiplier
+            multipliers.append(multiplier)
+            page_size = None
+        elif text == "}":
+            if len(multipliers) > 1:
+                multipliers.pop()
+            page_size = None
+        elif not text.startswith('"'):
+            page_size = None
+    return max(nodes, 1)
+
+
+def add_rate_limit(query: str) -> str:
+    """
+    Adds GitHub's ``rateLimit`` object to the top-level selection set of the operation of a GraphQL query. Fragments
+    defined before or after the operation are left untouched.
+
+    :param query: GraphQL query
+    :return: query that also requests the cost of the query and the remaining rate limit
+
+    """
+    depth = 0
+    keyword: str | None = None
+    for token in _TOKENS.finditer(query):
+        text = token.group()
+        if text == "{":
+            depth += 1
+        elif text == "}":
+            depth -= 1
+            if depth == 0 and keyword != "fragment":
+                end = token.start()
+                return f"{query[:end].rstrip()}\n  rateLimit {{ cost remaining }}\n{query[end:]}"
+            if depth == 0:
+                keyword = None
+        elif depth == 0 and keyword is None and text[0] not in '("':
+            # the first name of a definition is query, mutation, subscription or fragment
+            keyword = text
+    raise ValueError(f"GraphQL query must define an operation: {query!r}")
+
+
+class _BatchedFuture(Future):
+    """
+    A future that sends the pending queries of its batcher when its result is requested.
+    """
+
+    def __init__(self, batcher: GraphQlBatcher) -> None:
+        super().__init__()
+        self.__batcher = batcher
+
+    def result(self, timeout: float | None = None) -> dict[str, Any]:
+        if not self.done():
+            self.__batcher.flush()
+        return super().result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        if not self.done():
+            self.__batcher.flush()
+        return super().exception(timeout)
+
+
+@dataclass
+class _Query:
+    alias: str
+    key: str
+    field: str
+    variables: dict[str, Any]
+    types: dict[str, str]
+    nodes: int
+    future: Future
+
+
+class GraphQlBatcher:
+    """
+    This class merges many independent GraphQL queries into few requests.
+
+    Each query selects a single top-level field, e.g. ``repository(owner: $owner, name: $name) { stargazerCount }``.
+    Queries are merged into a single GraphQL request using field aliases, and their variables are renamed accordingly.
+    A request contains at most ``batch_size`` queries, which together request at most ``max_nodes`` nodes, as estimated
+    from the ``first`` and ``last`` arguments of connections. Queries beyond these limits are sent in further requests.
+
+    :meth:`query` returns a :class:`concurrent.futures.Future`, which resolves to the response data of that query, as
+    if it had been sent on its own. Errors of a query, e.g. an unknown repository, fail only the future of that query,
+    while errors of the request fail all futures of that request.
+
+    Queries are sent when ``batch_size`` queries are pending, when :meth:`flush` is called, when the batcher is used as
+    a context manager and the context is left, or when the result of a pending future is requested. The batcher can be
+    used by multiple threads.
+
+    """
+
+    def __init__(
+        self,
+        requester: Requester,
+        batch_size: int = Consts.DEFAULT_GRAPHQL_BATCH_SIZE,
+        max_nodes: int = Consts.MAX_GRAPHQL_QUERY_NODES,
+    ) -> None:
+        assert batch_size > 0, batch_size
+        assert max_nodes > 0, max_nodes
+        self.__requester = requester
+        self.__batch_size = batch_size
+        self.__max_nodes = max_nodes
+        self.__lock = threading.Lock()
+        self.__pending: list[_Query] = []
+        self.__queries = 0
+        self.__requests = 0
+
+    def __enter__(self) -> GraphQlBatcher:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        """
+        :type: int, number of queries not sent yet
+        """
+        with self.__lock:
+            return len(self.__pending)
+
+    @property
+    def requests(self) -> int:
+        """
+        :type: int, number of GraphQL requests sent
+        """
+        return self.__requests
+
+    def query(
+        self, selection: str, variables: dict[str, Any] | None = None, types: dict[str, str] | None = None
+    ) -> Future:
+        """
+        Adds a query to the next request.
+
+        :param selection: GraphQL selection of a single top-level field, optionally aliased
+        :param variables: values of the variables used by the selection
+        :param types: GraphQL types of the variables used by the selection, e.g. ``{"owner": "String!"}``
+        :return: future of the response data, e.g. ``{"repository": {"stargazerCount": 42}}``
+        :raises: :class:`ValueError` if the selection does not select a single field or variables have no type
+
+        """
+        variables = variables or {}
+        types = types or {}
+        if variables.keys() != types.keys():
+            raise ValueError(f"Variables and types must have the same names: {sorted(variables)} != {sorted(types)}")
+        key, field = _parse_field(selection)
+        nodes = estimate_nodes(field, variables)
+        future = _BatchedFuture(self)
+
+        with self.__lock:
+            alias = f"q{self.__queries}"
+            self.__queries += 1
+            field = _rename_variables(field, variables, f"{alias}_")
+            self.__pending.append(_Query(alias, key, field, variables, types, nodes, future))
+            full = len(self.__pending) >= self.__batch_size
+
+        if full:
+            self.flush()
+        return future
+
+    def flush(self) -> None:
+        """
+        Sends all pending queries.
+        """
+        with self.__lock:
+            pending, self.__pending = self.__pending, []
+        for batch in self.__batches(pending):
+            self.__send(batch)
+
+    def __batches(self, queries: list[_Query]) -> Iterator[list[_Query]]:
+        batch: list[_Query] = []
+        nodes = 0
+        for query in queries:
+            if batch and (len(batch) >= self.__batch_size or nodes + query.nodes > self.__max_nodes):
+                yield batch
+                batch = []
+                nodes = 0
+            batch.append(query)
+            nodes += query.nodes
+        if batch:
+            yield batch
+
+    def __send(self, batch: list[_Query]) -> None:
+        # cancelled futures are not sent
+        queries = [query for query in batch if query.future.set_running_or_notify_cancel()]
+        if not queries:
+            return
+
+        definitions = ", ".join(
+            f"${query.alias}_{name}: {type}" for query in queries for name, type in query.types.items()
+        )
+        fields = "\n".join(f"  {query.alias}: {query.field}" for query in queries)
+        document = f"query Batch{f'({definitions})' if definitions else ''} {{\n{fields}\n}}"
+        variables = {f"{query.alias}_{name}": value for query in queries for name, value in query.variables.items()}
+
+        with self.__lock:
+            self.__requests += 1
+        try:
+            # errors are returned with the response, as they belong to individual queries
+            headers, data = self.__requester.graphql_request(document, variables)
+        except Exception as e:
+            for query in queries:
+                query.future.set_exception(e)
+            return
+
+        # errors with a path belong to the query of the aliased field, all other errors belong to all queries
+        keys = {query.alias: query.key for query in queries}
+        errors: dict[str | None, list[dict[str, Any]]] = {}
+        for error in data.get("errors") or []:
+            path = error.get("path") or [None]
+            alias = path[0] if path[0] in keys else None
+            if alias is not None:
+                error = dict(error, path=[keys[alias]] + path[1:])
+            errors.setdefault(alias, []).append(error)
+
+        results = data.get("data") or {}
+        for query in queries:
+            query_errors = errors.get(None, []) + errors.get(query.alias, [])
+            if query_errors:
+                query.future.set_exception(self.__exception(headers, query_errors))
+            else:
+                query.future.set_result({query.key: results.get(query.alias)})
+
+    def __exception(self, headers: dict[str, Any], errors: list[dict[str, Any]]) -> GithubException:
+        output = {"errors": errors}
+        if len(errors) == 1 and errors[0].get("type") == "NOT_FOUND":
+            return github.UnknownObjectException(404, output, headers, errors[0].get("message"))
+        return self.__requester.createException(400, headers, output)
@@ -0,0 +1,196 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, TypeVar
+
+from github import Consts
+
+K = TypeVar("K")
+
+
+class GraphQlQuery(NamedTuple):
+    """
+    A GraphQL query document, built once and identified by its SHA-256 hash.
+    """
+
+    name: str | None
+    document: str
+    sha256: str
+
+    @property
+    def persisted_query(self) -> dict[str, Any]:
+        """
+        :type: the ``extensions`` of a request that refers to this document by its hash
+        """
+        return {"persistedQuery": {"version": 1, "sha256Hash": self.sha256}}
+
+
+class GraphQlQueryRegistry:
+    """
+    This class holds GraphQL query documents, so that each document is built and hashed once.
+
+    The documents sent by :meth:`github.Requester.Requester.graphql_node`,
+    :meth:`github.Requester.Requester.graphql_nodes` and :meth:`github.Requester.Requester.graphql_named_mutation`
+    are built once per node type or mutation name and schema. With ``persisted_graphql_queries`` enabled, all documents
+    sent via :meth:`github.Requester.Requester.graphql_query` are registered, and requests refer to them by hash. All
+    registered documents are available via :meth:`queries`, e.g. to allow-list them in a GraphQL proxy.
+
+    At most ``maxsize`` documents are registered, the least recently used documents are discarded.
+
+    """
+
+    def __init__(self, maxsize: int = Consts.DEFAULT_GRAPHQL_QUERY_REGISTRY_SIZE) -> None:
+        assert maxsize >= 0, maxsize
+        self.__maxsize = maxsize
+        self.__lock = threading.Lock()
+        self.__queries: OrderedDict[str, GraphQlQuery] = OrderedDict()
+        self.__templates: OrderedDict[tuple[str, str, str], GraphQlQuery] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__queries)
+
+    def queries(self) -> list[GraphQlQuery]:
+        """
+        :return: all registered queries
+        """
+        with self.__lock:
+            return list(self.__queries.values())
+
+    def get(self, sha256: str) -> GraphQlQuery | None:
+        """
+        :param sha256: hash of the query document
+        :return: the registered query with the given hash, if any
+        """
+        return next((query for query in self.queries() if query.sha256 == sha256), None)
+
+    def query(self, document: str, name: str | None = None) -> GraphQlQuery:
+        """
+        :param document: GraphQL query document
+        :param name: name of the query
+        :return: the registered query of the given document
+        """
+        query = self.__lookup(self.__queries, document)
+        if query is None:
+            query = GraphQlQuery(name, document, hashlib.sha256(document.encode()).hexdigest())
+            query = self.__register(self.__queries, document, query)
+        return query
+
+    def node(self, node_type: str, output_schema: str) -> GraphQlQuery:
+        """
+        :return: the query of :meth:`github.Requester.Requester.graphql_node`
+        """
+        key = ("node", node_type, output_schema)
+        query = self.__template(key)
+        if query is None:
+            document = (
+                """
+            query Q($id: ID!) {
+              node(id: $id) {
+                __typename
+                ... on """
+                + f"{node_type} {{{self.__schema(output_schema)}}}"
+                + """
+              }
+            }
+            """
+            )
+            query = self.__registerTemplate(key, document, f"node:{node_type}")
+        return query
+
+    def nodes(self, node_type: str, output_schema: str) -> GraphQlQuery:
+        """
+        :return: the query of :meth:`github.Requester.Requester.graphql_nodes`
+        """
+        key = ("nodes", node_type, output_schema)
+        query = self.__template(key)
+        if query is None:
+            document = (
+                """
+            query Q($ids: [ID!]!) {
+              nodes(ids: $ids) {
+                __typename
+                ... on """
+                + f"{node_type} {{{self.__schema(output_schema)}}}"
+                + """
+              }
+            }
+            """
+            )
+            query = self.__registerTemplate(key, document, f"nodes:{node_type}")
+        return query
+
+    def named_mutation(self, mutation_name: str, output_schema: str) -> GraphQlQuery:
+        """
+        :return: the query of :meth:`github.Requester.Requester.graphql_named_mutation`
+        """
+        key = ("mutation", mutation_name, output_schema)
+        query = self.__template(key)
+        if query is None:
+            mutation_input_name = mutation_name[:1].upper() + mutation_name[1:] + "Input!"
+            document = (
+                f"mutation Mutation($input: {mutation_input_name}) "
+                f"{{ {mutation_name}(input: $input) {{ {output_schema} }} }}"
+            )
+            query = self.__registerTemplate(key, document, f"mutation:{mutation_name}")
+        return query
+
+    @staticmethod
+    def __schema(output_schema: str) -> str:
+        if not output_schema.startswith("\n"):
+            return f" {output_schema} "
+        return output_schema
+
+    def __template(self, key: tuple[str, str, str]) -> GraphQlQuery | None:
+        query = self.__lookup(self.__templates, key)
+        if query is not None:
+            # the document of the template is used again
+            self.__register(self.__queries, query.document, query)
+        return query
+
+    def __registerTemplate(self, key: tuple[str, str, str], document: str, name: str) -> GraphQlQuery:
+        return self.__register(self.__templates, key, self.query(document, name))
+
+    def __lookup(self, entries: OrderedDict[K, GraphQlQuery], key: K) -> GraphQlQuery | None:
+        with self.__lock:
+            query = entries.get(key)
+            if query is not None:
+                entries.move_to_end(key)
+            return query
+
+    def __register(self, entries: OrderedDict[K, GraphQlQuery], key: K, query: GraphQlQuery) -> GraphQlQuery:
+        # returns the query registered first, discards the least recently used queries
+        with self.__lock:
+            if self.__maxsize == 0:
+                return query
+            query = entries.setdefault(key, query)
+            entries.move_to_end(key)
+            while len(entries) > self.__maxsize:
+                entries.popitem(last=False)
+            return query
+
+
+# the registry used by all requesters
+registry = GraphQlQueryRegistry()
@@ -0,0 +1,126 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from github.Concurrency import LockPicklingMixin
+
+if TYPE_CHECKING:
+    from github.GithubObject import GithubObject
+    from github.Requester import Requester
+
+T_gh = TypeVar("T_gh", bound="GithubObject")
+
+
+class IdentityMap(LockPicklingMixin):
+    """
+    This class shares nested objects of the same resource.
+
+    An identity map given to :class:`github.Github` or :class:`github.Requester.Requester` is used whenever an object
+    creates a nested object, e.g. ``Issue.user`` or ``Issue.repository``. Nested completable objects of the same class
+    and ``url`` (or ``node_id``) are then a single instance, as long as that instance is referenced elsewhere: listing
+    100 issues of the same author creates a single :class:`github.NamedUser.NamedUser`, which is completed at most once.
+
+    The first object created for a resource is shared, later occurrences of the same resource do not update it.
+    Create a new identity map, or :meth:`clear` it, to scope sharing, e.g. to a single listing.
+
+    """
+
+    _locks = ("_IdentityMap__lock",)
+
+    def __init__(self) -> None:
+        self.__objects: weakref.WeakValueDictionary[tuple[Any, ...], GithubObject] = weakref.WeakValueDictionary()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        # __objects is not picklable
+        del state["_IdentityMap__objects"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self.__objects = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of nested objects that were shared.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of nested objects that were created.
+        """
+        return self.__misses
+
+    @staticmethod
+    def key(klass: type[GithubObject], requester: Requester, attributes: Any) -> tuple[Any, ...] | None:
+        """
+        Returns the key of the object of the given class created from given attributes, or None if the object cannot
+        be shared.
+
+        Objects created by different requesters are not shared, as their requester may authenticate differently.
+        """
+        if not isinstance(attributes, dict):
+            return None
+        identity = attributes.get("url") or attributes.get("node_id")
+        if not isinstance(identity, str):
+            return None
+        return klass, id(requester), identity
+
+    def get(self, klass: type[T_gh], requester: Requester, headers: dict[str, str | int], attributes: Any) -> T_gh:
+        """
+        Returns the object of the given class for the given attributes, which is created if not shared yet.
+
+        Only completable objects should be shared, as they complete attributes missing in the shared object.
+        """
+        key = self.key(klass, requester, attributes)
+        if key is None:
+            return klass(requester, headers, attributes)
+        with self.__lock:
+            obj = self.__objects.get(key)
+            if obj is not None:
+                self.__hits += 1
+                return obj  # type: ignore
+        # created outside the lock, as creating the object creates its nested objects
+        obj = klass(requester, headers, attributes)
+        with self.__lock:
+            self.__misses += 1
+            return self.__objects.setdefault(key, obj)  # type: ignore
+
+    def clear(self) -> None:
+        """
+        Stops sharing all objects created so far.
+        """
+        with self.__lock:
+            self.__objects.clear()
@@ -0,0 +1,226 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import os
+import threading
+from abc import ABC
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from github.Concurrency import LockPicklingMixin, atomic_write
+
+try:
+    import fcntl
+except ImportError:  # pragma no cover (fcntl is not available on Windows)
+    fcntl = None  # type: ignore
+
+DEFAULT_MAX_SIZE = 1024
+LOCK_STRIPES = 64
+
+
+class InstallationTokenCache(LockPicklingMixin, ABC):
+    """
+    This class is the base class of all installation access token caches.
+
+    A cache stores the attributes of :class:`github.InstallationAuthorization.InstallationAuthorization` instances,
+    so that :class:`github.Auth.AppInstallationAuth` instances of the same installation and permissions share an
+    access token, instead of each creating a new one. Entries are returned regardless of their expiry, the caller
+    decides whether an entry can still be used.
+
+    Calls to :meth:`lock` with the same key are serialized, so that only one caller creates a new token while other
+    callers wait for that token. Keys are mapped to a fixed number of locks, so calls with different keys may also
+    be serialized.
+
+    """
+
+    def __init__(self) -> None:
+        # a lock per key would grow with every key ever locked
+        self.__locks = tuple(threading.Lock() for _ in range(LOCK_STRIPES))
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        # the locks are not picklable
+        del state["_InstallationTokenCache__locks"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self.__locks = tuple(threading.Lock() for _ in range(LOCK_STRIPES))
+
+    @staticmethod
+    def key(app_id: int | str, base_url: str, installation_id: int, permissions: dict[str, str] | None) -> str:
+        """
+        Returns the cache key of an installation access token.
+        """
+        return json.dumps([str(app_id), base_url, installation_id, permissions or {}], sort_keys=True)
+
+    @abc.abstractmethod
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Returns the attributes of the access token stored for the given key, or None.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, attributes: dict[str, Any]) -> None:
+        """
+        Stores the attributes of an access token for the given key.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the access token stored for the given key, if any.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Removes all access tokens.
+        """
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """
+        Context manager that holds an exclusive lock for the given key.
+        """
+        with self.__locks[hash(key) % len(self.__locks)]:
+            yield
+
+
+class MemoryInstallationTokenCache(InstallationTokenCache):
+    """
+    This class caches installation access tokens in memory.
+
+    The least recently used entries are discarded once more than ``max_size`` tokens are stored.
+
+    """
+
+    _locks = (*InstallationTokenCache._locks, "_MemoryInstallationTokenCache__entries_lock")
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        super().__init__()
+        assert isinstance(max_size, int) and max_size > 0, max_size
+        self._max_size = max_size
+        self.__entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.__entries_lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self.__entries_lock:
+            attributes = self.__entries.get(key)
+            if attributes is not None:
+                self.__entries.move_to_end(key)
+            return attributes
+
+    def set(self, key: str, attributes: dict[str, Any]) -> None:
+        with self.__entries_lock:
+            self.__entries[key] = attributes
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self._max_size:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.__entries_lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__entries_lock:
+            self.__entries.clear()
+
+
+class FileInstallationTokenCache(InstallationTokenCache):
+    """
+    This class caches installation access tokens as files in a directory.
+
+    Multiple processes can share a directory. Where supported (POSIX), :meth:`lock` also holds a file lock, so that
+    only one process creates a new token while other processes wait for that token.
+
+    Files are created readable by the current user only, but they contain access tokens in plain text.
+
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        assert isinstance(directory, str) and len(directory) > 0, directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._directory = directory
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def __path(self, key: str, suffix: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, f"{name}{suffix}")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            with open(self.__path(key, ".json"), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        return entry.get("attributes")
+
+    def set(self, key: str, attributes: dict[str, Any]) -> None:
+        with atomic_write(self.__path(key, ".json"), "w", encoding="utf-8") as f:
+            json.dump({"key": key, "attributes": attributes}, f)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self.__path(key, ".json"))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self._directory):
+            if name.endswith(".json"):
+                try:
+                    os.unlink(os.path.join(self._directory, name))
+                except FileNotFoundError:
+                    pass
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with super().lock(key):
+            if fcntl is None:  # pragma no cover (fcntl is not available on Windows)
+                yield
+                return
+            with open(self.__path(key, ".lock"), "a") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
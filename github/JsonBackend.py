@@ -0,0 +1,97 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import json
+from abc import ABC
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma no cover (orjson installed in tests)
+    orjson = None  # type: ignore
+
+
+class JsonBackend(ABC):
+    """
+    This class is the base class of all JSON backends.
+
+    A JSON backend given to :class:`github.Github` or :class:`github.Requester.Requester` decodes the JSON bodies of
+    responses and encodes the JSON bodies of requests. Backends decode ``bytes`` as well as ``str``, so bodies that are
+    available as raw bytes are decoded without creating an intermediate string.
+
+    """
+
+    @abc.abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Decodes the given JSON document. Raises a :class:`ValueError` if it is not valid JSON.
+        """
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """
+        Encodes the given object as a JSON document.
+        """
+
+    @staticmethod
+    def fastest() -> JsonBackend:
+        """
+        Returns the fastest JSON backend available in this environment.
+        """
+        if orjson is not None:
+            return OrjsonJsonBackend()
+        return StdlibJsonBackend()
+
+
+class StdlibJsonBackend(JsonBackend):
+    """
+    This class encodes and decodes JSON with the :mod:`json` module of the standard library.
+    """
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonJsonBackend(JsonBackend):
+    """
+    This class encodes and decodes JSON with `orjson <https://github.com/ijl/orjson>`__, which is considerably faster
+    than the standard library for large responses like pages of 100 items.
+
+    Requires the orjson package: ``pip install PyGithub[orjson]``.
+
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:  # pragma no cover (orjson installed in tests)
+            raise ImportError("OrjsonJsonBackend requires the orjson package: pip install PyGithub[orjson]")
+
+    def loads(self, data: str | bytes) -> Any:
+        # orjson.JSONDecodeError is a json.JSONDecodeError, so callers handle errors of both backends alike
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
@@ -138,8 +138,12 @@ from github.GithubObject import (
     is_undefined,
 )
 from github.GithubRetry import GithubRetry
+from github.IdentityMap import IdentityMap
+from github.JsonBackend import JsonBackend
 from github.PaginatedList import PaginatedList
+from github.RateLimitScheduler import RateLimitScheduler
 from github.Requester import Requester
+from github.ResponseCache import ResponseCache
 
 if TYPE_CHECKING:
     from github.AppAuthentication import AppAuthentication
@@ -206,6 +210,14 @@ class Github:
         # v3: set lazy = True as the default
         lazy: bool = False,
         api_version: str | None = None,
+        response_cache: ResponseCache | None = None,
+        rate_limit_scheduler: RateLimitScheduler | None = None,
+        json_backend: JsonBackend | None = None,
+        lazy_attributes: bool = False,
+        retain_raw_data: bool = True,
+        identity_map: IdentityMap | None = None,
+        persisted_graphql_queries: bool = False,
+        processing_202_retries: int = Consts.DEFAULT_PROCESSING_202_RETRIES,
     ) -> None:
         """
         :param login_or_token: string deprecated, use auth=github.Auth.Login(...) or auth=github.Auth.Token(...) instead
@@ -229,6 +241,25 @@ class Github:
         :param api_version: string, GitHub API version to use (see https://docs.github.com/en/rest/about-the-rest-api/api-versions).
                             Note that some PyGithub methods might downgrade this version if it is not supported by the implementation.
                             Set to None to not specify any version
+        :param response_cache: github.ResponseCache.ResponseCache, caches responses of GET requests and revalidates
+                               them with conditional requests, see :class:`github.ResponseCache.ResponseCache`
+        :param rate_limit_scheduler: github.RateLimitScheduler.RateLimitScheduler, paces requests to spread the
+                                     remaining rate limit, see :class:`github.RateLimitScheduler.RateLimitScheduler`
+        :param json_backend: github.JsonBackend.JsonBackend, decodes and encodes JSON bodies, defaults to the json
+                             module of the standard library, see :class:`github.JsonBackend.JsonBackend`
+        :param lazy_attributes: attributes of objects created from this instance are decoded from the raw data
+                                on first access instead of when the object is created
+        :param retain_raw_data: objects created from this instance keep their raw data and response headers,
+                                set to False to discard them once decoded, see :attr:`GithubObject.raw_data`
+        :param identity_map: github.IdentityMap.IdentityMap, shares nested objects of the same resource created from
+                             this instance, see :class:`github.IdentityMap.IdentityMap`
+        :param persisted_graphql_queries: GraphQL requests refer to query documents by hash, which requires a GraphQL
+                                          server or proxy that supports persisted queries,
+                                          see :class:`github.GraphQlQuery.GraphQlQueryRegistry`
+        :param processing_202_retries: int, number of retries of GET requests while GitHub is computing the response
+                                       (status 202), waiting exponentially longer, then a GithubException is raised,
+                                       0 returns no data right away, see :class:`github.StatsPoller.StatsPoller` to
+                                       not block on statistics
         """
 
         assert login_or_token is None or isinstance(login_or_token, str), login_or_token
@@ -246,6 +277,16 @@ class Github:
         assert auth is None or isinstance(auth, github.Auth.Auth), auth
         assert isinstance(lazy, bool), lazy
         assert api_version is None or isinstance(api_version, str), api_version
+        assert response_cache is None or isinstance(response_cache, ResponseCache), response_cache
+        assert rate_limit_scheduler is None or isinstance(
+            rate_limit_scheduler, RateLimitScheduler
+        ), rate_limit_scheduler
+        assert json_backend is None or isinstance(json_backend, JsonBackend), json_backend
+        assert isinstance(lazy_attributes, bool), lazy_attributes
+        assert isinstance(retain_raw_data, bool), retain_raw_data
+        assert identity_map is None or isinstance(identity_map, IdentityMap), identity_map
+        assert isinstance(persisted_graphql_queries, bool), persisted_graphql_queries
+        assert isinstance(processing_202_retries, int) and processing_202_retries >= 0, processing_202_retries
 
         if password is not None:
             warnings.warn(
@@ -289,6 +330,14 @@ class Github:
             seconds_between_writes,
             lazy,
             api_version,
+            response_cache,
+            rate_limit_scheduler,
+            json_backend,
+            lazy_attributes,
+            retain_raw_data,
+            identity_map,
+            persisted_graphql_queries,
+            processing_202_retries,
         )
 
     def withLazy(self, lazy: bool) -> Github:
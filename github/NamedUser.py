@@ -102,6 +102,25 @@ class NamedUser(github.GithubObject.CompletableGithubObject):
 
     """
 
+    # attributes retrieved by CompletableGithubObject.complete_all(..., graphql=True)
+    _graphql_node_type = "User"
+    _graphql_schema = """
+        avatarUrl
+        bio
+        blog: websiteUrl
+        company
+        createdAt
+        databaseId
+        hireable: isHireable
+        id
+        location
+        login
+        name
+        twitterUsername
+        updatedAt
+        url
+    """
+
     def _initAttributes(self) -> None:
         self._avatar_url: Attribute[str] = NotSet
         self._bio: Attribute[str | None] = NotSet
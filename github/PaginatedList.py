@@ -57,14 +57,37 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable, Iterator
-from typing import Any, Generic, TypeVar, overload
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar, overload
 
 from github import Consts
-from github.GithubObject import GithubObject
+from github.GithubException import GithubException, RateLimitExceededException
+from github.GithubObject import CompletableGithubObject, GithubObject, NotSet, Opt, is_undefined
 from github.Requester import Requester
 
+if TYPE_CHECKING:
+    from github.AsyncPaginatedList import AsyncPaginatedList
+    from github.AsyncRequester import AsyncRequester
+    from github.EventPoller import EventFeed
+    from github.ShardedSearch import ShardedSearch
+
 T = TypeVar("T", bound=GithubObject)
+R = TypeVar("R")
+
+
+class GraphQlPageCost(NamedTuple):
+    """
+    The cost of a page fetched via GraphQL, as reported by GitHub's ``rateLimit`` object.
+    """
+
+    page_size: int
+    nodes: int
+    cost: int | None
+    remaining: int | None
 
 
 class PaginatedListBase(Generic[T]):
@@ -110,9 +133,15 @@ class PaginatedListBase(Generic[T]):
 
     def _grow(self) -> list[T]:
         newElements = self._fetchNextPage()
-        self.__elements += newElements
+        self._addElements(newElements)
         return newElements
 
+    def _addElements(self, newElements: list[T]) -> None:
+        self.__elements += newElements
+
+    def _fetchedElements(self) -> list[T]:
+        return list(self.__elements)
+
     def _clear(self) -> None:
         self.__elements.clear()
 
@@ -181,6 +210,18 @@ class PaginatedList(PaginatedListBase[T]):
     Paginated lists are returned by ``get_…`` methods. Additionally, some classes have one property
     that is a paginated list, called `paginated property <https://pygithub.readthedocs.io/en/stable/utilities.html#classes-with-paginated-properties>`_.
 
+    Pages of the REST API can be fetched concurrently while iterating in order::
+
+        for issue in repo.get_issues().prefetch(workers=8):
+            print(issue.title)
+
+    Pages of the GraphQL API are sized to stay within GitHub's node limit, and optionally within a cost budget per
+    page. The cost of each page is available after fetching it::
+
+        comments = discussion.get_comments("id body").with_graphql_max_cost(1)
+        bodies = [comment.body for comment in comments]
+        print(sum(page.cost for page in comments.graphql_page_costs))
+
     You can check if GitHub search returned `incomplete results <https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#timeouts-and-incomplete-results>`_::
 
         results = gh.search_code("query")
@@ -205,6 +246,8 @@ class PaginatedList(PaginatedListBase[T]):
         attributesTransformer: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
         graphql_query: str | None = None,
         graphql_variables: dict[str, Any] | None = None,
+        retain_raw_data: Opt[bool] = NotSet,
+        graphql_max_cost: int | None = None,
     ):
         if firstUrl is None and firstData is None and graphql_query is None:
             raise ValueError("Either firstUrl or graphql_query must be given")
@@ -213,6 +256,13 @@ class PaginatedList(PaginatedListBase[T]):
         if graphql_query is not None:
             if not (isinstance(list_item, list) and all(isinstance(item, str) for item in list_item)):
                 raise ValueError("With graphql_query given, item_list must be a list of strings")
+            # the cost of each page is reported in the rateLimit object
+            if "rateLimit" not in graphql_query:
+                # imported here to avoid circular import
+                from github.GraphQlBatcher import add_rate_limit
+
+                graphql_query = add_rate_limit(graphql_query)
+        assert graphql_max_cost is None or graphql_max_cost > 0, graphql_max_cost
 
         firstParams = firstParams or {}
 
@@ -223,6 +273,11 @@ class PaginatedList(PaginatedListBase[T]):
 
         self.__requester = requester
         self.__contentClass = contentClass
+        self.__retain_raw_data = retain_raw_data
+        # elements of this list may discard their raw data independently of the requester
+        self.__elementRequester = (
+            requester if is_undefined(retain_raw_data) else requester.withRetainRawData(retain_raw_data)
+        )
 
         self.__is_rest = firstUrl is not None or firstData is not None
         self.__firstUrl = firstUrl
@@ -243,6 +298,10 @@ class PaginatedList(PaginatedListBase[T]):
 
         self.__graphql_query = graphql_query
         self.__graphql_variables = graphql_variables or {}
+        self.__graphql_max_cost = graphql_max_cost
+        self.__graphql_max_page_size: int | None = None
+        self.__graphql_page_size: int | None = None
+        self.__graphql_page_costs: list[GraphQlPageCost] = []
         self.__page_info = None
 
         first_page = []
@@ -275,7 +334,7 @@ class PaginatedList(PaginatedListBase[T]):
             headers, data = self.__requester.requestJsonAndCheck(
                 "GET", self.__firstUrl, parameters=params, headers=self.__headers  # type: ignore
             )
-            links = self.__parseLinkHeader(headers)
+            links = self.parse_link_header(headers)
             lastUrl = links.get("last")
 
             # update totalCount
@@ -328,12 +387,55 @@ class PaginatedList(PaginatedListBase[T]):
         headers, data = self.__requester.requestJsonAndCheck(
             "GET", self.__firstUrl, parameters=self.__nextParams, headers=self.__headers  # type: ignore
         )
-        links = self.__parseLinkHeader(headers)
+        links = self.parse_link_header(headers)
         return links.get("last")
 
+    @property
+    def graphql_page_costs(self) -> list[GraphQlPageCost]:
+        """
+        The page size, estimated nodes, cost and remaining rate limit of each page fetched so far via GraphQL.
+        """
+        return list(self.__graphql_page_costs)
+
     @property
     def reversed(self) -> PaginatedList[T]:
-        r = PaginatedList(
+        r = self.__copy(self.__retain_raw_data, self.__graphql_max_cost)
+        r.__reverse()
+        return r
+
+    def with_retain_raw_data(self, retain_raw_data: bool) -> PaginatedList[T]:
+        """
+        A copy of this list whose elements keep or discard their raw data and response headers, regardless of the
+        ``retain_raw_data`` setting of the :class:`github.MainClass.Github` instance::
+
+            for issue in repo.get_issues().with_retain_raw_data(False):
+                issues.append(issue)
+
+        :param retain_raw_data: if False, elements discard their raw data and response headers once decoded
+        :return: new PaginatedList instance
+
+        """
+        assert isinstance(retain_raw_data, bool), retain_raw_data
+        return self.__copy(retain_raw_data, self.__graphql_max_cost)
+
+    def with_graphql_max_cost(self, max_cost: int) -> PaginatedList[T]:
+        """
+        A copy of this GraphQL list whose page size adapts to the cost of fetched pages, so that pages cost at most
+        ``max_cost`` rate limit points, while still staying within ``per_page`` and GitHub's node limit::
+
+            for comment in discussion.get_comments(schema).with_graphql_max_cost(1):
+                print(comment.body)
+
+        :param max_cost: maximum cost of a page in rate limit points
+        :return: new PaginatedList instance
+
+        """
+        if self.is_rest:
+            raise RuntimeError("Only supported for GraphQL pagination")
+        return self.__copy(self.__retain_raw_data, max_cost)
+
+    def __copy(self, retain_raw_data: Opt[bool], graphql_max_cost: int | None) -> PaginatedList[T]:
+        return PaginatedList(
             self.__contentClass,
             self.__requester,
             self.__firstUrl,
@@ -346,9 +448,9 @@ class PaginatedList(PaginatedListBase[T]):
             attributesTransformer=self._attributesTransformer,
             graphql_query=self.__graphql_query,
             graphql_variables=self.__graphql_variables,
+            retain_raw_data=retain_raw_data,
+            graphql_max_cost=graphql_max_cost,
         )
-        r.__reverse()
-        return r
 
     def __reverse(self) -> None:
         self._reversed = True
@@ -403,26 +505,56 @@ class PaginatedList(PaginatedListBase[T]):
             return self._getPage(data, headers)
         else:
             # GraphQL API pagination
+            page_size = self.__graphqlPageSize()
             variables = self.__graphql_variables.copy()
             if not self._reversed:
-                variables["first"] = self.__requester.per_page
+                variables["first"] = page_size
                 if self.__page_info is not None:
                     variables["after"] = self.__page_info["endCursor"]
             else:
-                variables["last"] = self.__requester.per_page
+                variables["last"] = page_size
                 if self.__page_info is not None:
                     variables["before"] = self.__page_info["startCursor"]
 
             _, data = self.__requester.graphql_query(self.__graphql_query, variables)  # type: ignore
+            from github.GraphQlBatcher import estimate_nodes
+
+            self.__useGraphQlPageCost(page_size, estimate_nodes(self.__graphql_query, variables), data["data"])  # type: ignore
 
             pagination = self._get_graphql_pagination(data["data"], self.__list_item)  # type: ignore
             return self._getPage(pagination, {})
 
+    def __graphqlPageSize(self) -> int:
+        if self.__graphql_max_page_size is None:
+            # nodes grow linearly with the page size, the largest page within the node limit is derived from two sizes
+            key = "last" if self._reversed else "first"
+            from github.GraphQlBatcher import estimate_nodes
+
+            one, two = (
+                estimate_nodes(self.__graphql_query, {**self.__graphql_variables, key: size})  # type: ignore
+                for size in (1, 2)
+            )
+            per_element = max(two - one, 1)
+            max_page_size = (Consts.MAX_GRAPHQL_QUERY_NODES - one) // per_element + 1
+            self.__graphql_max_page_size = max(1, min(self.__requester.per_page, max_page_size))
+        if self.__graphql_page_size is None:
+            self.__graphql_page_size = self.__graphql_max_page_size
+        return self.__graphql_page_size
+
+    def __useGraphQlPageCost(self, page_size: int, nodes: int, data: dict[str, Any]) -> None:
+        rate_limit = data.get("rateLimit") or {}
+        cost = rate_limit.get("cost")
+        self.__graphql_page_costs.append(GraphQlPageCost(page_size, nodes, cost, rate_limit.get("remaining")))
+        if self.__graphql_max_cost is not None and cost:
+            # the cost grows linearly with the page size
+            page_size = self.__graphql_max_cost * page_size // cost
+            self.__graphql_page_size = max(1, min(self.__graphql_max_page_size, page_size))  # type: ignore
+
     def _getPage(self, data: Any, headers: dict[str, str | int] | None) -> list[T]:
         if self.is_rest:
             self.__nextUrl = None  # type: ignore
             if len(data) > 0:
-                links = self.__parseLinkHeader(headers)  # type: ignore
+                links = self.parse_link_header(headers)  # type: ignore
                 if self._reversed:
                     if "prev" in links:
                         self.__nextUrl = links["prev"]
@@ -437,7 +569,7 @@ class PaginatedList(PaginatedListBase[T]):
                 self.__totalCount = data.get(self.__total_count_item)
                 data = data[self.__list_item]
             content = [
-                self.__contentClass(self.__requester, headers, self._transformAttributes(element))  # type: ignore
+                self.__contentClass(self.__elementRequester, headers, self._transformAttributes(element))  # type: ignore
                 for element in data
                 if element is not None
             ]
@@ -468,9 +600,19 @@ class PaginatedList(PaginatedListBase[T]):
             nodes = data["nodes"]
             if self._reversed:
                 nodes = nodes[::-1]
-            return [self.__contentClass(self.__requester, {}, element) for element in nodes if element is not None]
+            return [
+                self.__contentClass(self.__elementRequester, {}, element) for element in nodes if element is not None
+            ]
+
+    @staticmethod
+    def parse_link_header(headers: dict[str, Any]) -> dict[str, str]:
+        """
+        Parses the ``Link`` header of a REST API response.
 
-    def __parseLinkHeader(self, headers: dict[str, str | int]) -> dict[str, str]:
+        :param headers: response headers with lower-case names
+        :return: urls by relation, e.g. ``next`` and ``last``
+
+        """
         links = {}
         if "link" in headers and isinstance(headers["link"], str):
             linkHeaders = headers["link"].split(", ")
@@ -499,7 +641,267 @@ class PaginatedList(PaginatedListBase[T]):
             if "incomplete_results" in data:
                 self.__incomplete_results = data.get("incomplete_results")
             data = data[self.__list_item]
-        return [self.__contentClass(self.__requester, headers, self._transformAttributes(element)) for element in data]
+        return [
+            self.__contentClass(self.__elementRequester, headers, self._transformAttributes(element))
+            for element in data
+        ]
+
+    def complete(self, workers: int = Consts.DEFAULT_COMPLETE_WORKERS, graphql: bool = False) -> list[T]:
+        """
+        Fetches all elements of this list and completes them concurrently::
+
+            repos = g.get_user().get_starred().complete(workers=8)
+
+        See :meth:`github.GithubObject.CompletableGithubObject.complete_all` for details.
+
+        :param workers: number of concurrent requests
+        :param graphql: retrieve attributes via GraphQL where supported
+        :return: all elements of this list
+
+        """
+        return CompletableGithubObject.complete_all(self, workers=workers, graphql=graphql)
+
+    def sharded(
+        self,
+        qualifier: str,
+        start: date | int | None = None,
+        end: date | int | None = None,
+        workers: int = Consts.DEFAULT_SEARCH_SHARD_WORKERS,
+    ) -> ShardedSearch[T]:
+        """
+        All results of this search, beyond the 1000 results the search API returns per query, by splitting the query
+        into ranges of the given qualifier::
+
+            for issue in g.search_issues("is:issue label:bug").sharded("created"):
+                print(issue.title)
+
+            for repo in g.search_repositories("language:python").sharded("stars", start=100, end=500_000):
+                print(repo.full_name)
+
+        See :class:`github.ShardedSearch.ShardedSearch` for details.
+
+        :param qualifier: qualifier that splits the query, e.g. ``created``, ``updated``, ``pushed``, ``stars`` or
+                          ``size``, which must not be part of the query
+        :param start: first date or value of the qualifier, dates default to the launch of GitHub
+        :param end: last date or value of the qualifier, a date includes the entire day, dates default to now
+        :param workers: number of shards counted or fetched concurrently
+        :return: iterable over all results
+
+        """
+        if self.__firstUrl is None or "/search/" not in self.__firstUrl:
+            raise RuntimeError("Only supported for search results")
+
+        # imported here to avoid circular import
+        from github.ShardedSearch import ShardedSearch
+
+        return ShardedSearch(
+            self.__contentClass,
+            self.__requester,
+            self.__firstUrl,
+            self.__firstParams,
+            self.__headers,
+            qualifier,
+            start,
+            end,
+            workers,
+        )
+
+    def feed(self, seen_size: int = Consts.DEFAULT_POLL_SEEN_SIZE) -> EventFeed[T]:
+        """
+        A feed that polls this list of events or notifications for new elements, with conditional requests that
+        honor the ``X-Poll-Interval`` of GitHub::
+
+            feed = repo.get_events().feed()
+            while True:
+                for event in feed.poll():
+                    print(event.type)
+                time.sleep(feed.poll_interval)
+
+        See :class:`github.EventPoller.EventFeed` for details.
+
+        :param seen_size: number of most recent elements remembered to detect elements seen before
+        :return: feed of this list
+
+        """
+        if self.__firstUrl is None:
+            raise RuntimeError("Only supported for REST lists")
+
+        # imported here to avoid circular import
+        from github.EventPoller import EventFeed
+
+        return EventFeed(
+            self.__contentClass,
+            self.__requester,
+            self.__firstUrl,
+            self.__firstParams,
+            self.__headers,
+            seen_size,
+        )
+
+    def map_concurrent(
+        self,
+        fn: Callable[[T], R],
+        workers: int = Consts.DEFAULT_MAP_WORKERS,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+    ) -> Iterator[tuple[T, R | GithubException]]:
+        """
+        Calls ``fn`` for all elements of this list concurrently, and yields each element with its result::
+
+            for pull, reviews in repo.get_pulls().map_concurrent(lambda pull: list(pull.get_reviews())):
+                if not isinstance(reviews, GithubException):
+                    print(pull.number, len(reviews))
+
+        Elements are fetched page by page while ``fn`` is called by ``workers`` threads, at most as many as connections
+        in the pool of the requester. At most ``max_in_flight`` calls are submitted ahead of iteration. Requests of all
+        threads are paced by ``seconds_between_requests``, ``seconds_between_writes`` and the ``rate_limit_scheduler``
+        of the :class:`github.MainClass.Github` instance.
+
+        A :class:`github.GithubException.GithubException` raised by ``fn`` is yielded in place of the result of that
+        element. A :class:`github.GithubException.RateLimitExceededException` stops calling ``fn`` for further
+        elements and is raised, as are all other exceptions.
+
+        :param fn: function called for each element
+        :param workers: number of threads calling ``fn``
+        :param ordered: yield elements in list order, otherwise in order of completion
+        :param max_in_flight: number of calls submitted ahead of iteration, defaults to ``2 * workers``
+        :return: iterator over all elements of this list and their results
+
+        """
+        assert isinstance(workers, int) and workers > 0, workers
+        assert max_in_flight is None or (isinstance(max_in_flight, int) and max_in_flight > 0), max_in_flight
+        workers = min(workers, self.__requester.pool_size)
+        if max_in_flight is None:
+            max_in_flight = 2 * workers
+        return self.__mapConcurrent(fn, workers, ordered, max_in_flight)
+
+    def __mapConcurrent(
+        self, fn: Callable[[T], R], workers: int, ordered: bool, max_in_flight: int
+    ) -> Iterator[tuple[T, R | GithubException]]:
+        elements = iter(self)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="map_concurrent")
+        try:
+            # futures in order of submission
+            in_flight: dict[Future[R], T] = {}
+            while True:
+                for element in islice(elements, max_in_flight - len(in_flight)):
+                    in_flight[executor.submit(fn, element)] = element
+                if not in_flight:
+                    return
+
+                if ordered:
+                    future = next(iter(in_flight))
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = next(iter(done))
+                element = in_flight.pop(future)
+                try:
+                    result: R | GithubException = future.result()
+                except RateLimitExceededException:
+                    raise
+                except GithubException as e:
+                    result = e
+                yield element, result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def prefetch(
+        self, workers: int = Consts.DEFAULT_PREFETCH_WORKERS, max_pages_in_flight: int | None = None
+    ) -> Iterator[T]:
+        """
+        Iterates over all elements of this list, fetching pages concurrently.
+
+        Once the first page is fetched, its ``last`` link reveals the number of pages of the list. All remaining pages
+        are then fetched by ``workers`` threads, at most as many as connections in the pool of the requester, while
+        elements are yielded in list order. At most ``max_pages_in_flight`` pages are requested ahead of iteration,
+        which bounds the memory held by fetched but not yet iterated pages.
+
+        Iterates sequentially for GraphQL pagination, reversed lists, or when the API does not provide a ``last``
+        link with a page number.
+
+        :param workers: number of threads fetching pages
+        :param max_pages_in_flight: number of pages fetched ahead of iteration, defaults to ``2 * workers``
+        :return: iterator over all elements of this list
+
+        """
+        assert isinstance(workers, int) and workers > 0, workers
+        assert max_pages_in_flight is None or (
+            isinstance(max_pages_in_flight, int) and max_pages_in_flight > 0
+        ), max_pages_in_flight
+        workers = min(workers, self.__requester.pool_size)
+        if max_pages_in_flight is None:
+            max_pages_in_flight = 2 * workers
+        return self.__prefetch(workers, max_pages_in_flight)
+
+    def __prefetch(self, workers: int, max_pages_in_flight: int) -> Iterator[T]:
+        yield from self._fetchedElements()
+        if self.is_rest and not self._reversed:
+            # the first page provides the last page url
+            if self.__lastUrl is None and self._couldGrow():
+                yield from self._grow()
+
+            urls = iter(self.__remainingPageUrls())
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="PaginatedList")
+            try:
+                in_flight: deque[Future[tuple[dict[str, Any], Any]]] = deque(
+                    executor.submit(self.__fetchPage, url) for url in islice(urls, max_pages_in_flight)
+                )
+                while in_flight:
+                    headers, data = in_flight.popleft().result()
+                    url = next(urls, None)
+                    if url is not None:
+                        in_flight.append(executor.submit(self.__fetchPage, url))
+                    newElements = self._getPage(data if data else [], headers)
+                    self._addElements(newElements)
+                    yield from newElements
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        # follow pages not known when prefetching started, or iterate sequentially
+        while self._couldGrow():
+            yield from self._grow()
+
+    def __remainingPageUrls(self) -> list[str]:
+        if self.__nextUrl is None or self.__lastUrl is None:
+            return []
+        nextPage = Requester.get_parameters_of_url(self.__nextUrl).get("page")
+        lastPage = Requester.get_parameters_of_url(self.__lastUrl).get("page")
+        if not nextPage or not lastPage:
+            return []
+        return [
+            Requester.add_parameters_to_url(self.__nextUrl, {"page": page})
+            for page in range(int(nextPage[0]), int(lastPage[0]) + 1)
+        ]
+
+    def __fetchPage(self, url: str) -> tuple[dict[str, Any], Any]:
+        return self.__requester.requestJsonAndCheck("GET", url, headers=self.__headers)
+
+    def withAsyncRequester(self, requester: AsyncRequester) -> AsyncPaginatedList[T]:
+        """
+        Create an asynchronous list with identical configuration that fetches pages via the given requester.
+
+        :param requester: asynchronous requester
+        :return: new AsyncPaginatedList instance
+
+        """
+        if self.is_graphql:
+            raise RuntimeError("Not supported for GraphQL pagination")
+        if self.__firstUrl is None:
+            raise RuntimeError("Not supported for lists without url")
+
+        # imported here to avoid circular import
+        from github.AsyncPaginatedList import AsyncPaginatedList
+
+        return AsyncPaginatedList(
+            self.__contentClass,
+            requester,
+            self.__firstUrl,
+            self.__firstParams,
+            headers=self.__headers,
+            list_item=self.__list_item,  # type: ignore
+            total_count_item=self.__total_count_item,
+            attributesTransformer=self._attributesTransformer,
+        )
 
     @classmethod
     def override_attributes(cls, overrides: dict[str, Any]) -> Callable[[dict[str, Any]], dict[str, Any]]:
@@ -0,0 +1,244 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import json
+import os
+import threading
+import time
+import urllib.parse
+from abc import ABC
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from github import Consts
+from github.Concurrency import LockPicklingMixin
+
+try:
+    import fcntl
+except ImportError:  # pragma no cover (fcntl is not available on Windows)
+    fcntl = None  # type: ignore
+
+DEFAULT_BURST = 50
+
+RESOURCE_CORE = "core"
+RESOURCE_SEARCH = "search"
+RESOURCE_CODE_SEARCH = "code_search"
+RESOURCE_GRAPHQL = "graphql"
+
+
+class RateLimitState(ABC):
+    """
+    This class is the base class of all storages of :class:`RateLimitScheduler` budgets.
+
+    The state is a JSON-serializable dict that maps resource names to budgets.
+
+    """
+
+    @abc.abstractmethod
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        """
+        Context manager that provides exclusive access to the state. Modifications of the provided dict are stored
+        when the context exits.
+        """
+
+
+class MemoryRateLimitState(LockPicklingMixin, RateLimitState):
+    """
+    This class stores budgets in memory, shared by all threads that use the same instance.
+
+    """
+
+    _locks = ("_MemoryRateLimitState__lock",)
+
+    def __init__(self) -> None:
+        self.__state: dict[str, Any] = {}
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        with self.__lock:
+            yield self.__state
+
+
+class FileRateLimitState(LockPicklingMixin, RateLimitState):
+    """
+    This class stores budgets in a file, shared by all processes that use the same file.
+
+    Access is serialized by a file lock where supported (POSIX).
+
+    """
+
+    _locks = ("_FileRateLimitState__lock",)
+
+    def __init__(self, path: str):
+        assert isinstance(path, str) and len(path) > 0, path
+        self._path = path
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        with self.__lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+", encoding="utf-8") as f:
+                if fcntl is not None:  # pragma no branch (fcntl is not available on Windows)
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    try:
+                        state = json.loads(f.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    if fcntl is not None:  # pragma no branch (fcntl is not available on Windows)
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class RateLimitScheduler:
+    """
+    This class paces requests so that the remaining rate limit budget is spread until the rate limit resets.
+
+    Each resource (``core``, ``search``, ``code_search``, ``graphql``, …) has a token bucket that refills at the rate
+    of remaining requests per second until reset, as reported by the ``X-RateLimit-*`` headers of the latest response.
+    Up to ``burst`` requests may be sent without delay. Once the remaining budget is exhausted, requests wait for the
+    reset. Until a response reports the budget of a resource, or after its reset, requests of that resource are
+    not delayed.
+
+    A scheduler given to :class:`github.Github` is shared by all threads using that instance. Budgets can be shared
+    across processes via :class:`FileRateLimitState`::
+
+        scheduler = RateLimitScheduler(state=FileRateLimitState("/tmp/github-rate-limit.json"))
+        g = Github(auth=auth, rate_limit_scheduler=scheduler)
+
+    """
+
+    def __init__(self, burst: int = DEFAULT_BURST, reserve: int = 0, state: RateLimitState | None = None):
+        """
+        :param burst: number of requests per resource that may be sent without delay
+        :param reserve: number of requests per resource that are not used, e.g. to leave budget to other clients
+        :param state: storage of budgets, defaults to a :class:`MemoryRateLimitState`
+        """
+        assert isinstance(burst, int) and burst >= 1, burst
+        assert isinstance(reserve, int) and reserve >= 0, reserve
+        assert state is None or isinstance(state, RateLimitState), state
+        self._burst = burst
+        self._reserve = reserve
+        self._state = state if state is not None else MemoryRateLimitState()
+
+    @property
+    def burst(self) -> int:
+        return self._burst
+
+    @property
+    def reserve(self) -> int:
+        return self._reserve
+
+    @property
+    def state(self) -> RateLimitState:
+        return self._state
+
+    @staticmethod
+    def resource(url: str, graphql_path: str) -> str:
+        """
+        Returns the rate limit resource of a request to the given absolute url or url path.
+
+        :param graphql_path: path of the GraphQL endpoint, including the prefix of the base url
+        """
+        path = urllib.parse.urlparse(url).path
+        if path == graphql_path:
+            return RESOURCE_GRAPHQL
+        if "/search/code" in path:
+            return RESOURCE_CODE_SEARCH
+        if "/search/" in path:
+            return RESOURCE_SEARCH
+        return RESOURCE_CORE
+
+    def budget(self, resource: str) -> dict[str, Any] | None:
+        """
+        Returns a copy of the budget of the given resource, or None if unknown.
+        """
+        with self._state.transaction() as state:
+            budget = state.get(resource)
+            return dict(budget) if budget is not None else None
+
+    def acquire(self, resource: str) -> float:
+        """
+        Reserves a request of the given resource.
+
+        :return: seconds the caller has to wait before sending the request
+        """
+        now = time.time()
+        with self._state.transaction() as state:
+            budget = state.get(resource)
+            if budget is None:
+                return 0.0
+            if now >= budget["reset"]:
+                # budget is unknown until a response reports the new budget
+                del state[resource]
+                return 0.0
+
+            if budget["remaining"] <= self._reserve:
+                # budget is exhausted, wait for reset
+                return budget["reset"] - now
+
+            rate = budget["rate"]
+            tokens = min(self._burst, budget["tokens"] + (now - budget["last"]) * rate)
+            budget["tokens"] = tokens - 1
+            budget["last"] = now
+            budget["remaining"] -= 1
+            # tokens become negative when requests are reserved ahead of time
+            return max(0.0, -budget["tokens"] / rate)
+
+    def update(self, resource: str, headers: dict[str, Any]) -> None:
+        """
+        Updates the budget from the ``X-RateLimit-*`` headers of a response of a request of the given resource.
+        The ``X-RateLimit-Resource`` header, if given, takes precedence over the given resource.
+        """
+        if Consts.headerRateRemaining not in headers or Consts.headerRateReset not in headers:
+            return
+        resource = headers.get(Consts.headerRateResource, resource)
+        now = time.time()
+        remaining = int(float(headers[Consts.headerRateRemaining]))
+        reset = int(float(headers[Consts.headerRateReset]))
+        with self._state.transaction() as state:
+            budget = state.get(resource)
+            if budget is None or budget["reset"] != reset or remaining < budget["remaining"]:
+                state[resource] = dict(
+                    remaining=remaining,
+                    reset=reset,
+                    # requests per second that spread the remaining budget until reset
+                    rate=max(remaining - self._reserve, 1) / max(reset - now, 1.0),
+                    # a fresh budget allows for a burst, a known budget keeps its reservations
+                    tokens=min(self._burst, budget["tokens"]) if budget is not None else self._burst,
+                    last=budget["last"] if budget is not None else now,
+                )
@@ -250,6 +250,7 @@ import github.StatsParticipation
 import github.StatsPunchCard
 import github.Tag
 import github.Team
+import github.TreeSnapshot
 import github.Variable
 import github.View
 import github.Workflow
@@ -341,6 +342,7 @@ if TYPE_CHECKING:
     from github.StatsPunchCard import StatsPunchCard
     from github.Tag import Tag
     from github.Team import Team
+    from github.TreeSnapshot import BlobCache, TreeSnapshot
     from github.Variable import Variable
     from github.View import View
     from github.Workflow import Workflow
@@ -368,6 +370,28 @@ class Repository(CompletableGithubObject):
 
     """
 
+    # attributes retrieved by CompletableGithubObject.complete_all(..., graphql=True)
+    _graphql_node_type = "Repository"
+    _graphql_schema = """
+        archived: isArchived
+        createdAt
+        databaseId
+        description
+        disabled: isDisabled
+        fork: isFork
+        forks_count: forkCount
+        full_name: nameWithOwner
+        homepage: homepageUrl
+        id
+        is_template: isTemplate
+        name
+        private: isPrivate
+        pushedAt
+        stargazers_count: stargazerCount
+        updatedAt
+        url
+    """
+
     def _initAttributes(self) -> None:
         self._allow_auto_merge: Attribute[bool] = NotSet
         self._allow_forking: Attribute[bool] = NotSet
@@ -3717,6 +3741,29 @@ class Repository(CompletableGithubObject):
         )
         return data["names"]
 
+    def get_tree_snapshot(
+        self,
+        ref: Opt[str] = NotSet,
+        path: str = "",
+        cache: BlobCache | None = None,
+        workers: int = Consts.DEFAULT_SNAPSHOT_WORKERS,
+        archive_threshold: int | None = Consts.DEFAULT_SNAPSHOT_ARCHIVE_THRESHOLD,
+    ) -> TreeSnapshot:
+        """
+        :calls: `GET /repos/{owner}/{repo}/git/trees/{tree_sha} <https://docs.github.com/en/rest/reference/git#trees>`_
+        :param ref: string, defaults to the default branch
+        :param path: string, directory of the snapshot, defaults to the root directory
+        :param cache: :class:`github.TreeSnapshot.BlobCache`, stores file contents by sha, defaults to a memory cache
+        :param workers: int, number of blobs fetched concurrently
+        :param archive_threshold: int, number of blobs missing from the cache above which the tarball of the ref is
+            downloaded instead, None to always fetch blobs
+        :rtype: :class:`github.TreeSnapshot.TreeSnapshot`
+        """
+        assert is_optional(ref, str), ref
+        if is_defined(ref):
+            return github.TreeSnapshot.TreeSnapshot(self, ref, path, cache, workers, archive_threshold)
+        return github.TreeSnapshot.TreeSnapshot(self, self.default_branch, path, cache, workers, archive_threshold)
+
     def get_watchers(self) -> PaginatedList[NamedUser]:
         """
         :calls: `GET /repos/{owner}/{repo}/watchers <https://docs.github.com/en/rest/reference/activity#starring>`_
@@ -0,0 +1,365 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import copy
+import json
+import os
+import threading
+from abc import ABC
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from github import Consts
+from github.Concurrency import LockPicklingMixin
+
+try:
+    import fcntl
+except ImportError:  # pragma no cover (fcntl is not available on Windows)
+    fcntl = None  # type: ignore
+
+if TYPE_CHECKING:
+    from github.GithubObject import GithubObject
+    from github.Repository import Repository
+
+RESOURCE_ISSUES = "issues"
+RESOURCE_ISSUE_COMMENTS = "issue_comments"
+RESOURCE_PULLS = "pulls"
+RESOURCE_COMMITS = "commits"
+RESOURCES = (RESOURCE_ISSUES, RESOURCE_ISSUE_COMMENTS, RESOURCE_PULLS, RESOURCE_COMMITS)
+
+ACTION_CREATED = "created"
+ACTION_UPDATED = "updated"
+
+
+class SyncEvent(NamedTuple):
+    """
+    A resource of a repository that has been created or updated since the previous synchronization.
+    """
+
+    repository: str
+    resource: str
+    action: str
+    object: GithubObject
+
+
+class SyncState(ABC):
+    """
+    This class is the base class of all storages of :class:`RepositorySync` high-water marks.
+
+    The state is a JSON-serializable dict that maps repository ids to their marks.
+
+    """
+
+    @abc.abstractmethod
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        """
+        Context manager that provides exclusive access to the state. Modifications of the provided dict are stored
+        when the context exits.
+        """
+
+
+class MemorySyncState(LockPicklingMixin, SyncState):
+    """
+    This class stores high-water marks in memory, shared by all threads that use the same instance.
+
+    """
+
+    _locks = ("_MemorySyncState__lock",)
+
+    def __init__(self) -> None:
+        self.__state: dict[str, Any] = {}
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        with self.__lock:
+            yield self.__state
+
+
+class FileSyncState(LockPicklingMixin, SyncState):
+    """
+    This class stores high-water marks in a file, which persists them across runs and can be shared by multiple
+    processes.
+
+    Access is serialized by a file lock where supported (POSIX).
+
+    """
+
+    _locks = ("_FileSyncState__lock",)
+
+    def __init__(self, path: str):
+        assert isinstance(path, str) and len(path) > 0, path
+        self._path = path
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        with self.__lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+", encoding="utf-8") as f:
+                if fcntl is not None:  # pragma no branch (fcntl is not available on Windows)
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    try:
+                        state = json.loads(f.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    if fcntl is not None:  # pragma no branch (fcntl is not available on Windows)
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class RepositorySync:
+    """
+    This class incrementally synchronizes issues, issue comments, pull requests and commits of a repository.
+
+    Each call of :meth:`sync` returns the resources created or updated since the previous call, as
+    :class:`SyncEvent`, and stores per resource a high-water mark in its :class:`SyncState`, keyed by the repository
+    id so that renaming a repository keeps its marks. For issues, issue comments and pull requests, the mark is the
+    latest ``updated_at`` and the ids of resources with that timestamp. For commits, the mark is the head sha of each
+    branch, as commit dates do not reflect when commits were pushed or merged. The first call returns all resources.
+
+    Only deltas are fetched, via the ``since`` parameter of issues and issue comments, by listing pull requests by
+    ``updated`` until the mark is reached, and by listing the commits of branches whose head moved until the
+    commits known from the previous heads are reached.
+
+    With ``check_events=True``, a conditional request of the repository events first checks the ``ETag`` stored by
+    the previous call. Unchanged repositories respond with ``304 Not Modified``, which does not count against the
+    rate limit, and are not listed at all. Not all changes emit a repository event, e.g. edited issue comments and
+    some pull request updates, those are only returned once an unrelated event occurs. Events also appear with a
+    delay of up to a few minutes, changes are then returned by a later call.
+
+    Marks are stored only once all resources are synchronized, so a failed call is repeated by the next call.
+
+    """
+
+    def __init__(
+        self,
+        repository: Repository,
+        state: SyncState | None = None,
+        resources: Iterable[str] = RESOURCES,
+        check_events: bool = False,
+    ):
+        resources = tuple(resources)
+        assert all(resource in RESOURCES for resource in resources), resources
+        assert state is None or isinstance(state, SyncState), state
+        self.__repository = repository
+        self.__state = state if state is not None else MemorySyncState()
+        self.__resources = resources
+        self.__check_events = check_events
+
+    @property
+    def state(self) -> SyncState:
+        return self.__state
+
+    @classmethod
+    def sync_all(
+        cls,
+        repositories: Iterable[Repository],
+        state: SyncState,
+        resources: Iterable[str] = RESOURCES,
+        check_events: bool = False,
+        workers: int = Consts.DEFAULT_SYNC_WORKERS,
+    ) -> Iterator[SyncEvent]:
+        """
+        Synchronizes many repositories concurrently, see :meth:`sync`::
+
+            repos = [g.get_repo(name, lazy=True) for name in names]
+            for event in RepositorySync.sync_all(repos, FileSyncState("sync.json")):
+                print(event.repository, event.resource, event.action)
+
+        :param repositories: repositories to synchronize
+        :param state: storage of the high-water marks of all repositories
+        :param resources: resources to synchronize
+        :param check_events: skip repositories whose events have not changed, which misses changes that emit no
+                             event until an unrelated event occurs
+        :param workers: number of repositories synchronized concurrently
+        :return: iterator over events of all repositories, in order of the repositories
+
+        """
+        assert isinstance(workers, int) and workers > 0, workers
+        syncs = [cls(repository, state, resources, check_events) for repository in repositories]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RepositorySync") as executor:
+            for events in executor.map(lambda sync: sync.sync(), syncs):
+                yield from events
+
+    def sync(self) -> list[SyncEvent]:
+        """
+        :return: resources created or updated since the previous call, per resource in order of their timestamps
+        """
+        key = str(self.__repository.id)
+        name = self.__repository.full_name
+        with self.__state.transaction() as state:
+            # marks used to be stored by repository name
+            marks = copy.deepcopy(state.get(key, state.get(name, {})))
+
+        etag = None
+        if self.__check_events:
+            etag = self.__eventsETag(marks.get("events", {}).get("etag"))
+            if etag is None:
+                return []
+
+        events = []
+        for resource in self.__resources:
+            mark = marks.get(resource, {})
+            if resource == RESOURCE_COMMITS:
+                resource_events, marks[resource] = self.__commits(name, mark)
+            else:
+                since = _parse(mark["since"]) if "since" in mark else None
+                resource_events, marks[resource] = self.__delta(name, resource, self.__list(resource, since), mark)
+            events.extend(resource_events)
+
+        if etag:
+            marks["events"] = {"etag": etag}
+        with self.__state.transaction() as state:
+            state.pop(name, None)
+            state[key] = marks
+        return events
+
+    def __eventsETag(self, etag: str | None) -> str | None:
+        # returns the current ETag of the repository events, or None if they have not changed
+        requester = self.__repository.requester
+        headers = {Consts.REQ_IF_NONE_MATCH: etag} if etag else {}
+        status, response_headers, output = requester.requestJson(
+            "GET", f"{self.__repository.url}/events", parameters={"per_page": 1}, headers=headers
+        )
+        if status == 304:
+            return None
+        if status >= 400:
+            raise requester.createException(status, response_headers, requester.json_backend.loads(output or "{}"))
+        return response_headers.get(Consts.RES_ETAG, "")
+
+    def __list(self, resource: str, since: datetime | None) -> Iterable[Any]:
+        # lists resources updated at or after since, ordered by timestamp
+        parameters: dict[str, Any] = {} if since is None else {"since": since}
+        if resource == RESOURCE_ISSUES:
+            return self.__repository.get_issues(state="all", sort="updated", direction="asc", **parameters)
+        if resource == RESOURCE_ISSUE_COMMENTS:
+            return self.__repository.get_issues_comments(sort="updated", direction="asc", **parameters)
+        # pull requests have no since parameter, they are listed by most recently updated until the mark is reached
+        pulls = []
+        for pull in self.__repository.get_pulls(state="all", sort="updated", direction="desc"):
+            if since is not None and pull.updated_at is not None and pull.updated_at < since:
+                break
+            pulls.append(pull)
+        return pulls[::-1]
+
+    def __commits(self, name: str, mark: dict[str, Any]) -> tuple[list[SyncEvent], dict[str, Any]]:
+        # commits reachable from the branch heads that are not reachable from the previous heads
+        heads: dict[str, str] = mark.get("heads", {})
+        known = set(heads.values())
+        events: list[SyncEvent] = []
+        new_heads: dict[str, str] = {}
+        for branch in self.__repository.get_branches():
+            head = branch.commit.sha
+            new_heads[branch.name] = head
+            if head in known:
+                continue
+            # commits are listed newest first, commits merged later can be older than the previous head,
+            # so the ancestry is followed until all new commits are found
+            pending = {head}
+            commits = []
+            for commit in self.__repository.get_commits(sha=head):
+                parents = [parent.sha for parent in commit.parents]
+                if commit.sha in known:
+                    known.update(parents)
+                elif commit.sha in pending:
+                    commits.append(commit)
+                    pending.update(parents)
+                pending.discard(commit.sha)
+                pending.difference_update(known)
+                if not pending:
+                    break
+            known.update(commit.sha for commit in commits)
+            events.extend(SyncEvent(name, RESOURCE_COMMITS, ACTION_CREATED, commit) for commit in reversed(commits))
+        return events, {"heads": new_heads}
+
+    @staticmethod
+    def __delta(
+        name: str,
+        resource: str,
+        elements: Iterable[GithubObject],
+        mark: dict[str, Any],
+    ) -> tuple[list[SyncEvent], dict[str, Any]]:
+        timestamp, identity, created = _ACCESSORS[resource]
+        since = _parse(mark["since"]) if "since" in mark else None
+        ids = set(mark.get("ids", []))
+        events = []
+        new_since, new_ids = since, set(ids)
+        for element in elements:
+            element_timestamp = timestamp(element)
+            element_id = identity(element)
+            # since is inclusive, resources at the mark are known by their ids
+            if since is not None and (element_timestamp < since or element_timestamp == since and element_id in ids):
+                continue
+            is_new = since is None or created(element) > since or created(element) == since and element_id not in ids
+            events.append(SyncEvent(name, resource, ACTION_CREATED if is_new else ACTION_UPDATED, element))
+            if new_since is None or element_timestamp > new_since:
+                new_since, new_ids = element_timestamp, {element_id}
+            elif element_timestamp == new_since:
+                new_ids.add(element_id)
+        if new_since is None:
+            return events, mark
+        return events, {"since": _format(new_since), "ids": sorted(new_ids)}
+
+
+def _parse(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+
+def _format(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _updated_at(element: Any) -> datetime:
+    return element.updated_at
+
+
+def _created_at(element: Any) -> datetime:
+    return element.created_at
+
+
+def _id(element: Any) -> int:
+    return element.id
+
+
+# timestamp, identity and creation timestamp of resources
+_ACCESSORS: dict[str, tuple[Callable[[Any], datetime], Callable[[Any], Any], Callable[[Any], datetime]]] = {
+    RESOURCE_ISSUES: (_updated_at, _id, _created_at),
+    RESOURCE_ISSUE_COMMENTS: (_updated_at, _id, _created_at),
+    RESOURCE_PULLS: (_updated_at, _id, _created_at),
+}
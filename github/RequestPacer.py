@@ -0,0 +1,125 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import threading
+from time import monotonic
+from typing import Any, NamedTuple
+
+from github.Concurrency import LockPicklingMixin
+
+
+class PacingStatistics(NamedTuple):
+    requests: int
+    deferred_requests: int
+    total_delay: float
+    max_delay: float
+
+    @property
+    def mean_delay(self) -> float:
+        return self.total_delay / self.requests if self.requests else 0.0
+
+
+class RequestPacer(LockPicklingMixin):
+    """
+    This class enforces the ``seconds_between_requests`` and ``seconds_between_writes`` settings of a
+    :class:`github.Requester.Requester`, also when the requester is used by multiple threads.
+
+    Callers :meth:`reserve` a slot before sending a request and :meth:`release` it once the request finished. Each
+    reservation moves the next free slot, so that concurrent callers queue up one after the other rather than all
+    waiting for the same delay.
+
+    The pacer spaces the starts of requests: any two requests start at least ``seconds_between_requests`` seconds
+    apart, and any two write requests (all verbs other than GET) start at least ``seconds_between_writes`` seconds
+    apart. Requests do not wait for earlier requests to finish, so with multiple threads several requests can be in
+    flight at the same time. Only requests reserved after a request finished start at least the respective number of
+    seconds after that request finished. To bound the number of concurrent requests, also limit the number of threads
+    using the requester.
+
+    """
+
+    _locks = ("_RequestPacer__lock",)
+
+    def __init__(self, seconds_between_requests: float | None, seconds_between_writes: float | None):
+        self._seconds_between_requests = seconds_between_requests or 0.0
+        self._seconds_between_writes = seconds_between_writes or 0.0
+        self.__next_request = 0.0
+        self.__next_write = 0.0
+        self.__requests = 0
+        self.__deferred_requests = 0
+        self.__total_delay = 0.0
+        self.__max_delay = 0.0
+        self.__lock = threading.Lock()
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        # monotonic clocks of different processes are not comparable
+        self.__next_request = 0.0
+        self.__next_write = 0.0
+
+    @staticmethod
+    def is_write(verb: str) -> bool:
+        return verb != "GET"
+
+    def reserve(self, verb: str) -> float:
+        """
+        Reserves the next free slot for a request with the given verb.
+
+        :return: seconds the caller has to wait before sending the request
+        """
+        with self.__lock:
+            now = monotonic()
+            if self._seconds_between_requests == 0 and self._seconds_between_writes == 0:
+                self.__requests += 1
+                return 0.0
+
+            start = max(now, self.__next_request)
+            if self.is_write(verb):
+                start = max(start, self.__next_write)
+                self.__next_write = start + self._seconds_between_writes
+            self.__next_request = start + self._seconds_between_requests
+
+            delay = start - now
+            self.__requests += 1
+            if delay > 0:
+                self.__deferred_requests += 1
+                self.__total_delay += delay
+                self.__max_delay = max(self.__max_delay, delay)
+            return delay
+
+    def release(self, verb: str) -> None:
+        """
+        Records that a request with the given verb finished, so that the next requests are paced from now.
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__next_request = max(self.__next_request, now + self._seconds_between_requests)
+            if self.is_write(verb):
+                self.__next_write = max(self.__next_write, now + self._seconds_between_writes)
+
+    @property
+    def statistics(self) -> PacingStatistics:
+        """
+        :return: number of requests, number of deferred requests, and total and max delay in seconds
+        """
+        with self.__lock:
+            return PacingStatistics(self.__requests, self.__deferred_requests, self.__total_delay, self.__max_delay)
@@ -87,7 +87,6 @@
 from __future__ import annotations
 
 import io
-import json
 import logging
 import mimetypes
 import os
@@ -97,7 +96,7 @@ import urllib
 import urllib.parse
 from collections import deque
 from collections.abc import Callable, ItemsView, Iterator
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase
 from typing import TYPE_CHECKING, Any, BinaryIO, Deque, Generic, TypeVar
 
@@ -109,6 +108,13 @@ import github.Consts as Consts
 import github.GithubException
 import github.GithubException as GithubException
 from github.GithubObject import Opt, as_rest_api_attributes, is_undefined
+from github.GraphQlQuery import GraphQlQuery, registry
+from github.IdentityMap import IdentityMap
+from github.JsonBackend import JsonBackend, StdlibJsonBackend
+from github.RateLimitScheduler import RateLimitScheduler
+from github.RequestPacer import PacingStatistics, RequestPacer
+from github.ResponseCache import CachedResponse, ResponseCache
+from github.UploadStream import UploadStream
 
 if TYPE_CHECKING:
     from .AppAuthentication import AppAuthentication
@@ -133,17 +139,100 @@ class RequestsResponse:
     def getheaders(self) -> ItemsView[str, str]:
         return self.headers.items()
 
-    def read(self) -> str:
-        return self.response.text or ""
+    def read(self) -> bytes:
+        return self.response.content or b""
 
-    def iter_content(self, chunk_size: int | None = 1) -> Iterator:
+    def iter_content(self, chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE) -> Iterator:
         return self.response.iter_content(chunk_size=chunk_size)
 
     def raise_for_status(self) -> None:
         self.response.raise_for_status()
 
+    def close(self) -> None:
+        self.response.close()
+
+
+class ResponseChunks(Iterator[bytes]):
+    """
+    Iterates over the chunks of a streamed response, :meth:`close` releases the connection of the response.
+
+    The connection is released automatically once all chunks have been read.
+
+    """
+
+    def __init__(self, response: Any, chunk_size: int | None):
+        self.__response = response
+        self.__chunks = response.iter_content(chunk_size=chunk_size)
+
+    def __next__(self) -> bytes:
+        return next(self.__chunks)
+
+    def close(self) -> None:
+        self.__response.close()
+
+
+class DownloadProgress:
+    # thread-safe accumulation of downloaded bytes, reported to an optional callback
+    def __init__(self, total: int | None, callback: Callable[[int, int | None], None] | None):
+        self.total = total
+        self.downloaded = 0
+        self.__callback = callback
+        self.__lock = threading.Lock()
+
+    def add(self, size: int) -> None:
+        with self.__lock:
+            self.downloaded += size
+            if self.__callback is not None:
+                self.__callback(self.downloaded, self.total)
+
+
+class PendingRequest(threading.local):
+    """
+    The request given to a connection via ``request()`` and sent via ``getresponse()``.
+
+    A connection is shared by all threads using the same Requester, so the pending request is stored per thread.
+
+    """
+
+    verb: str = ""
+    url: str = ""
+    input: Any = None
+    headers: dict[str, str] = {}
+    stream: bool = False
+
+    def set(self, verb: str, url: str, input: Any, headers: dict[str, str], stream: bool) -> None:
+        self.verb = verb
+        self.url = url
+        self.input = input
+        self.headers = headers
+        self.stream = stream
+
 
-class HTTPSRequestsConnectionClass:
+class PendingRequestMixin:
+    _pending: PendingRequest
+
+    @property
+    def verb(self) -> str:
+        return self._pending.verb
+
+    @property
+    def url(self) -> str:
+        return self._pending.url
+
+    @property
+    def input(self) -> Any:
+        return self._pending.input
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return self._pending.headers
+
+    @property
+    def stream(self) -> bool:
+        return self._pending.stream
+
+
+class HTTPSRequestsConnectionClass(PendingRequestMixin):
     retry: int | Retry
 
     # mimic the httplib connection object
@@ -162,6 +251,7 @@ class HTTPSRequestsConnectionClass:
         self.protocol = "https"
         self.timeout = timeout
         self.verify = kwargs.get("verify", True)
+        self._pending = PendingRequest()
         self.session = requests.Session()
         # having Session.auth set something other than None disables falling back to .netrc file
         # https://github.com/psf/requests/blob/d63e94f552ebf77ccf45d97e5863ac46500fa2c7/src/requests/sessions.py#L480-L481
@@ -193,11 +283,7 @@ class HTTPSRequestsConnectionClass:
         headers: dict[str, str],
         stream: bool = False,
     ) -> None:
-        self.verb = verb
-        self.url = url
-        self.input = input
-        self.headers = headers
-        self.stream = stream
+        self._pending.set(verb, url, input, headers, stream)
 
     def getresponse(self) -> RequestsResponse:
         verb = getattr(self.session, self.verb.lower())
@@ -216,7 +302,7 @@ class HTTPSRequestsConnectionClass:
         self.session.close()
 
 
-class HTTPRequestsConnectionClass:
+class HTTPRequestsConnectionClass(PendingRequestMixin):
     # mimic the httplib connection object
     def __init__(
         self,
@@ -233,6 +319,7 @@ class HTTPRequestsConnectionClass:
         self.protocol = "http"
         self.timeout = timeout
         self.verify = kwargs.get("verify", True)
+        self._pending = PendingRequest()
         self.session = requests.Session()
         # having Session.auth set something other than None disables falling back to .netrc file
         # https://github.com/psf/requests/blob/d63e94f552ebf77ccf45d97e5863ac46500fa2c7/src/requests/sessions.py#L480-L481
@@ -257,11 +344,7 @@ class HTTPRequestsConnectionClass:
         self.session.mount("http://", self.adapter)
 
     def request(self, verb: str, url: str, input: None, headers: dict[str, str], stream: bool = False) -> None:
-        self.verb = verb
-        self.url = url
-        self.input = input
-        self.headers = headers
-        self.stream = stream
+        self._pending.set(verb, url, input, headers, stream)
 
     def getresponse(self) -> RequestsResponse:
         verb = getattr(self.session, self.verb.lower())
@@ -353,7 +436,7 @@ class Requester:
 
             self._frameCount = len(self._frameBuffer) - 1
 
-    def DEBUG_ON_RESPONSE(self, statusCode: int, responseHeader: dict[str, str | int], data: str) -> None:
+    def DEBUG_ON_RESPONSE(self, statusCode: int, responseHeader: dict[str, str | int], data: str | bytes) -> None:
         """
         Update current frame with response Current frame index will be attached to responseHeader.
         """
@@ -361,7 +444,7 @@ class Requester:
             self._frameBuffer[self._frameCount][1:4] = [
                 statusCode,
                 responseHeader,
-                data,
+                self.__text(data, "DEBUG_ON_RESPONSE"),
             ]
             responseHeader[self.DEBUG_HEADER_KEY] = self._frameCount
 
@@ -401,6 +484,14 @@ class Requester:
         seconds_between_writes: float | None = None,
         lazy: bool = False,
         api_version: str | None = None,
+        response_cache: ResponseCache | None = None,
+        rate_limit_scheduler: RateLimitScheduler | None = None,
+        json_backend: JsonBackend | None = None,
+        lazy_attributes: bool = False,
+        retain_raw_data: bool = True,
+        identity_map: IdentityMap | None = None,
+        persisted_graphql_queries: bool = False,
+        processing_202_retries: int = Consts.DEFAULT_PROCESSING_202_RETRIES,
     ):
         self._initializeDebugFeature()
 
@@ -422,7 +513,7 @@ class Requester:
         self.__pool_size = pool_size
         self.__seconds_between_requests = seconds_between_requests
         self.__seconds_between_writes = seconds_between_writes
-        self.__last_requests: dict[str, float] = dict()
+        self.__pacer = RequestPacer(seconds_between_requests, seconds_between_writes)
         self.__scheme = o.scheme
         if o.scheme == "https":
             self.__connectionClass = self.__httpsConnectionClass
@@ -449,6 +540,18 @@ class Requester:
         self.__verify = verify
         self.__lazy = lazy
         self.__apiVersion = api_version
+        self.__response_cache = response_cache
+        self.__rate_limit_scheduler = rate_limit_scheduler
+        self.__json_backend = json_backend
+        self.__json: JsonBackend = json_backend if json_backend is not None else StdlibJsonBackend()
+        self.__lazy_attributes = lazy_attributes
+        self.__retain_raw_data = retain_raw_data
+        self.__identity_map = identity_map
+        self.__persisted_graphql_queries = persisted_graphql_queries
+        # cleared once the GraphQL endpoint reports that persisted queries are not supported
+        self.__persisted_graphql_queries_supported = True
+        assert isinstance(processing_202_retries, int) and processing_202_retries >= 0, processing_202_retries
+        self.__processing_202_retries = processing_202_retries
 
         self.__installation_authorization = None
 
@@ -547,6 +650,14 @@ class Requester:
             seconds_between_writes=self.__seconds_between_writes,
             lazy=self.__lazy,
             api_version=self.__apiVersion,
+            response_cache=self.__response_cache,
+            rate_limit_scheduler=self.__rate_limit_scheduler,
+            json_backend=self.__json_backend,
+            lazy_attributes=self.__lazy_attributes,
+            retain_raw_data=self.__retain_raw_data,
+            identity_map=self.__identity_map,
+            persisted_graphql_queries=self.__persisted_graphql_queries,
+            processing_202_retries=self.__processing_202_retries,
         )
 
     @property
@@ -615,6 +726,94 @@ class Requester:
     def api_version(self) -> str | None:
         return self.__apiVersion
 
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        return self.__response_cache
+
+    @property
+    def rate_limit_scheduler(self) -> RateLimitScheduler | None:
+        return self.__rate_limit_scheduler
+
+    @property
+    def pool_size(self) -> int:
+        """
+        Number of connections kept open to the API.
+        """
+        return self.__pool_size if self.__pool_size is not None else requests.adapters.DEFAULT_POOLSIZE
+
+    @property
+    def json_backend(self) -> JsonBackend:
+        return self.__json
+
+    @property
+    def lazy_attributes(self) -> bool:
+        return self.__lazy_attributes
+
+    @property
+    def retain_raw_data(self) -> bool:
+        return self.__retain_raw_data
+
+    @property
+    def identity_map(self) -> IdentityMap | None:
+        return self.__identity_map
+
+    @property
+    def persisted_graphql_queries(self) -> bool:
+        return self.__persisted_graphql_queries
+
+    @property
+    def processing_202_retries(self) -> int:
+        return self.__processing_202_retries
+
+    def withRetainRawData(self, retain_raw_data: Opt[bool]) -> Requester:
+        """
+        Create a new requester instance with identical configuration but the given retain_raw_data setting.
+
+        :param retain_raw_data: if False, objects created from this instance discard their raw data and response
+            headers once decoded
+        :return: new Requester instance if is_defined(retain_raw_data) and retain_raw_data != self.retain_raw_data,
+            this instance otherwise
+
+        """
+        if is_undefined(retain_raw_data) or self.retain_raw_data == retain_raw_data:
+            return self
+
+        kwargs = self.kwargs
+        kwargs.update(retain_raw_data=retain_raw_data)
+        return Requester(**kwargs)
+
+    def withProcessing202Retries(self, processing_202_retries: int) -> Requester:
+        """
+        Create a new requester instance with identical configuration but the given processing_202_retries setting.
+
+        :param processing_202_retries: number of retries of GET requests while the response is 202, after which
+            requestJsonAndCheck raises a GithubException, 0 returns 202 responses right away
+        :return: new Requester instance if processing_202_retries != self.processing_202_retries, this instance
+            otherwise
+
+        """
+        if self.processing_202_retries == processing_202_retries:
+            return self
+
+        kwargs = self.kwargs
+        kwargs.update(processing_202_retries=processing_202_retries)
+        return Requester(**kwargs)
+
+    @property
+    def pacer(self) -> RequestPacer:
+        """
+        Paces requests to comply with ``seconds_between_requests`` and ``seconds_between_writes``, shared with the
+        :class:`github.AsyncRequester.AsyncRequester` built from this requester.
+        """
+        return self.__pacer
+
+    @property
+    def pacing_statistics(self) -> PacingStatistics:
+        """
+        Statistics of requests deferred to comply with ``seconds_between_requests`` and ``seconds_between_writes``.
+        """
+        return self.__pacer.statistics
+
     def withApiVersion(self, api_version: str | None) -> Requester:
         """
         Create a new requester instance with identical configuration but the given API version setting.
@@ -646,25 +845,29 @@ class Requester:
 
         :param input: request body, serialized to JSON if specified
 
-        :return: ``(headers: dict, JSON Response: Any)``
-        :raises: :class:`GithubException` for error status codes
+        :return: ``(headers: dict, JSON Response: Any)``, the response is ``None`` while a GET request is still
+            computed (status 202) and ``processing_202_retries`` is 0
+        :raises: :class:`GithubException` for error status codes, and for status 202 after
+            ``processing_202_retries`` retries
 
         """
-        return self.__postProcess(
+        status, responseHeaders, output = self.__requestJson(
             verb,
             url,
-            *self.__check(
-                *self.requestJson(
-                    verb,
-                    url,
-                    parameters,
-                    headers,
-                    input,
-                    self.__customConnection(url),
-                    follow_302_redirect=follow_302_redirect,
-                )
-            ),
+            parameters,
+            headers,
+            input,
+            self.__customConnection(url),
+            follow_302_redirect=follow_302_redirect,
         )
+        if status == 202 and (verb == "GET" or verb == "HEAD"):
+            # only callers that opted into handling 202 responses themselves get them, e.g. via StatsPoller
+            if self.__processing_202_retries > 0:
+                raise self.createProcessing202Exception(
+                    status, responseHeaders, self.__structuredFromJson(output), self.__processing_202_retries
+                )
+            return responseHeaders, None
+        return self.__postProcess(verb, url, *self.__check(status, responseHeaders, output))
 
     def requestMultipartAndCheck(
         self,
@@ -697,11 +900,13 @@ class Requester:
         headers: dict[str, str] | None = None,
         input: str | None = None,
         cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None = None,
+        progress: Callable[[int, int], None] | None = None,
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         """
         Send a request with a file for the body.
 
         :param input: path to a file to use for the request body
+        :param progress: callable called with the number of bytes sent so far and the total size
 
         :return: ``(headers: dict, JSON Response: Any)``
         :raises: :class:`GithubException` for error status codes
@@ -710,7 +915,9 @@ class Requester:
         return self.__postProcess(
             verb,
             url,
-            *self.__check(*self.requestBlob(verb, url, parameters, headers, input, self.__customConnection(url))),
+            *self.__check(
+                *self.requestBlob(verb, url, parameters, headers, input, self.__customConnection(url), progress)
+            ),
         )
 
     @classmethod
@@ -728,19 +935,23 @@ class Requester:
             data = as_rest_api_attributes(data)
         return klass(self, headers, data)
 
-    def graphql_query(self, query: str, variables: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    def graphql_query(
+        self, query: str | GraphQlQuery, variables: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
         """
         Queries the GraphQL API.
 
+        With ``persisted_graphql_queries`` enabled, the request refers to the query document by its hash, and the
+        document is sent only if the server does not know that hash yet, see
+        :class:`github.GraphQlQuery.GraphQlQueryRegistry`.
+
         :param query: GraphQL query
         :param variables: GraphQL variables
         :return: ``(headers: dict, JSON Response: dict)``
         :raises: :class:`GithubException` for error status codes
 
         """
-        input_ = {"query": query, "variables": variables}
-
-        response_headers, data = self.requestJsonAndCheck("POST", self.graphql_url, input=input_)
+        response_headers, data = self.graphql_request(query, variables)
         if "errors" in data:
             if len(data["errors"]) == 1:
                 error = data["errors"][0]
@@ -749,6 +960,36 @@ class Requester:
             raise self.createException(400, response_headers, data)
         return response_headers, data
 
+    def graphql_request(self, query: str | GraphQlQuery, variables: dict[str, Any]) -> tuple[dict[str, Any], Any]:
+        """
+        Queries the GraphQL API like :func:`graphql_query`, but returns GraphQL errors with the response instead of
+        raising them, e.g. to handle errors of parts of a query individually.
+
+        :param query: GraphQL query
+        :param variables: GraphQL variables
+        :return: ``(headers: dict, JSON Response: dict)``
+        :raises: :class:`GithubException` for error status codes
+
+        """
+        if not self.__persisted_graphql_queries:
+            document = query if isinstance(query, str) else query.document
+            return self.requestJsonAndCheck("POST", self.graphql_url, input={"query": document, "variables": variables})
+
+        if isinstance(query, str):
+            query = registry.query(query)
+        if self.__persisted_graphql_queries_supported:
+            input_: dict[str, Any] = {"variables": variables, "extensions": query.persisted_query}
+            headers, data = self.requestJsonAndCheck("POST", self.graphql_url, input=input_)
+            errors = data.get("errors") or [] if isinstance(data, dict) else []
+            codes = {error.get("extensions", {}).get("code") or error.get("message") for error in errors}
+            if codes & {"PERSISTED_QUERY_NOT_SUPPORTED", "PersistedQueryNotSupported"}:
+                self.__persisted_graphql_queries_supported = False
+            elif not codes & {"PERSISTED_QUERY_NOT_FOUND", "PersistedQueryNotFound"}:
+                return headers, data
+        # sending the document along with its hash persists it
+        input_ = {"query": query.document, "variables": variables, "extensions": query.persisted_query}
+        return self.requestJsonAndCheck("POST", self.graphql_url, input=input_)
+
     def graphql_query_class(
         self, query: str, variables: dict[str, Any], data_path: list[str], klass: type[T_gh]
     ) -> T_gh:
@@ -789,22 +1030,7 @@ class Requester:
         :raises: :class:`GithubException` for error status codes
 
         """
-        if not output_schema.startswith("\n"):
-            output_schema = f" {output_schema} "
-        query = (
-            """
-            query Q($id: ID!) {
-              node(id: $id) {
-                __typename
-                ... on """
-            + f"{node_type} {{{output_schema}}}"
-            + """
-              }
-            }
-            """
-        )
-
-        headers, data = self.graphql_query(query, {"id": node_id})
+        headers, data = self.graphql_query(registry.node(node_type, output_schema), {"id": node_id})
         actual_node_type = data.get("data", {}).get("node", {}).get("__typename", node_type)
         if actual_node_type != node_type:
             raise github.GithubException(
@@ -814,6 +1040,40 @@ class Requester:
             )
         return headers, data
 
+    def graphql_nodes(
+        self, node_ids: list[str], output_schema: str, node_type: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Fetches GraphQL nodes by ids in the give schema.
+
+        This sends the following GraphQL request::
+
+            query Q($ids: [ID!]!) {
+              nodes(ids: $ids) {
+                __typename
+                ... on <node_type> {
+                  <output_schema>
+                }
+              }
+            }
+
+        The nodes in the response are in the order of the given ids. Nodes that do not exist or are not accessible
+        are ``null``, nodes of a different type only contain their ``__typename``.
+
+        :param node_ids: GraphQL node ids, at most ``Consts.MAX_GRAPHQL_NODES`` ids
+        :param output_schema: The schema of the retrieved properties of the nodes, without enclosing curly brackets
+        :param node_type: The GraphQL node type
+        :return: ``(headers: dict, JSON Response: dict)``
+        :raises: :class:`GithubException` for error status codes
+
+        """
+        assert len(node_ids) <= Consts.MAX_GRAPHQL_NODES, len(node_ids)
+        headers, data = self.graphql_request(registry.nodes(node_type, output_schema), {"ids": node_ids})
+        # unknown nodes are null, while other errors fail the whole query
+        if any(error.get("type") != "NOT_FOUND" for error in data.get("errors", [])):
+            raise self.createException(400, headers, data)
+        return headers, data
+
     def graphql_node_class(
         self, node_id: str, output_schema: str, klass: type[T_gh], node_type: str | None = None
     ) -> T_gh:
@@ -860,8 +1120,7 @@ class Requester:
         :raises: :class:`GithubException` for error status codes
 
         """
-        mutation_input_name = mutation_name[:1].upper() + mutation_name[1:] + "Input!"
-        query = f"mutation Mutation($input: {mutation_input_name}) {{ {mutation_name}(input: $input) {{ {output_schema} }} }}"
+        query = registry.named_mutation(mutation_name, output_schema)
         headers, data = self.graphql_query(query, {"input": mutation_input})
         return headers, data.get("data", {}).get(mutation_name, {})
 
@@ -888,7 +1147,7 @@ class Requester:
         self,
         status: int,
         responseHeaders: dict[str, Any],
-        output: str,
+        output: str | bytes,
     ) -> tuple[dict[str, Any], Any]:
         data = self.__structuredFromJson(output)
         if status >= 400:
@@ -983,6 +1242,18 @@ class Requester:
 
         return exc(status, output, headers, msg)
 
+    @classmethod
+    def createProcessing202Exception(
+        cls,
+        status: int,
+        headers: dict[str, Any],
+        output: Any,
+        retries: int,
+    ) -> GithubException.GithubException:
+        return GithubException.GithubException(
+            status, output, headers, f"Response is still being computed after {retries} retries"
+        )
+
     @classmethod
     def isRateLimitError(cls, message: str) -> bool:
         return cls.isPrimaryRateLimitError(message) or cls.isSecondaryRateLimitError(message)
@@ -1007,15 +1278,14 @@ class Requester:
             or message.endswith("please wait a few minutes before you try again.")
         )
 
-    def __structuredFromJson(self, data: str) -> Any:
+    def __structuredFromJson(self, data: str | bytes) -> Any:
         if len(data) == 0:
             return None
         else:
-            if isinstance(data, bytes):
-                data = data.decode("utf-8")
             try:
-                return json.loads(data)
+                return self.__json.loads(data)
             except ValueError:
+                data = self.__text(data, "__structuredFromJson")
                 if data.startswith("{") or data.startswith("["):
                     raise
                 return {"data": data}
@@ -1027,16 +1297,116 @@ class Requester:
         parameters: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None = None,
-        chunk_size: int | None | None = 1,
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int | None], None] | None = None,
+        size: int | None = None,
+        workers: int = 1,
+        max_resumes: int = Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
     ) -> None:
         """
         GET a file from the server and save it to the given path, which includes the filename.
+
+        :param chunk_size: size of chunks read from the response and written to the file
+        :param progress: callable called with the number of bytes downloaded so far and the total size, if known
+        :param size: size of the file in bytes, if known; required for parallel downloads
+        :param workers: number of parallel Range requests used to download files of known size,
+            falls back to a single request when the server does not support Range requests
+        :param max_resumes: number of times a dropped download is resumed with a Range request
+
         """
-        _, _, stream_chunk_iterator = self.getStream(url, parameters, headers, cnx, chunk_size=chunk_size)
-        with open(path, "wb") as f:
-            for chunk in stream_chunk_iterator:
-                if chunk:
-                    f.write(chunk)
+        assert workers >= 1, workers
+        assert max_resumes >= 0, max_resumes
+        tracker = DownloadProgress(size, progress)
+
+        if workers > 1 and size is not None and chunk_size is not None and size > chunk_size:
+            # preallocate the file so that all parts can be written at their offset
+            with open(path, "wb") as f:
+                f.truncate(size)
+            part_size = max(chunk_size, -(-size // workers))
+            parts = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+            def download_part(part: tuple[int, int]) -> bool:
+                return self.__downloadRange(
+                    url, path, parameters, headers, None, chunk_size, tracker, max_resumes, part[0], part[1]
+                )
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(parts))) as executor:
+                if all(list(executor.map(download_part, parts))):
+                    return
+
+            # the server does not support Range requests, download sequentially
+            tracker = DownloadProgress(size, progress)
+
+        self.__downloadRange(url, path, parameters, headers, cnx, chunk_size, tracker, max_resumes)
+
+    def __downloadRange(
+        self,
+        url: str,
+        path: str,
+        parameters: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None,
+        chunk_size: int | None,
+        tracker: DownloadProgress,
+        max_resumes: int,
+        start: int = 0,
+        end: int | None = None,
+    ) -> bool:
+        # Downloads bytes start to end (inclusive) of the file, or the entire file if end is None.
+        # Returns False if the server does not support Range requests of a part of the file,
+        # or if the part of the file does not match the expected size of the file.
+        position = start
+        resumes = 0
+        with open(path, "wb" if end is None else "r+b") as f:
+            f.seek(start)
+            while True:
+                request_headers = dict(headers) if headers is not None else {}
+                if end is not None or position > start:
+                    request_headers["Range"] = f"bytes={position}-{end if end is not None else ''}"
+                status, response_headers, chunks = self.getStream(
+                    url, parameters, request_headers, cnx if position == start else None, chunk_size=chunk_size
+                )
+                if end is not None and (
+                    status != 206 or not self.__isContentRange(response_headers, position, end, tracker.total)
+                ):
+                    chunks.close()
+                    return False
+                if "Range" in request_headers and status != 206:
+                    # the server responded with the entire file, start over
+                    f.seek(0)
+                    f.truncate()
+                    tracker.add(-position)
+                    position = 0
+                if tracker.total is None and end is None and position == 0 and "content-length" in response_headers:
+                    tracker.total = int(response_headers["content-length"])
+
+                try:
+                    for chunk in chunks:
+                        if chunk:
+                            f.write(chunk)
+                            position += len(chunk)
+                            tracker.add(len(chunk))
+                    # a part of the file must not end early
+                    return end is None or position == end + 1
+                except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError):
+                    # positions of decoded content do not refer to bytes of the encoded file
+                    if resumes >= max_resumes or "content-encoding" in response_headers:
+                        raise
+                    resumes += 1
+                    if self._logger.isEnabledFor(logging.INFO):
+                        self._logger.info(f"Resuming download of {url} at byte {position} ({resumes}/{max_resumes})")
+                finally:
+                    chunks.close()
+
+    @staticmethod
+    def __isContentRange(response_headers: dict[str, Any], start: int, end: int, size: int | None) -> bool:
+        # whether the response contains exactly bytes start to end (inclusive) of a file of the given size
+        content_range = f"bytes {start}-{end}/{size}"
+        if response_headers.get("content-range") != content_range:
+            return False
+        if "content-length" in response_headers and "content-encoding" not in response_headers:
+            return int(response_headers["content-length"]) == end - start + 1
+        return True
 
     def getStream(
         self,
@@ -1044,12 +1414,13 @@ class Requester:
         parameters: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None = None,
-        chunk_size: int | None | None = 1,
-    ) -> tuple[int, dict[str, Any], Iterator]:
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+    ) -> tuple[int, dict[str, Any], ResponseChunks]:
         """
         GET a stream from the server.
 
-        :returns:``(status, headers, stream_chunk_iterator)``
+        :returns:``(status, headers, stream_chunk_iterator)``, close the iterator to release the connection when not
+            reading all chunks
 
         """
         if headers is None:
@@ -1063,10 +1434,14 @@ class Requester:
             cnx, "GET", url, parameters, headers, None, encode, stream=True, follow_302_redirect=True
         )
         if isinstance(output, RequestsResponse) or (
-            hasattr(output, "iter_content") and hasattr(output, "raise_for_status")
+            hasattr(output, "iter_content") and hasattr(output, "raise_for_status") and hasattr(output, "close")
         ):
-            output.raise_for_status()
-            return status, responseHeaders, output.iter_content(chunk_size=chunk_size)
+            try:
+                output.raise_for_status()
+            except Exception:
+                output.close()
+                raise
+            return status, responseHeaders, ResponseChunks(output, chunk_size)
         raise TypeError(f"Expected a RequestsResponse object: {type(output)}")
 
     def requestJson(
@@ -1087,13 +1462,29 @@ class Requester:
 
         """
 
+        status, responseHeaders, output = self.__requestJson(
+            verb, url, parameters, headers, input, cnx, follow_302_redirect=follow_302_redirect
+        )
+        return status, responseHeaders, self.__text(output, "requestJson")
+
+    def __requestJson(
+        self,
+        verb: str,
+        url: str,
+        parameters: dict[str, Any] | None,
+        headers: dict[str, Any] | None,
+        input: Any | None,
+        cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None,
+        follow_302_redirect: bool = False,
+    ) -> tuple[int, dict[str, Any], str | bytes]:
+        # the body is returned undecoded, so the JSON backend parses the bytes read from the connection
         def encode(input: Any) -> tuple[str, str]:
-            return "application/json", json.dumps(input)
+            return "application/json", self.__json.dumps(input)
 
         status, responseHeaders, output = self.__requestEncode(
             cnx, verb, url, parameters, headers, input, encode, follow_302_redirect=follow_302_redirect
         )
-        if isinstance(output, str):
+        if isinstance(output, (str, bytes)):
             return status, responseHeaders, output
         raise ValueError("requestJson() Expected a str, should never happen")
 
@@ -1128,9 +1519,7 @@ class Requester:
             return f"multipart/form-data; boundary={boundary}", encoded_input
 
         status, responseHeaders, output = self.__requestEncode(cnx, verb, url, parameters, headers, input, encode)
-        if isinstance(output, str):
-            return status, responseHeaders, output
-        raise ValueError("requestMultipart() Expected a str, should never happen")
+        return status, responseHeaders, self.__text(output, "requestMultipart")
 
     def requestBlob(
         self,
@@ -1140,11 +1529,16 @@ class Requester:
         headers: dict[str, str] | None = None,
         input: str | None = None,
         cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None = None,
+        progress: Callable[[int, int], None] | None = None,
     ) -> tuple[int, dict[str, Any], str]:
         """
         Send a request with a file as request body.
 
+        The file is streamed in chunks via an :class:`github.UploadStream.UploadStream`, which can be rewound when the
+        request is retried.
+
         :param input: path to a local file to use for request body
+        :param progress: callable called with the number of bytes sent so far and the total size
         :returns:``(status, headers, body)``
 
         """
@@ -1157,16 +1551,13 @@ class Requester:
             else:
                 guessed_type = mimetypes.guess_type(local_path)
                 mime_type = guessed_type[0] if guessed_type[0] is not None else Consts.defaultMediaType
-            f = open(local_path, "rb")
-            return mime_type, f
+            return mime_type, UploadStream(local_path, progress=progress)
 
         if input:
             headers["Content-Length"] = str(os.path.getsize(input))
 
         status, responseHeaders, output = self.__requestEncode(cnx, verb, url, parameters, headers, input, encode)
-        if isinstance(output, str):
-            return status, responseHeaders, output
-        raise ValueError("requestBlob() Expected a str, should never happen")
+        return status, responseHeaders, self.__text(output, "requestBlob")
 
     def requestMemoryBlobAndCheck(
         self,
@@ -1174,7 +1565,7 @@ class Requester:
         url: str,
         parameters: Any,
         headers: dict[str, Any],
-        file_like: BinaryIO,
+        file_like: BinaryIO | io.RawIOBase,
         cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None = None,
     ) -> tuple[dict[str, Any], Any]:
         """
@@ -1194,10 +1585,19 @@ class Requester:
             cnx = self.__customConnection(url)
 
         status, responseHeaders, output = self.__requestEncode(cnx, verb, url, parameters, headers, file_like, encode)
-        if isinstance(output, str):
+        if isinstance(output, (str, bytes)):
             return self.__postProcess(verb, url, *self.__check(status, responseHeaders, output))
         raise ValueError("requestMemoryBlobAndCheck() Expected a str, should never happen")
 
+    @staticmethod
+    def __text(output: object, method: str) -> str:
+        # bodies read from the connection are bytes, replayed and cached bodies are str
+        if isinstance(output, bytes):
+            return output.decode("utf-8", errors="replace")
+        if isinstance(output, str):
+            return output
+        raise ValueError(f"{method}() Expected a str, should never happen")
+
     def __requestEncode(
         self,
         cnx: HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass | None,
@@ -1209,12 +1609,12 @@ class Requester:
         encode: Callable[[T], tuple[str, Any]],
         stream: bool = False,
         follow_302_redirect: bool = False,
-    ) -> tuple[int, dict[str, Any], str | object]:
+    ) -> tuple[int, dict[str, Any], str | bytes | object]:
         assert verb in ["HEAD", "GET", "POST", "PATCH", "PUT", "DELETE"]
         if parameters is None:
             parameters = {}
-        if requestHeaders is None:
-            requestHeaders = {}
+        # authentication and conditional headers are added to a copy, callers may reuse their headers dict
+        requestHeaders = {} if requestHeaders is None else dict(requestHeaders)
 
         if self.__auth is not None:
             self.__auth.authentication(requestHeaders)
@@ -1229,12 +1629,47 @@ class Requester:
         if input is not None:
             requestHeaders["Content-Type"], encoded_input = encode(input)
 
+        # requests with conditional headers given by the caller bypass the cache, they expect to see a 304 response
+        cache_key: str | None = None
+        cached: CachedResponse | None = None
+        if (
+            self.__response_cache is not None
+            and verb == "GET"
+            and not stream
+            and Consts.REQ_IF_NONE_MATCH not in requestHeaders
+            and Consts.REQ_IF_MODIFIED_SINCE not in requestHeaders
+        ):
+            if cnx is None:
+                cache_key = self.responseCacheKey(url, requestHeaders)
+            else:
+                cache_key = self.responseCacheKey(url, requestHeaders, cnx.host, cnx.port)
+            cached = self.__response_cache.get(cache_key)
+            if cached is not None:
+                if cached.etag is not None:
+                    requestHeaders[Consts.REQ_IF_NONE_MATCH] = cached.etag
+                elif cached.last_modified is not None:
+                    requestHeaders[Consts.REQ_IF_MODIFIED_SINCE] = cached.last_modified
+
         self.NEW_DEBUG_FRAME(requestHeaders)
 
         status, responseHeaders, output = self.__requestRaw(
             cnx, verb, url, requestHeaders, encoded_input, stream=stream, follow_302_redirect=follow_302_redirect
         )
 
+        if cache_key is not None:
+            assert self.__response_cache is not None
+            if status == 304 and cached is not None:
+                # the 304 response carries current rate limit headers, everything else comes from the cache
+                status, responseHeaders, output = cached.status, {**cached.headers, **responseHeaders}, cached.body
+            elif (
+                status == 200
+                and isinstance(output, (str, bytes))
+                and (Consts.RES_ETAG in responseHeaders or Consts.RES_LAST_MODIFIED in responseHeaders)
+            ):
+                self.__response_cache.set(
+                    cache_key, CachedResponse(status, responseHeaders, self.__text(output, "__requestEncode"))
+                )
+
         if Consts.headerRateRemaining in responseHeaders and Consts.headerRateLimit in responseHeaders:
             self.rate_limiting = (
                 # ints expected but sometimes floats returned: https://github.com/PyGithub/PyGithub/pull/2697
@@ -1248,7 +1683,7 @@ class Requester:
         if Consts.headerOAuthScopes in responseHeaders:
             self.oauth_scopes = responseHeaders[Consts.headerOAuthScopes].split(", ")
 
-        self.DEBUG_ON_RESPONSE(status, responseHeaders, output if isinstance(output, str) else "stream")
+        self.DEBUG_ON_RESPONSE(status, responseHeaders, output if isinstance(output, (str, bytes)) else "stream")
 
         return status, responseHeaders, output
 
@@ -1261,7 +1696,12 @@ class Requester:
         input: Any | None,
         stream: bool = False,
         follow_302_redirect: bool = False,
-    ) -> tuple[int, dict[str, Any], str | object]:
+        processing_202_retry: int = 0,
+    ) -> tuple[int, dict[str, Any], str | bytes | object]:
+        resource = None
+        if self.__rate_limit_scheduler is not None:
+            resource = self.__rate_limit_scheduler.resource(url, self.__graphql_prefix)
+            self.__awaitRateLimitBudget(self.__rate_limit_scheduler, resource)
         self.__deferRequest(verb)
 
         try:
@@ -1274,17 +1714,35 @@ class Requester:
             status = response.status
             responseHeaders = {k.lower(): v for k, v in response.getheaders()}
 
+            if self.__rate_limit_scheduler is not None and resource is not None:
+                self.__rate_limit_scheduler.update(resource, responseHeaders)
+
             if input:
                 if isinstance(input, IOBase):
                     input.close()
 
             self.__log(verb, url, requestHeaders, input, status, responseHeaders, output)
 
-            if status == 202 and (
-                verb == "GET" or verb == "HEAD"
-            ):  # only for requests that are considered 'safe' in RFC 2616
-                time.sleep(Consts.PROCESSING_202_WAIT_TIME)
-                return self.__requestRaw(original_cnx, verb, url, requestHeaders, input, stream=stream)
+            if (
+                status == 202
+                and (verb == "GET" or verb == "HEAD")  # only for requests that are considered 'safe' in RFC 2616
+                and processing_202_retry < self.__processing_202_retries
+            ):
+                time.sleep(
+                    min(
+                        Consts.PROCESSING_202_WAIT_TIME * 2**processing_202_retry, Consts.PROCESSING_202_MAX_WAIT_TIME
+                    )
+                )
+                return self.__requestRaw(
+                    original_cnx,
+                    verb,
+                    url,
+                    requestHeaders,
+                    input,
+                    stream=stream,
+                    follow_302_redirect=follow_302_redirect,
+                    processing_202_retry=processing_202_retry + 1,
+                )
 
             if status == 301 and "location" in responseHeaders:
                 location = responseHeaders["location"]
@@ -1332,27 +1790,48 @@ class Requester:
     def __deferRequest(self, verb: str) -> None:
         # Ensures at least self.__seconds_between_requests seconds have passed since any last request
         # and self.__seconds_between_writes seconds have passed since last write request (if verb refers to a write).
-        # Uses self.__last_requests.
-        requests = self.__last_requests.values()
-        writes = [l for v, l in self.__last_requests.items() if v != "GET"]
-
-        last_request = max(requests) if requests else 0
-        last_write = max(writes) if writes else 0
-
-        next_request = (last_request + self.__seconds_between_requests) if self.__seconds_between_requests else 0
-        next_write = (last_write + self.__seconds_between_writes) if self.__seconds_between_writes else 0
-
-        next = next_request if verb == "GET" else max(next_request, next_write)
-        defer = max(next - datetime.now(timezone.utc).timestamp(), 0)
+        # Concurrent requests are queued one after the other by the pacer.
+        defer = self.__pacer.reserve(verb)
         if defer > 0:
             if self.__logger is None:
                 self.__logger = logging.getLogger(__name__)
             self.__logger.debug(f"sleeping {defer}s before next GitHub request")
             time.sleep(defer)
 
+    def __awaitRateLimitBudget(self, scheduler: RateLimitScheduler, resource: str) -> None:
+        # Waits until the scheduler grants a request of the given resource
+        defer = scheduler.acquire(resource)
+        if defer > 0:
+            if self.__logger is None:
+                self.__logger = logging.getLogger(__name__)
+            self.__logger.debug(f"sleeping {defer}s before next GitHub request to spread {resource} rate limit")
+            time.sleep(defer)
+
+    def responseCacheKey(
+        self, url: str, requestHeaders: dict[str, str], hostname: str | None = None, port: int | None = None
+    ) -> str:
+        """
+        Returns the key of the response cache of a GET request, shared by blocking and asynchronous requests.
+        Requires a response cache.
+
+        :param url: path and query of the request
+        :param requestHeaders: headers of the request
+        :param hostname: host of the request, defaults to the host of the base url
+        :param port: port of the request, defaults to the port of the base url for its host
+        """
+        if hostname is None:
+            hostname = self.__hostname
+        if port is None and hostname == self.__hostname:
+            port = self.__port
+        if port is None:
+            port = 443 if self.__scheme == "https" else 80
+        assert self.__response_cache is not None
+        # instances with different base urls may share a cache, so the key contains the scheme, host and port
+        return self.__response_cache.key(f"{self.__scheme}://{hostname}:{port}{url}", requestHeaders)
+
     def __recordRequestTime(self, verb: str) -> None:
-        # Updates self.__last_requests with current timestamp for given verb
-        self.__last_requests[verb] = datetime.now(timezone.utc).timestamp()
+        # Paces the next requests from the end of this request
+        self.__pacer.release(verb)
 
     def __makeAbsoluteUrl(self, url: str) -> str:
         # URLs generated locally will be relative to __base_url
@@ -1406,7 +1885,7 @@ class Requester:
         input: Any | None,
         status: int | None,
         responseHeaders: dict[str, Any],
-        output: str | object | None,
+        output: str | bytes | object | None,
     ) -> None:
         if self._logger.isEnabledFor(logging.DEBUG):
             headersForRequest = requestHeaders.copy()
@@ -1422,7 +1901,7 @@ class Requester:
                 input,
                 status,
                 responseHeaders,
-                output if isinstance(output, str) else "stream",
+                self.__text(output, "__log") if isinstance(output, (str, bytes)) else "stream",
             )
 
 
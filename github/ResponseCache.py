@@ -0,0 +1,214 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import os
+import threading
+from abc import ABC
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from github import Consts
+from github.Concurrency import LockPicklingMixin, atomic_write
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: dict[str, Any]
+    body: str
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get(Consts.RES_ETAG)
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get(Consts.RES_LAST_MODIFIED)
+
+
+class ResponseCache(ABC):
+    """
+    This class is the base class of all response caches.
+
+    A response cache given to :class:`github.Github` or :class:`github.Requester.Requester` stores responses of GET
+    requests that provide an ``ETag`` or ``Last-Modified`` header. Subsequent GET requests of the same host, url,
+    parameters, ``Accept`` header and authentication are sent as conditional requests, and the cached body is returned
+    when the server responds with ``304 Not Modified``. Such responses do not count against the primary rate limit.
+
+    Requests that already provide ``If-None-Match`` or ``If-Modified-Since`` headers bypass the cache.
+
+    """
+
+    @staticmethod
+    def key(url: str, headers: dict[str, str]) -> str:
+        """
+        Returns the cache key of a GET request to the given absolute url with given request headers.
+
+        The Authorization header is hashed, so keys do not contain credentials.
+        """
+        authorization = headers.get("Authorization")
+        return json.dumps(
+            [
+                url,
+                headers.get("Accept"),
+                headers.get(Consts.headerApiVersion),
+                hashlib.sha256(authorization.encode("utf-8")).hexdigest() if authorization is not None else None,
+            ]
+        )
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Returns the response stored for the given key, or None.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """
+        Stores the response for the given key.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the response stored for the given key, if any.
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Removes all responses.
+        """
+
+
+class MemoryResponseCache(LockPicklingMixin, ResponseCache):
+    """
+    This class caches responses in memory.
+
+    The least recently used responses are discarded once the bodies of all stored responses exceed ``max_bytes``.
+    Responses larger than ``max_bytes`` are not stored.
+
+    """
+
+    _locks = ("_MemoryResponseCache__lock",)
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        assert isinstance(max_bytes, int) and max_bytes > 0, max_bytes
+        self._max_bytes = max_bytes
+        self.__bytes = 0
+        self.__entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def bytes(self) -> int:
+        return self.__bytes
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self.__lock:
+            response = self.__entries.get(key)
+            if response is not None:
+                self.__entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self.__lock:
+            self.__remove(key)
+            if len(response.body) > self._max_bytes:
+                return
+            self.__entries[key] = response
+            self.__bytes += len(response.body)
+            while self.__bytes > self._max_bytes:
+                _, evicted = self.__entries.popitem(last=False)
+                self.__bytes -= len(evicted.body)
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            self.__remove(key)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def __remove(self, key: str) -> None:
+        response = self.__entries.pop(key, None)
+        if response is not None:
+            self.__bytes -= len(response.body)
+
+
+class FileResponseCache(ResponseCache):
+    """
+    This class caches responses as files in a directory, which can be shared by multiple processes.
+
+    """
+
+    def __init__(self, directory: str):
+        assert isinstance(directory, str) and len(directory) > 0, directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._directory = directory
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self._directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key: str) -> CachedResponse | None:
+        try:
+            with open(self.__path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry["key"] != key:
+                return None
+            return CachedResponse(entry["status"], entry["headers"], entry["body"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with atomic_write(self.__path(key), "w", encoding="utf-8") as f:
+            json.dump({"key": key, "status": response.status, "headers": response.headers, "body": response.body}, f)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self.__path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self._directory):
+            if name.endswith(".json"):
+                try:
+                    os.unlink(os.path.join(self._directory, name))
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,226 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar, Union
+
+import github.PaginatedList
+from github import Consts
+
+if TYPE_CHECKING:
+    from github.GithubObject import GithubObject
+    from github.Requester import Requester
+
+T = TypeVar("T", bound="GithubObject")
+Bound = Union[datetime, int]
+
+# qualifiers with date values, all other qualifiers have integer values
+DATE_QUALIFIERS = ("created", "updated", "pushed", "closed", "merged", "author-date", "committer-date")
+# earliest date of GitHub resources, the default start of date ranges
+GITHUB_EPOCH = datetime(2007, 10, 1, tzinfo=timezone.utc)
+
+
+class SearchShard(NamedTuple):
+    """
+    A search query restricted to a range of a qualifier, with the number of its results.
+    """
+
+    query: str
+    start: Bound
+    end: Bound
+    total_count: int
+
+
+class ShardedSearch(Generic[T]):
+    """
+    This class enumerates all results of a search, beyond the 1000 results the search API returns per query.
+
+    The query is split into shards by ranges of a qualifier, e.g. ``created:2020-01-01T00:00:00Z..2020-06-30T23:59:59Z``,
+    until each shard has at most 1000 results. Shards are counted by requesting a single result, ranges with more results
+    are split into as many ranges as needed if results were evenly distributed. Shards are then fetched by ``workers``
+    threads and results are yielded in order of the ranges, without duplicates of results that moved between shards
+    while iterating.
+
+    Requests are paced by the ``seconds_between_requests`` and ``rate_limit_scheduler`` settings of the
+    :class:`github.MainClass.Github` instance, the latter respecting the separate rate limit of the search API.
+
+    Results in a range of a single second or value are not split any further, such shards may be incomplete, which is
+    reported by :attr:`incomplete_results`.
+
+    """
+
+    def __init__(
+        self,
+        contentClass: type[T],
+        requester: Requester,
+        url: str,
+        parameters: dict[str, Any],
+        headers: dict[str, str] | None,
+        qualifier: str,
+        start: date | int | None = None,
+        end: date | int | None = None,
+        workers: int = Consts.DEFAULT_SEARCH_SHARD_WORKERS,
+    ):
+        assert isinstance(workers, int) and workers > 0, workers
+        query = parameters.get("q", "")
+        if f"{qualifier}:" in query:
+            raise ValueError(f"Query must not contain the qualifier {qualifier}: {query}")
+        if qualifier in DATE_QUALIFIERS:
+            if isinstance(start, int) or isinstance(end, int):
+                raise ValueError(f"Qualifier {qualifier} requires date start and end values")
+            start = self.__datetime(start if start is not None else GITHUB_EPOCH)
+            end = self.__datetime(end if end is not None else datetime.now(timezone.utc), last_second=True)
+        elif not isinstance(start, int) or not isinstance(end, int):
+            raise ValueError(f"Qualifier {qualifier} requires integer start and end values")
+        if start > end:  # type: ignore
+            raise ValueError(f"Start {start} must not be after end {end}")
+
+        self.__contentClass = contentClass
+        self.__requester = requester
+        self.__url = url
+        self.__parameters = parameters
+        self.__headers = headers
+        self.__qualifier = qualifier
+        self.__start: Bound = start  # type: ignore
+        self.__end: Bound = end  # type: ignore
+        self.__workers = workers
+        self.__shards: list[SearchShard] | None = None
+        self.__incomplete_results = False
+
+    @staticmethod
+    def __datetime(value: date, last_second: bool = False) -> datetime:
+        # a date refers to the entire day, so as an end bound it refers to the last second of the day
+        if not isinstance(value, datetime):
+            value = datetime(value.year, value.month, value.day)
+            if last_second:
+                value = value.replace(hour=23, minute=59, second=59)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).replace(microsecond=0)
+
+    @property
+    def shards(self) -> list[SearchShard]:
+        """
+        :type: the shards of the search, counted on first access
+        """
+        if self.__shards is None:
+            self.__shards = self.__plan()
+        return list(self.__shards)
+
+    @property
+    def totalCount(self) -> int:
+        """
+        :type: the total number of results of all shards
+        """
+        return sum(shard.total_count for shard in self.shards)
+
+    @property
+    def incomplete_results(self) -> bool:
+        """
+        :type: True if a shard has more results than the search API returns, or the search API reported incomplete
+               results for any shard
+        """
+        self.shards
+        return self.__incomplete_results
+
+    def __query(self, start: Bound, end: Bound) -> str:
+        return (
+            f"{self.__parameters.get('q', '')} {self.__qualifier}:{self.__format(start)}..{self.__format(end)}".strip()
+        )
+
+    @staticmethod
+    def __format(value: Bound) -> str:
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return str(value)
+
+    def __count(self, bounds: tuple[Bound, Bound]) -> SearchShard:
+        query = self.__query(*bounds)
+        parameters = dict(self.__parameters, q=query, per_page=1)
+        _, data = self.__requester.requestJsonAndCheck("GET", self.__url, parameters=parameters, headers=self.__headers)
+        if data.get("incomplete_results"):
+            self.__incomplete_results = True
+        return SearchShard(query, bounds[0], bounds[1], data.get("total_count", 0))
+
+    @staticmethod
+    def __split(start: Bound, end: Bound, parts: int) -> list[tuple[Bound, Bound]]:
+        unit: Any = timedelta(seconds=1) if isinstance(start, datetime) else 1
+        size = (end - start) / unit + 1  # type: ignore
+        parts = max(2, min(parts, int(size)))
+        bounds = [start + unit * (int(size) * part // parts) for part in range(parts)] + [end + unit]
+        return [(lower, upper - unit) for lower, upper in zip(bounds, bounds[1:])]
+
+    def __plan(self) -> list[SearchShard]:
+        shards = []
+        ranges: list[tuple[Bound, Bound]] = [(self.__start, self.__end)]
+        with ThreadPoolExecutor(max_workers=self.__workers, thread_name_prefix="ShardedSearch") as executor:
+            while ranges:
+                counted = list(executor.map(self.__count, ranges))
+                ranges = []
+                for shard in counted:
+                    if shard.total_count <= Consts.MAX_SEARCH_RESULTS or shard.start == shard.end:
+                        if shard.total_count > Consts.MAX_SEARCH_RESULTS:
+                            self.__incomplete_results = True
+                        if shard.total_count > 0:
+                            shards.append(shard)
+                    else:
+                        # as many ranges as needed if results were evenly distributed
+                        parts = -(-shard.total_count // Consts.MAX_SEARCH_RESULTS)
+                        ranges.extend(self.__split(shard.start, shard.end, parts))
+        return sorted(shards, key=lambda shard: shard.start)
+
+    def __fetch(self, shard: SearchShard) -> list[T]:
+        parameters = dict(self.__parameters, q=shard.query, per_page=Consts.MAX_PER_PAGE)
+        results = github.PaginatedList.PaginatedList(
+            self.__contentClass, self.__requester, self.__url, parameters, headers=self.__headers
+        )
+        elements = list(results)
+        if results.incomplete_results:
+            self.__incomplete_results = True
+        return elements
+
+    def __iter__(self) -> Iterator[T]:
+        seen = set()
+        shards = iter(self.shards)
+        executor = ThreadPoolExecutor(max_workers=self.__workers, thread_name_prefix="ShardedSearch")
+        try:
+            in_flight: deque[Future[list[T]]] = deque(
+                executor.submit(self.__fetch, shard) for shard in islice(shards, 2 * self.__workers)
+            )
+            while in_flight:
+                elements = in_flight.popleft().result()
+                shard = next(shards, None)
+                if shard is not None:
+                    in_flight.append(executor.submit(self.__fetch, shard))
+                for element in elements:
+                    # results may move between shards while iterating, e.g. when sharding by updated
+                    key = getattr(element, "url", None) or id(element)
+                    if key not in seen:
+                        seen.add(key)
+                        yield element
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,236 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import github.StatsCodeFrequency
+import github.StatsCommitActivity
+import github.StatsContributor
+import github.StatsParticipation
+import github.StatsPunchCard
+from github import Consts
+
+if TYPE_CHECKING:
+    from github.Repository import Repository
+    from github.Requester import Requester
+
+# statistics of a repository and how they are created from the response, as in Repository.get_stats_*
+STATS: dict[str, Callable[[Requester, dict[str, Any], Any], Any]] = {
+    "contributors": lambda requester, headers, data: [
+        github.StatsContributor.StatsContributor(requester, headers, attributes) for attributes in data
+    ],
+    "commit_activity": lambda requester, headers, data: [
+        github.StatsCommitActivity.StatsCommitActivity(requester, headers, attributes) for attributes in data
+    ],
+    "code_frequency": lambda requester, headers, data: [
+        github.StatsCodeFrequency.StatsCodeFrequency(requester, headers, attributes) for attributes in data
+    ],
+    "participation": lambda requester, headers, data: github.StatsParticipation.StatsParticipation(
+        requester, headers, data
+    ),
+    "punch_card": lambda requester, headers, data: github.StatsPunchCard.StatsPunchCard(requester, headers, data),
+}
+
+
+@dataclass
+class _Request:
+    requester: Requester
+    url: str
+    stats: str
+    future: Future = field(default_factory=Future)
+    attempts: int = 0
+
+
+class StatsPoller:
+    """
+    This class fetches statistics of many repositories without blocking while GitHub computes them.
+
+    GitHub computes statistics in the background and responds with ``202 Accepted`` until they are ready, on which
+    the ``get_stats_*`` methods of :class:`github.Repository.Repository` wait. Instead, :meth:`submit` requests
+    statistics right away, which starts their computation, and returns a :class:`concurrent.futures.Future`.
+    Statistics that are being computed are requested again after ``initial_wait`` seconds, doubling the wait up to
+    ``max_wait`` seconds, while requests of other repositories continue::
+
+        with StatsPoller() as poller:
+            futures = {repo.full_name: poller.submit(repo, "contributors") for repo in repos}
+        for name, future in futures.items():
+            print(name, len(future.result() or []))
+
+    Futures resolve to the result of the respective ``get_stats_*`` method, which is ``None`` when GitHub has not
+    computed the statistics after ``max_attempts`` requests. Cancelling a future stops requesting its statistics.
+
+    """
+
+    def __init__(
+        self,
+        workers: int = Consts.DEFAULT_STATS_WORKERS,
+        max_attempts: int = Consts.DEFAULT_PROCESSING_202_RETRIES + 1,
+        initial_wait: float = Consts.PROCESSING_202_WAIT_TIME,
+        max_wait: float = Consts.PROCESSING_202_MAX_WAIT_TIME,
+    ):
+        assert isinstance(workers, int) and workers > 0, workers
+        assert isinstance(max_attempts, int) and max_attempts > 0, max_attempts
+        assert initial_wait >= 0 and max_wait >= initial_wait, (initial_wait, max_wait)
+        self.__max_attempts = max_attempts
+        self.__initial_wait = initial_wait
+        self.__max_wait = max_wait
+        self.__executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="StatsPoller")
+        # requesters that return 202 responses right away, by requester of the repositories
+        self.__requesters: dict[Requester, Requester] = {}
+        # requests waiting for their next attempt, by time of the next attempt
+        self.__scheduled: list[tuple[float, int, _Request]] = []
+        self.__sequence = itertools.count()
+        self.__outstanding = 0
+        self.__closed = False
+        self.__condition = threading.Condition()
+        self.__scheduler: threading.Thread | None = None
+
+    def __enter__(self) -> StatsPoller:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def outstanding(self) -> int:
+        """
+        :type: int, number of submitted statistics that are not resolved yet
+        """
+        with self.__condition:
+            return self.__outstanding
+
+    def submit(self, repository: Repository, stats: str) -> Future:
+        """
+        :param repository: repository, a lazy repository avoids a request
+        :param stats: one of ``contributors``, ``commit_activity``, ``code_frequency``, ``participation`` or
+                      ``punch_card``
+        :return: future of the result of ``repository.get_stats_<stats>()``
+        """
+        if stats not in STATS:
+            raise ValueError(f"Unknown statistics {stats}, expected one of {', '.join(STATS)}")
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("Poller is closed")
+            requester = self.__requesters.get(repository.requester)
+            if requester is None:
+                requester = repository.requester.withProcessing202Retries(0)
+                self.__requesters[repository.requester] = requester
+            self.__outstanding += 1
+        request = _Request(requester, f"{repository.url}/stats/{stats}", stats)
+        request.future.add_done_callback(self.__cancelled)
+        self.__executor.submit(self.__fetch, request)
+        return request.future
+
+    def submit_all(self, repositories: Iterable[Repository], stats: str) -> list[Future]:
+        """
+        :return: futures of :meth:`submit` of all repositories, in order of the repositories
+        """
+        return [self.submit(repository, stats) for repository in repositories]
+
+    def close(self) -> None:
+        """
+        Waits for all submitted statistics to resolve and releases the threads.
+        """
+        with self.__condition:
+            while self.__outstanding:
+                self.__condition.wait()
+            self.__closed = True
+            self.__condition.notify_all()
+            scheduler, self.__scheduler = self.__scheduler, None
+        if scheduler is not None:
+            scheduler.join()
+        self.__executor.shutdown()
+
+    def __fetch(self, request: _Request) -> None:
+        scheduled = False
+        try:
+            if not request.future.cancelled():
+                scheduled = self.__attempt(request)
+        finally:
+            if not scheduled:
+                with self.__condition:
+                    self.__outstanding -= 1
+                    self.__condition.notify_all()
+
+    def __attempt(self, request: _Request) -> bool:
+        # returns True when the request has been scheduled for another attempt
+        request.attempts += 1
+        try:
+            status, headers, output = request.requester.requestJson("GET", request.url)
+            data = request.requester.json_backend.loads(output) if output else None
+            if status >= 400:
+                raise request.requester.createException(status, headers, data or {})
+            if status == 202 and request.attempts < self.__max_attempts:
+                return self.__schedule(request)
+            # statistics that are still being computed or are empty resolve to None, as with get_stats_*
+            result = STATS[request.stats](request.requester, headers, data) if status != 202 and data else None
+        except Exception as e:
+            # futures cancelled while requesting are not resolved
+            if request.future.set_running_or_notify_cancel():
+                request.future.set_exception(e)
+        else:
+            if request.future.set_running_or_notify_cancel():
+                request.future.set_result(result)
+        return False
+
+    def __schedule(self, request: _Request) -> bool:
+        wait = min(self.__initial_wait * 2 ** (request.attempts - 1), self.__max_wait)
+        with self.__condition:
+            if request.future.cancelled():
+                return False
+            heapq.heappush(self.__scheduled, (time.monotonic() + wait, next(self.__sequence), request))
+            if self.__scheduler is None:
+                self.__scheduler = threading.Thread(target=self.__run, name="StatsPollerScheduler", daemon=True)
+                self.__scheduler.start()
+            self.__condition.notify_all()
+        return True
+
+    def __cancelled(self, future: Future) -> None:
+        # wakes up the scheduler to drop cancelled requests
+        if future.cancelled():
+            with self.__condition:
+                self.__condition.notify_all()
+
+    def __run(self) -> None:
+        # submits scheduled requests to the executor once they are due, drops cancelled requests
+        with self.__condition:
+            while not self.__closed:
+                scheduled = [entry for entry in self.__scheduled if not entry[2].future.cancelled()]
+                if len(scheduled) < len(self.__scheduled):
+                    self.__outstanding -= len(self.__scheduled) - len(scheduled)
+                    heapq.heapify(scheduled)
+                    self.__scheduled = scheduled
+                    self.__condition.notify_all()
+                now = time.monotonic()
+                while self.__scheduled and self.__scheduled[0][0] <= now:
+                    _, _, request = heapq.heappop(self.__scheduled)
+                    self.__executor.submit(self.__fetch, request)
+                timeout = self.__scheduled[0][0] - now if self.__scheduled else None
+                self.__condition.wait(timeout)
@@ -0,0 +1,378 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import base64
+import hashlib
+import io
+import os
+import tarfile
+import threading
+from abc import ABC
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from github import Consts
+from github.Concurrency import LockPicklingMixin, atomic_write
+
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# file modes of tree entries
+MODE_EXECUTABLE = "100755"
+MODE_SYMLINK = "120000"
+
+
+def blob_sha(data: bytes) -> str:
+    """
+    Returns the git object id of a blob with the given content.
+    """
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class BlobCache(ABC):
+    """
+    This class is the base class of all blob caches.
+
+    A blob cache stores the content of git blobs by their sha, so that a :class:`TreeSnapshot` never downloads a file
+    content twice, across refs, repositories and, with a :class:`FileBlobCache`, across runs.
+
+    """
+
+    @abc.abstractmethod
+    def get(self, sha: str) -> bytes | None:
+        """
+        Returns the content of the blob with the given sha, or None.
+        """
+
+    @abc.abstractmethod
+    def set(self, sha: str, data: bytes) -> None:
+        """
+        Stores the content of the blob with the given sha.
+        """
+
+    def __contains__(self, sha: str) -> bool:
+        return self.get(sha) is not None
+
+
+class MemoryBlobCache(LockPicklingMixin, BlobCache):
+    """
+    This class caches blobs in memory.
+
+    The least recently used blobs are discarded once all stored blobs exceed ``max_bytes``. Blobs larger than
+    ``max_bytes`` are not stored.
+
+    """
+
+    _locks = ("_MemoryBlobCache__lock",)
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        assert isinstance(max_bytes, int) and max_bytes > 0, max_bytes
+        self._max_bytes = max_bytes
+        self.__bytes = 0
+        self.__entries: OrderedDict[str, bytes] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        """
+        :type: int, number of bytes of all stored blobs
+        """
+        return self.__bytes
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, sha: str) -> bool:
+        with self.__lock:
+            return sha in self.__entries
+
+    def get(self, sha: str) -> bytes | None:
+        with self.__lock:
+            data = self.__entries.get(sha)
+            if data is not None:
+                self.__entries.move_to_end(sha)
+            return data
+
+    def set(self, sha: str, data: bytes) -> None:
+        with self.__lock:
+            if sha in self.__entries or len(data) > self._max_bytes:
+                return
+            self.__entries[sha] = data
+            self.__bytes += len(data)
+            while self.__bytes > self._max_bytes:
+                _, evicted = self.__entries.popitem(last=False)
+                self.__bytes -= len(evicted)
+
+
+class FileBlobCache(BlobCache):
+    """
+    This class caches blobs as files in a directory, named by their sha, which can be shared by multiple processes.
+
+    Files whose content does not match their sha are ignored when read. Whether the cache contains a sha is checked by
+    the existence of its file only, so a :class:`TreeSnapshot` fetches such blobs when reading them.
+
+    """
+
+    def __init__(self, directory: str):
+        assert isinstance(directory, str) and len(directory) > 0, directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._directory = directory
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def __path(self, sha: str) -> str:
+        return os.path.join(self._directory, sha[:2], sha[2:])
+
+    def __contains__(self, sha: str) -> bool:
+        return os.path.isfile(self.__path(sha))
+
+    def get(self, sha: str) -> bytes | None:
+        try:
+            with open(self.__path(sha), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if blob_sha(data) != sha:
+            return None
+        return data
+
+    def set(self, sha: str, data: bytes) -> None:
+        path = self.__path(sha)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        with atomic_write(path) as f:
+            f.write(data)
+
+
+class SnapshotFile(NamedTuple):
+    """
+    A file of a :class:`TreeSnapshot`, its path is relative to the snapshot path.
+    """
+
+    path: str
+    mode: str
+    sha: str
+    size: int
+
+
+class TreeSnapshot:
+    """
+    This class provides the files of a repository directory at a ref, fetched with few requests.
+
+    All files below the path are listed with a single recursive tree request of that directory. File contents are
+    fetched as blobs, concurrently and once per distinct sha, and stored in a :class:`BlobCache`, so unchanged files
+    are not downloaded again by later snapshots that share the cache. When more than ``archive_threshold`` blobs are
+    missing from the cache, the tarball of the ref is streamed instead, which fetches all files with a single request.
+    Blobs missing from the tarball are fetched individually.
+
+    Trees with more entries than a recursive tree request returns are listed directory by directory.
+
+    """
+
+    def __init__(
+        self,
+        repository: Repository,
+        ref: str,
+        path: str = "",
+        cache: BlobCache | None = None,
+        workers: int = Consts.DEFAULT_SNAPSHOT_WORKERS,
+        archive_threshold: int | None = Consts.DEFAULT_SNAPSHOT_ARCHIVE_THRESHOLD,
+    ):
+        assert isinstance(ref, str), ref
+        assert isinstance(path, str), path
+        assert cache is None or isinstance(cache, BlobCache), cache
+        assert isinstance(workers, int) and workers > 0, workers
+        assert archive_threshold is None or archive_threshold >= 0, archive_threshold
+        self.__repository = repository
+        self.__ref = ref
+        self.__path = path.strip("/")
+        self.__cache = cache if cache is not None else MemoryBlobCache()
+        self.__workers = workers
+        self.__archive_threshold = archive_threshold
+
+        self.__files = {file.path: file for file in self.__listFiles()}
+
+    @property
+    def ref(self) -> str:
+        return self.__ref
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def cache(self) -> BlobCache:
+        return self.__cache
+
+    @property
+    def files(self) -> list[SnapshotFile]:
+        """
+        :type: list of :class:`SnapshotFile`, all files below :attr:`path`, excluding submodules
+        """
+        return list(self.__files.values())
+
+    def read(self, path: str) -> bytes:
+        """
+        :param path: path of a file relative to :attr:`path`
+        :return: content of the file
+        """
+        file = self.__files.get(path)
+        if file is None:
+            raise KeyError(path)
+        data = self.__cache.get(file.sha)
+        if data is None:
+            data = self.__fetchBlob(file.sha)
+        return data
+
+    def fetch(self) -> int:
+        """
+        Stores all file contents missing from the cache in the cache.
+
+        :return: number of fetched blobs
+        """
+        missing = {file.sha for file in self.__files.values() if file.sha not in self.__cache}
+        count = len(missing)
+        if not missing:
+            return 0
+        if self.__archive_threshold is not None and count > self.__archive_threshold:
+            self.__fetchArchive(missing)
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(self.__workers, len(missing)), thread_name_prefix="TreeSnapshot"
+            ) as executor:
+                list(executor.map(self.__fetchBlob, sorted(missing)))
+        return count
+
+    def contents(self) -> Iterator[tuple[SnapshotFile, bytes]]:
+        """
+        Fetches missing file contents, see :meth:`fetch`.
+
+        :return: iterator over all files and their contents
+        """
+        self.fetch()
+        for file in self.files:
+            yield file, self.read(file.path)
+
+    def write(self, directory: str) -> None:
+        """
+        Writes all files to the given directory, fetching missing file contents, see :meth:`fetch`. Executable files
+        are made executable, symbolic links are created as links.
+        """
+        for file, data in self.contents():
+            target = os.path.join(directory, *file.path.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if os.path.lexists(target):
+                os.unlink(target)
+            if file.mode == MODE_SYMLINK:
+                os.symlink(data.decode("utf-8"), target)
+                continue
+            with open(target, "wb") as f:
+                f.write(data)
+            if file.mode == MODE_EXECUTABLE:
+                os.chmod(target, os.stat(target).st_mode | 0o111)
+
+    def __listFiles(self) -> list[SnapshotFile]:
+        # only the tree of the path is listed, its paths are relative to the path
+        tree = self.__repository.get_git_tree(
+            f"{self.__ref}:{self.__path}" if self.__path else self.__ref, recursive=True
+        )
+        if not tree.truncated:
+            return [
+                SnapshotFile(element.path, element.mode, element.sha, element.size)
+                for element in tree.tree
+                if element.type == "blob"
+            ]
+        # the recursive tree is truncated, list the tree directory by directory
+        files = []
+        trees = [("", tree.sha)]
+        while trees:
+            directory, sha = trees.pop()
+            for element in self.__repository.get_git_tree(sha).tree:
+                path = f"{directory}{element.path}"
+                if element.type == "tree":
+                    trees.append((f"{path}/", element.sha))
+                elif element.type == "blob":
+                    files.append(SnapshotFile(path, element.mode, element.sha, element.size))
+        return files
+
+    def __fetchBlob(self, sha: str) -> bytes:
+        blob = self.__repository.get_git_blob(sha)
+        data = base64.b64decode(blob.content) if blob.encoding == "base64" else blob.content.encode("utf-8")
+        if blob_sha(data) != sha:
+            raise RuntimeError(f"Content of blob {sha} does not match its sha")
+        self.__cache.set(sha, data)
+        return data
+
+    def __fetchArchive(self, missing: set[str]) -> None:
+        # stores blobs of the tarball of the ref that are missing, removes them from missing
+        _, _, chunks = self.__repository.requester.getStream(f"{self.__repository.url}/tarball/{self.__ref}")
+        try:
+            with tarfile.open(fileobj=_ChunkReader(chunks), mode="r|gz") as archive:
+                for member in archive:
+                    if member.isfile():
+                        content = archive.extractfile(member)
+                        data = content.read() if content is not None else b""
+                    elif member.issym():
+                        data = member.linkname.encode("utf-8")
+                    else:
+                        continue
+                    sha = blob_sha(data)
+                    if sha in missing:
+                        self.__cache.set(sha, data)
+                        missing.discard(sha)
+                        if not missing:
+                            break
+        finally:
+            # releases the connection when the archive is not read entirely
+            chunks.close()
+
+
+class _ChunkReader(io.RawIOBase):
+    # file object reading from an iterator of chunks
+    def __init__(self, chunks: Iterator[bytes]):
+        self.__chunks = chunks
+        self.__buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self.__buffer:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                return 0
+            self.__buffer = chunk
+        size = min(len(buffer), len(self.__buffer))
+        buffer[:size] = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        return size
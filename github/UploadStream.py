@@ -0,0 +1,169 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+from collections.abc import Callable, Iterable, Iterator
+from typing import BinaryIO
+
+from github import Consts
+
+
+class UploadStream(io.RawIOBase):
+    """
+    This class streams the body of an upload request without loading the content into memory.
+
+    The content is read from a path to a local file, a binary file-like object or an iterable of ``bytes`` while it is
+    being sent, so at most one chunk is held in memory at a time. The digest of the content is computed on the fly and
+    available via :attr:`digest` once the content has been sent.
+
+    Streams of seekable sources can be rewound, which allows urllib3 to retry a failed request with the whole body.
+    Rewinding a stream of a non-seekable source raises :class:`io.UnsupportedOperation`, which urllib3 turns into an
+    ``UnrewindableBodyError`` rather than sending a truncated body.
+
+    :param source: path to a local file, binary file-like object or iterable of ``bytes``
+    :param size: size of the content in bytes, required for iterables and file-likes whose size cannot be determined
+    :param chunk_size: size of the chunks yielded when iterating over the stream
+    :param progress: callable called with the number of bytes sent so far and the total size
+    :param algorithm: name of the :mod:`hashlib` algorithm used to compute the digest
+
+    """
+
+    def __init__(
+        self,
+        source: str | BinaryIO | Iterable[bytes],
+        size: int | None = None,
+        chunk_size: int = Consts.DEFAULT_UPLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int], None] | None = None,
+        algorithm: str = "sha256",
+    ):
+        super().__init__()
+        assert isinstance(chunk_size, int) and chunk_size > 0, chunk_size
+        self.__file: BinaryIO | None = None
+        self.__chunks: Iterator[bytes] | None = None
+        self.__owns_file = False
+        self.__offset = 0
+        if isinstance(source, str):
+            self.__file = open(source, "rb")
+            self.__owns_file = True
+            if size is None:
+                size = os.fstat(self.__file.fileno()).st_size
+        elif hasattr(source, "read"):
+            self.__file = source  # type: ignore
+            if self.__seekable():
+                self.__offset = self.__file.tell()  # type: ignore
+                if size is None:
+                    size = self.__file.seek(0, io.SEEK_END) - self.__offset  # type: ignore
+                    self.__file.seek(self.__offset)  # type: ignore
+        else:
+            self.__chunks = iter(source)  # type: ignore
+        if size is None:
+            raise ValueError("size is required for sources whose size cannot be determined")
+        self.size = size
+        self.chunk_size = chunk_size
+        self.__progress = progress
+        self.__algorithm = algorithm
+        self.__hash = hashlib.new(algorithm)
+        self.__buffer = bytearray()
+        self.__position = 0
+
+    def __seekable(self) -> bool:
+        seekable = getattr(self.__file, "seekable", None)
+        return seekable is not None and seekable()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(self.chunk_size):
+            yield chunk
+
+    @property
+    def position(self) -> int:
+        """
+        Number of bytes read from the stream so far.
+        """
+        return self.__position
+
+    @property
+    def digest(self) -> str:
+        """
+        Digest of the content read so far in the ``<algorithm>:<hex digest>`` format GitHub uses for release assets.
+        """
+        return f"{self.__algorithm}:{self.__hash.hexdigest()}"
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self.__seekable()
+
+    def tell(self) -> int:
+        return self.__position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        # the digest cannot be recomputed from the middle of the content, so only rewinding to the start is supported
+        if whence == io.SEEK_CUR and offset == 0:
+            return self.__position
+        if whence != io.SEEK_SET or offset != 0 or not self.__seekable():
+            raise io.UnsupportedOperation("upload streams can only be rewound to the start of seekable sources")
+        self.__file.seek(self.__offset)  # type: ignore
+        self.__hash = hashlib.new(self.__algorithm)
+        self.__position = 0
+        return 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.size - self.__position
+        if self.__file is not None:
+            data = self.__file.read(size)
+        else:
+            data = self.__readChunks(size)
+        if data:
+            self.__hash.update(data)
+            self.__position += len(data)
+            if self.__progress is not None:
+                self.__progress(self.__position, self.size)
+        return data
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def __readChunks(self, size: int) -> bytes:
+        while len(self.__buffer) < size and self.__chunks is not None:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                self.__chunks = None
+            else:
+                self.__buffer += chunk
+        data = bytes(self.__buffer[:size])
+        del self.__buffer[:size]
+        return data
+
+    def close(self) -> None:
+        if self.__owns_file and self.__file is not None:
+            self.__file.close()
+        super().close()
@@ -37,14 +37,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, NamedTuple, overload
 
 import github.GitCommit
 import github.NamedUser
 import github.PullRequest
 import github.Repository
 import github.WorkflowJob
+from github import Consts
 from github.GithubObject import Attribute, CompletableGithubObject, NotSet, Opt, is_optional
 from github.PaginatedList import PaginatedList
 
@@ -369,6 +371,46 @@ class WorkflowRun(CompletableGithubObject):
         status, _, _ = self._requester.requestJson("DELETE", self.url)
         return status == 204
 
+    @overload
+    def download_logs(
+        self, path: None = None, chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE
+    ) -> tuple[int, dict[str, Any], Iterator]:
+        ...
+
+    @overload
+    def download_logs(
+        self,
+        path: str,
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int | None], None] | None = None,
+        max_resumes: int = Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
+    ) -> None:
+        ...
+
+    def download_logs(
+        self,
+        path: None | str = None,
+        chunk_size: int | None = Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        progress: Callable[[int, int | None], None] | None = None,
+        max_resumes: int = Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
+    ) -> tuple[int, dict[str, Any], Iterator] | None:
+        """
+        :calls: `GET /repos/{owner}/{repo}/actions/runs/{run_id}/logs <https://docs.github.com/en/rest/actions/workflow-runs#download-workflow-run-logs>`_
+
+        Download the zip archive of the logs to the path or return an iterator for the stream.
+
+        :param path: file to download the logs to, returns an iterator for the stream if not given
+        :param chunk_size: size of chunks read from the stream
+        :param progress: callable called with the number of bytes downloaded so far and the total size, if known
+        :param max_resumes: number of times a dropped download to the path is resumed with a Range request
+        """
+        if path is None:
+            return self._requester.getStream(self.logs_url, chunk_size=chunk_size)
+        self._requester.getFile(
+            self.logs_url, path=path, chunk_size=chunk_size, progress=progress, max_resumes=max_resumes
+        )
+        return None
+
     def jobs(self, _filter: Opt[str] = NotSet) -> PaginatedList[WorkflowJob]:
         """
         :calls "`GET /repos/{owner}/{repo}/actions/runs/{run_id}/jobs <https://docs.github.com/en/rest/reference/actions#list-jobs-for-a-workflow-run>`_
@@ -53,6 +53,7 @@ import logging
 
 from . import Auth
 from .AppAuthentication import AppAuthentication
+from .AsyncMainClass import AsyncGithub
 from .GithubException import (
     BadAttributeException,
     BadCredentialsException,
@@ -95,6 +96,7 @@ def enable_console_debug_logging() -> None:  # pragma no cover (Function useful
 __all__ = [
     "Auth",
     "AppAuthentication",
+    "AsyncGithub",
     "BadAttributeException",
     "BadCredentialsException",
     "BadUserAgentException",
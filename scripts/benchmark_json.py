@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+"""
+Micro-benchmark of the JSON backends decoding a page of repositories, as returned with per_page=100.
+
+    python scripts/benchmark_json.py --items 100 --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import timeit
+
+from github.JsonBackend import JsonBackend, OrjsonJsonBackend, StdlibJsonBackend
+
+REPOSITORY = os.path.join(os.path.dirname(__file__), "..", "tests", "ReplayData", "Repository.setUp.txt")
+
+
+def page(items: int) -> str:
+    # the response body of the first request in the replay data is a full repository
+    with open(REPOSITORY, encoding="utf-8") as f:
+        repository = json.loads(f.readlines()[9])
+    return json.dumps([dict(repository, id=repository["id"] + i) for i in range(items)])
+
+
+def backends() -> list[JsonBackend]:
+    try:
+        return [StdlibJsonBackend(), OrjsonJsonBackend()]
+    except ImportError:
+        return [StdlibJsonBackend()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100, help="number of repositories per page")
+    parser.add_argument("--repeat", type=int, default=200, help="number of pages decoded per measurement")
+    args = parser.parse_args()
+
+    text = page(args.items)
+    data = text.encode("utf-8")
+    document = json.loads(text)
+    size = len(data) / 1024 / 1024
+    print(f"page of {args.items} repositories, {size:.2f} MiB")
+    print(f"{'backend':<20} {'input':<8} {'pages/s':>10} {'MiB/s':>10}")
+
+    for backend in backends():
+        name = type(backend).__name__
+        for label, operation in [
+            ("str", lambda: backend.loads(text)),
+            ("bytes", lambda: backend.loads(data)),
+            ("dumps", lambda: backend.dumps(document)),
+        ]:
+            seconds = min(timeit.repeat(operation, number=args.repeat, repeat=3))
+            pages = args.repeat / seconds
+            print(f"{name:<20} {label:<8} {pages:>10.1f} {pages * size:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
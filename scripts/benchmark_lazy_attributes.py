@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+"""
+Micro-benchmark of creating pages of repositories with eagerly and lazily decoded attributes.
+
+    python scripts/benchmark_lazy_attributes.py --items 100 --pages 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import time
+from collections.abc import Callable
+
+import github
+from github.PaginatedList import PaginatedList
+from github.Repository import Repository
+from github.Requester import Requester
+
+REPOSITORY = os.path.join(os.path.dirname(__file__), "..", "tests", "ReplayData", "Repository.setUp.txt")
+
+
+def page(items: int) -> list[dict]:
+    # the response body of the first request in the replay data is a full repository
+    with open(REPOSITORY, encoding="utf-8") as f:
+        repository = json.loads(f.readlines()[9])
+    return [dict(repository, id=repository["id"] + i) for i in range(items)]
+
+
+def requester(lazy_attributes: bool) -> Requester:
+    return github.Github(lazy_attributes=lazy_attributes).requester
+
+
+def measure(lazy_attributes: bool, pages: list[list[dict]], read: Callable[[Repository], object]) -> float:
+    r = requester(lazy_attributes)
+    start = time.perf_counter()
+    for data in pages:
+        # the same as PaginatedList does for each page of a response
+        for repo in PaginatedList(Repository, r, firstData=data, firstHeaders={}):
+            read(repo)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100, help="number of repositories per page")
+    parser.add_argument("--pages", type=int, default=100, help="number of pages")
+    args = parser.parse_args()
+
+    data = page(args.items)
+    reads: list[tuple[str, Callable[[Repository], object]]] = [
+        ("create only", lambda repo: None),
+        ("full_name", lambda repo: repo.full_name),
+        ("full_name, owner", lambda repo: (repo.full_name, repo.owner.login)),
+        ("all attributes", lambda repo: [getattr(repo, name) for name in properties]),
+    ]
+    # properties not in the page would complete the repositories with further requests
+    properties = [name for name, value in vars(Repository).items() if isinstance(value, property) and name in data[0]]
+
+    print(f"{args.pages} pages of {args.items} repositories")
+    print(f"{'read':<20} {'eager/s':>12} {'lazy/s':>12} {'speedup':>8}")
+    for label, read in reads:
+        rates = []
+        for lazy_attributes in [False, True]:
+            pages = [copy.deepcopy(data) for _ in range(args.pages)]
+            rates.append(args.pages * args.items / measure(lazy_attributes, pages, read))
+        print(f"{label:<20} {rates[0]:>12.0f} {rates[1]:>12.0f} {rates[1] / rates[0]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
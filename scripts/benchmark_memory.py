@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+"""
+Memory benchmark of lists of issues, pull requests and repositories, as held by snapshots of many objects.
+
+    python scripts/benchmark_memory.py --items 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+from typing import Any
+
+import github
+from github.GithubObject import GithubObject
+from github.Issue import Issue
+from github.PaginatedList import PaginatedList
+from github.PullRequest import PullRequest
+from github.Repository import Repository
+
+REPLAY_DATA = os.path.join(os.path.dirname(__file__), "..", "tests", "ReplayData")
+
+# replay data file and request index of a response of each benchmarked class
+RESPONSES: list[tuple[type[GithubObject], str, int]] = [
+    (Issue, "Issue.setUp.txt", 1),
+    (PullRequest, "PullRequest.setUp.txt", 1),
+    (Repository, "Repository.setUp.txt", 0),
+]
+
+
+def response(filename: str, index: int) -> dict[str, Any]:
+    # each request in the replay data takes 11 lines, the response body is the tenth line
+    with open(os.path.join(REPLAY_DATA, filename), encoding="utf-8") as f:
+        return json.loads(f.readlines()[index * 11 + 9])
+
+
+def measure(klass: type[GithubObject], data: dict[str, Any], items: int, per_page: int, **kwargs: Any) -> int:
+    requester = github.Github(**kwargs).requester
+    headers = {"etag": 'W/"etag"', "content-type": "application/json; charset=utf-8", "x-ratelimit-remaining": "4999"}
+    # pages are decoded while tracing, so that the raw data retained by the objects is counted
+    pages = [
+        json.dumps([dict(data, id=i) for i in range(page, min(page + per_page, items))])
+        for page in range(0, items, per_page)
+    ]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = [
+            obj
+            for page in pages
+            for obj in PaginatedList(klass, requester, firstData=json.loads(page), firstHeaders=dict(headers))
+        ]
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        del objects
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000, help="number of objects per list")
+    parser.add_argument("--per-page", type=int, default=100, help="number of objects per page")
+    args = parser.parse_args()
+
+    print(f"lists of {args.items} objects, bytes per object")
+    print(f"{'class':<14} {'eager':>10} {'lazy':>10} {'no raw data':>12}")
+    for klass, filename, index in RESPONSES:
+        data = response(filename, index)
+        eager = measure(klass, data, args.items, args.per_page) / args.items
+        lazy = measure(klass, data, args.items, args.per_page, lazy_attributes=True) / args.items
+        discarded = measure(klass, data, args.items, args.per_page, retain_raw_data=False) / args.items
+        print(f"{klass.__name__:<14} {eager:>10.0f} {lazy:>10.0f} {discarded:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+"""
+Benchmark of decoding timestamps and short strings like states, conclusions and types as found in the replay data of
+the tests:
+
+    python scripts/benchmark_timestamps.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import Any
+
+from github.GithubObject import GithubObject, _datetime_from_github_isoformat
+
+REPLAY_DATA = os.path.join(os.path.dirname(__file__), "..", "tests", "ReplayData")
+
+TIMESTAMP = re.compile(r"^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ$")
+ENUM_KEYS = {"state", "conclusion", "type", "status", "event", "action", "role", "visibility", "permission"}
+
+
+def bodies() -> Iterator[Any]:
+    for filename in sorted(glob.glob(os.path.join(REPLAY_DATA, "*.txt"))):
+        with open(filename, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("{", "[")):
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        pass
+
+
+def values(data: Any, key: str | None = None) -> Iterator[tuple[str | None, Any]]:
+    if isinstance(data, dict):
+        for k, v in data.items():
+            yield from values(v, k)
+    elif isinstance(data, list):
+        for v in data:
+            yield from values(v, key)
+    else:
+        yield key, data
+
+
+def rewrite_z(value: str) -> datetime:
+    # the implementation before memoization
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def measure(parse: Callable[[str], object], timestamps: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _datetime_from_github_isoformat.cache_clear()
+        for timestamp in timestamps:
+            parse(timestamp)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="number of times all timestamps are parsed")
+    args = parser.parse_args()
+
+    timestamps = []
+    enums = []
+    for body in bodies():
+        for key, value in values(body):
+            if isinstance(value, str):
+                if TIMESTAMP.match(value):
+                    timestamps.append(value)
+                elif key in ENUM_KEYS:
+                    enums.append(value)
+
+    print(f"{len(timestamps)} timestamps, {len(set(timestamps))} distinct")
+    parsers: list[tuple[str, Callable[[str], object]]] = [
+        ("rewrite Z", rewrite_z),
+        ("fromisoformat", _datetime_from_github_isoformat.__wrapped__),  # type: ignore
+        ("memoized", _datetime_from_github_isoformat),
+    ]
+    baseline = None
+    print(f"{'parser':<16} {'timestamps/s':>14} {'speedup':>8}")
+    for label, parse in parsers:
+        rate = len(timestamps) * args.repeat / measure(parse, timestamps, args.repeat)
+        baseline = baseline or rate
+        print(f"{label:<16} {rate:>14.0f} {rate / baseline:>7.1f}x")
+
+    # strings decoded from JSON are distinct objects, even if equal
+    decoded = [json.loads(json.dumps(value)) for value in enums]
+    interned = [GithubObject._makeStringAttribute(value).value for value in decoded]
+    print(f"{len(enums)} enum-like strings, {len(set(enums))} distinct")
+    for label, strings in [("decoded", decoded), ("interned", interned)]:
+        size = sum(sys.getsizeof(s) for s in {id(s): s for s in strings}.values())
+        print(f"{label:<16} {size:>14} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,10 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 import github
+from github import Consts
 
 from . import Framework
 
@@ -90,3 +93,23 @@ class Artifact(Framework.TestCase):
         self.assertTrue(artifact.delete())
         with self.assertRaises(github.GithubException):
             repo.get_artifact(artifact_id)
+
+    def testDownload(self):
+        with self.replayData("Artifact.testGetSingleArtifactFromRepo.txt"):
+            artifact = self.repo.get_artifact(719509139)
+
+        with mock.patch.object(artifact.requester, "getFile") as getFile:
+            self.assertIsNone(artifact.download("archive.zip", workers=4))
+        getFile.assert_called_once_with(
+            artifact.archive_download_url,
+            path="archive.zip",
+            chunk_size=Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+            progress=None,
+            size=artifact.size_in_bytes,
+            workers=4,
+            max_resumes=Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
+        )
+
+        with mock.patch.object(artifact.requester, "getStream", return_value=(200, {}, iter([]))) as getStream:
+            self.assertEqual(artifact.download(chunk_size=1024)[0], 200)
+        getStream.assert_called_once_with(artifact.archive_download_url, chunk_size=1024)
@@ -0,0 +1,283 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import aiohttp
+import urllib3
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import github
+from github.RateLimitScheduler import RateLimitScheduler
+from github.ResponseCache import MemoryResponseCache
+
+
+class AsyncGithub(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # objects are not created from replay data, so there are no debug frames to check
+        self.check_after_init = github.GithubObject.GithubObject.CHECK_AFTER_INIT_FLAG
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(False)
+
+        self.requests = []
+        self.rate_limited = 0
+
+        app = web.Application()
+        app.router.add_get("/repos/PyGithub/PyGithub", self.get_repo)
+        app.router.add_get("/repos/PyGithub/PyGithub/issues", self.get_issues)
+        app.router.add_get("/users/jacquev6", self.get_user)
+        app.router.add_get("/orgs/unknown", self.get_unknown)
+        app.router.add_get("/repos/PyGithub/PyGithub/stats/contributors", self.get_stats)
+        app.router.add_get("/users/EnricoMi", self.get_cached_user)
+        app.router.add_get("/rate_limited", self.get_rate_limited)
+        app.router.add_route("*", "/disconnect", self.disconnect)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        self.gh = self.makeGithub()
+
+    def makeGithub(self, **kwargs):
+        # requests are not paced unless a test asks for it
+        kwargs.setdefault("seconds_between_requests", None)
+        kwargs.setdefault("seconds_between_writes", None)
+        kwargs.setdefault("auth", github.Auth.Token("token"))
+        kwargs.setdefault("retry", github.GithubRetry(secondary_rate_wait=0.01))
+        return github.AsyncGithub(
+            base_url=str(self.server.make_url("")).rstrip("/"),
+            **kwargs,
+        )
+
+    async def asyncTearDown(self):
+        await self.gh.close()
+        await self.server.close()
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(self.check_after_init)
+
+    async def get_repo(self, request):
+        self.requests.append(request)
+        return web.json_response(
+            {"id": 3544490, "full_name": "PyGithub/PyGithub", "owner": {"login": "PyGithub", "type": "Organization"}}
+        )
+
+    async def get_issues(self, request):
+        self.requests.append(request)
+        page = int(request.query.get("page", "1"))
+        headers = {}
+        if page < 3:
+            headers["Link"] = f'<{self.server.make_url(request.path)}?page={page + 1}>; rel="next"'
+        return web.json_response([{"number": page * 10 + i} for i in range(2)], headers=headers)
+
+    async def get_user(self, request):
+        self.requests.append(request)
+        if self.rate_limited < 1:
+            self.rate_limited += 1
+            return web.json_response({"message": "You have exceeded a secondary rate limit."}, status=403)
+        return web.json_response({"login": "jacquev6", "id": 327146})
+
+    async def get_unknown(self, request):
+        return web.json_response({"message": "Not Found"}, status=404)
+
+    async def get_cached_user(self, request):
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == '"etag"':
+            return web.Response(status=304, headers={"ETag": '"etag"'})
+        return web.json_response({"login": "EnricoMi", "id": 44700269}, headers={"ETag": '"etag"'})
+
+    async def get_rate_limited(self, request):
+        self.requests.append(request)
+        headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 30),
+            "X-RateLimit-Resource": "core",
+        }
+        return web.json_response({}, headers=headers)
+
+    async def disconnect(self, request):
+        # the server drops the connection without responding
+        self.requests.append(request)
+        request.transport.abort()
+        return web.Response()
+
+    async def get_stats(self, request):
+        # GitHub never finishes computing the statistics
+        self.requests.append(request)
+        return web.json_response({}, status=202)
+
+    async def testGetRepo(self):
+        repo = await self.gh.get_repo("PyGithub/PyGithub")
+        self.assertIsInstance(repo, github.Repository.Repository)
+        self.assertTrue(repo.completed)
+        self.assertEqual(repo.id, 3544490)
+        self.assertEqual(repo.full_name, "PyGithub/PyGithub")
+        self.assertEqual(repo.owner.login, "PyGithub")
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0].headers["Authorization"], "token token")
+        self.assertEqual(self.requests[0].headers["User-Agent"], "PyGithub/Python")
+
+    async def testPaginate(self):
+        repo = await self.gh.get_repo("PyGithub/PyGithub")
+        issues = self.gh.paginate(repo.get_issues())
+        self.assertEqual([issue.number async for issue in issues], [10, 11, 20, 21, 30, 31])
+        # iterating again does not send requests
+        self.assertEqual([issue.number async for issue in issues], [10, 11, 20, 21, 30, 31])
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual([issue.number for issue in await issues.get_page(1)], [20, 21])
+
+    async def testConcurrentRequests(self):
+        repos = await asyncio.gather(*[self.gh.get_repo("PyGithub/PyGithub") for _ in range(20)])
+        self.assertEqual({repo.full_name for repo in repos}, {"PyGithub/PyGithub"})
+        self.assertEqual(len(self.requests), 20)
+
+    async def testRetry(self):
+        user = await self.gh.get_user("jacquev6")
+        self.assertEqual(user.login, "jacquev6")
+        self.assertEqual(len(self.requests), 2)
+
+    async def testUnknownObject(self):
+        with self.assertRaises(github.UnknownObjectException) as raisedexp:
+            await self.gh.get_organization("unknown")
+        self.assertEqual(raisedexp.exception.status, 404)
+
+    async def testProcessing202Retries(self):
+        sleep = asyncio.sleep
+        waits = []
+
+        async def record(delay):
+            waits.append(delay)
+            await sleep(0)
+
+        with mock.patch("github.AsyncRequester.asyncio.sleep", record):
+            status, _, _ = await self.gh.requester.requestJson("GET", "/repos/PyGithub/PyGithub/stats/contributors")
+        self.assertEqual(status, 202)
+        self.assertEqual(len(self.requests), github.Consts.DEFAULT_PROCESSING_202_RETRIES + 1)
+        self.assertEqual(waits, [2, 4, 8, 16, 32, 60, 60, 60, 60, 60])
+
+    async def testProcessing202RetriesExhausted(self):
+        async def no_sleep(delay):
+            pass
+
+        with mock.patch("github.AsyncRequester.asyncio.sleep", no_sleep):
+            with self.assertRaises(github.GithubException) as raisedexp:
+                await self.gh.requester.requestJsonAndCheck("GET", "/repos/PyGithub/PyGithub/stats/contributors")
+        self.assertEqual(raisedexp.exception.status, 202)
+
+    async def testPacing(self):
+        # the interval is long enough that all three requests are reserved within it on a busy machine
+        async with self.makeGithub(seconds_between_requests=0.25) as gh:
+            await asyncio.gather(*[gh.get_repo("PyGithub/PyGithub") for _ in range(3)])
+            # async requests are paced by the pacer of the blocking requester
+            statistics = gh.github.requester.pacing_statistics
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(statistics.requests, 3)
+        self.assertEqual(statistics.deferred_requests, 2)
+        self.assertGreater(statistics.max_delay, 0.25)
+
+    async def testRateLimitScheduler(self):
+        scheduler = RateLimitScheduler(burst=1)
+        sleep = asyncio.sleep
+        waits = []
+
+        async def record(delay):
+            waits.append(delay)
+            await sleep(0)
+
+        async with self.makeGithub(rate_limit_scheduler=scheduler) as gh:
+            with mock.patch("github.AsyncRequester.asyncio.sleep", record):
+                await gh.requester.requestJsonAndCheck("GET", "/rate_limited")
+                self.assertEqual(scheduler.budget("core")["remaining"], 0)
+                self.assertEqual(waits, [])
+                # the exhausted budget defers the next request until reset
+                await gh.requester.requestJsonAndCheck("GET", "/rate_limited")
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(len(waits), 1)
+        self.assertGreater(waits[0], 25)
+
+    async def testResponseCache(self):
+        cache = MemoryResponseCache()
+        async with self.makeGithub(response_cache=cache) as gh:
+            first = await gh.get_user("EnricoMi")
+            second = await gh.get_user("EnricoMi")
+        self.assertEqual(first.login, "EnricoMi")
+        self.assertEqual(second.login, "EnricoMi")
+        self.assertEqual(second.id, 44700269)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"etag"')
+
+    async def testResponseCacheSharedWithBlockingRequests(self):
+        cache = MemoryResponseCache()
+        async with self.makeGithub(response_cache=cache) as gh:
+            await gh.get_user("EnricoMi")
+            # the base url has a port, blocking requests find the response cached by async requests
+            user = await asyncio.to_thread(gh.github.get_user, "EnricoMi")
+        self.assertEqual(user.id, 44700269)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"etag"')
+
+    async def testBlockingCallsRunInWorkerThreads(self):
+        loop_thread = threading.get_ident()
+        threads = {}
+
+        def record(name, method):
+            def call(*args):
+                threads.setdefault(name, set()).add(threading.get_ident())
+                return method(*args)
+
+            return call
+
+        cache = MemoryResponseCache()
+        scheduler = RateLimitScheduler()
+        auth = github.Auth.Token("token")
+        # the instances are local to this test, so their methods are replaced without restoring them
+        cache.get = record("get", cache.get)
+        cache.set = record("set", cache.set)
+        scheduler.acquire = record("acquire", scheduler.acquire)
+        scheduler.update = record("update", scheduler.update)
+        auth.authentication = record("authentication", auth.authentication)
+        async with self.makeGithub(auth=auth, response_cache=cache, rate_limit_scheduler=scheduler) as gh:
+            await gh.get_user("EnricoMi")
+        self.assertEqual(set(threads), {"get", "set", "acquire", "update", "authentication"})
+        for name, idents in threads.items():
+            self.assertNotIn(loop_thread, idents, name)
+
+    async def testRetryDisconnectedRequests(self):
+        async def no_sleep(delay):
+            pass
+
+        async with self.makeGithub(retry=github.GithubRetry(total=2)) as gh:
+            with mock.patch("github.AsyncRequester.asyncio.sleep", no_sleep):
+                with self.assertRaises(urllib3.exceptions.MaxRetryError):
+                    await gh.requester.requestJsonAndCheck("GET", "/disconnect")
+                # aiohttp itself may resend idempotent requests once on a reused connection
+                self.assertGreaterEqual(len(self.requests), 3)
+
+                # the server may have processed the PATCH request before the connection dropped, and the retry does
+                # not allow to resend PATCH requests
+                with self.assertRaises(aiohttp.ServerDisconnectedError):
+                    await gh.requester.requestJsonAndCheck("PATCH", "/disconnect", input={})
+        self.assertEqual([request.method for request in self.requests].count("PATCH"), 1)
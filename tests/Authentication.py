@@ -45,6 +45,7 @@
 ################################################################################
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from tempfile import NamedTemporaryFile
 from unittest import mock
@@ -326,6 +327,46 @@ class Authentication(Framework.BasicTestCase):
         )
         self.assertDictEqual(payload, {"iat": 1550055301, "exp": 1550055391, "iss": str(APP_ID)})
 
+    def testAppAuthTokenIsCached(self):
+        auth = github.Auth.AppAuth(APP_ID, PRIVATE_KEY, jwt_expiry=120, jwt_refresh_threshold=20)
+        self.assertEqual(auth.signature_count, 0)
+
+        with mock.patch("github.Auth.time") as t:
+            t.time = mock.Mock(return_value=1550055331.7435968)
+            token = auth.token
+            self.assertEqual(auth.signature_count, 1)
+
+            # token is reused until jwt_refresh_threshold seconds before expiry
+            t.time.return_value = 1550055331 + 99
+            self.assertEqual(auth.token, token)
+            self.assertEqual(auth.signature_count, 1)
+
+            # explicitly created JWTs are never cached
+            auth.create_jwt()
+            self.assertEqual(auth.signature_count, 2)
+            self.assertEqual(auth.token, token)
+
+            t.time.return_value = 1550055331 + 100
+            new_token = auth.token
+            self.assertEqual(auth.signature_count, 3)
+
+        self.assertNotEqual(new_token, token)
+        payload = jwt.decode(
+            new_token,
+            key=PUBLIC_KEY,
+            algorithms=["RS256"],
+            options={"verify_exp": False},
+            issuer=str(APP_ID),
+        )
+        self.assertDictEqual(payload, {"iat": 1550055371, "exp": 1550055551, "iss": str(APP_ID)})
+
+    def testAppAuthTokenIsCachedAcrossThreads(self):
+        auth = github.Auth.AppAuth(APP_ID, PRIVATE_KEY)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = set(executor.map(lambda _: auth.token, range(32)))
+        self.assertEqual(len(tokens), 1)
+        self.assertEqual(auth.signature_count, 1)
+
     def testUserAgent(self):
         g = github.Github(user_agent="PyGithubTester")
         self.assertEqual(g.get_user("jacquev6").name, "Vincent Jacques")
@@ -0,0 +1,101 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import github
+from github.GithubObject import CompletableGithubObject
+from github.NamedUser import NamedUser
+
+from . import Framework
+
+
+class CompleteAll(Framework.TestCase):
+    def testCompleteAll(self):
+        lazy = self.g.withLazy(True)
+        user = NamedUser(lazy.requester, url="/users/jacquev6")
+        repo = lazy.get_repo("PyGithub/PyGithub")
+        self.assertFalse(user.completed)
+        self.assertFalse(repo.completed)
+
+        # a single worker sends requests in order of the objects
+        with self.replayData("CompleteAll.testCompleteAll.txt"):
+            objects = CompletableGithubObject.complete_all([user, repo, "not completable"], workers=1)
+        self.assertEqual(objects, [user, repo, "not completable"])
+        self.assertTrue(user.completed)
+        self.assertTrue(repo.completed)
+        self.assertEqual(user.name, "Vincent Jacques")
+        self.assertEqual(repo.full_name, "PyGithub/PyGithub")
+
+        # completed objects are not completed again
+        CompletableGithubObject.complete_all([user, repo])
+
+    def testCompleteAllWithGraphQl(self):
+        requester = self.g.withLazy(True).requester
+        enrico = NamedUser(
+            requester,
+            attributes={
+                "login": "EnricoMi",
+                "node_id": "MDQ6VXNlcjQ0NzAwMjY5",
+                "url": "https://api.github.com/users/EnricoMi",
+            },
+        )
+        # not found via GraphQL
+        jacquev6 = NamedUser(
+            requester,
+            attributes={
+                "login": "jacquev6",
+                "node_id": "MDQ6VXNlcjMyNzE0Ng==",
+                "url": "https://api.github.com/users/jacquev6",
+            },
+        )
+        # no node id
+        lazy = NamedUser(requester, url="/users/jacquev6")
+
+        with self.replayData("CompleteAll.testCompleteAllWithGraphQl.txt"):
+            CompletableGithubObject.complete_all([enrico, jacquev6, lazy], workers=1, graphql=True)
+        self.assertFalse(enrico.completed)
+        self.assertEqual(enrico.id, 44700269)
+        self.assertEqual(enrico.name, "Enrico Minack")
+        self.assertEqual(enrico.company, "G-Research")
+        self.assertEqual(enrico.html_url, "https://github.com/EnricoMi")
+        self.assertEqual(enrico.url, "https://api.github.com/users/EnricoMi")
+        self.assertEqual(enrico.created_at, datetime(2018, 11, 2, 11, 12, 19, tzinfo=timezone.utc))
+        self.assertFalse(enrico.hireable)
+        self.assertFalse(enrico.completed)
+        self.assertTrue(jacquev6.completed)
+        self.assertEqual(jacquev6.name, "Vincent Jacques")
+        self.assertTrue(lazy.completed)
+        self.assertEqual(lazy.name, "Vincent Jacques")
+
+    def testPaginatedListComplete(self):
+        with self.replayData("CompleteAll.testPaginatedListComplete.txt"):
+            users = github.PaginatedList.PaginatedList(
+                NamedUser,
+                self.g.requester,
+                firstData=[{"login": "jacquev6", "url": "https://api.github.com/users/jacquev6"}],
+                firstHeaders={},
+            ).complete(workers=1)
+        self.assertEqual(len(users), 1)
+        self.assertTrue(users[0].completed)
+        self.assertEqual(users[0].name, "Vincent Jacques")
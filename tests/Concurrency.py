@@ -0,0 +1,87 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+
+from github.Concurrency import LockPicklingMixin, atomic_write
+
+
+class Guarded(LockPicklingMixin):
+    _locks = ("_Guarded__lock",)
+
+    def __init__(self) -> None:
+        self.value = 1
+        self.__lock = threading.Lock()
+
+    @property
+    def lock(self) -> threading.Lock:
+        return self.__lock
+
+
+class ReentrantGuarded(Guarded):
+    _lock_factory = threading.RLock
+
+
+class Concurrency(unittest.TestCase):
+    def testLockPicklingMixin(self):
+        guarded = Guarded()
+        with guarded.lock:
+            state = guarded.__getstate__()
+            self.assertEqual(state, {"value": 1})
+            copy = pickle.loads(pickle.dumps(guarded))
+        self.assertEqual(copy.value, 1)
+        self.assertIsNot(copy.lock, guarded.lock)
+        # the lock of the copy is a new lock, released even though the original lock was held while pickling
+        self.assertFalse(copy.lock.locked())
+
+    def testLockFactory(self):
+        copy = pickle.loads(pickle.dumps(ReentrantGuarded()))
+        with copy.lock:
+            # a reentrant lock can be acquired again by the same thread
+            self.assertTrue(copy.lock.acquire(blocking=False))
+            copy.lock.release()
+
+    def testAtomicWrite(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "file")
+            with atomic_write(path) as f:
+                f.write(b"content")
+            with atomic_write(path, "w", encoding="utf-8") as f:
+                f.write("replaced ✓")
+                # the file is replaced once the block exits
+                with open(path, "rb") as g:
+                    self.assertEqual(g.read(), b"content")
+            with open(path, encoding="utf-8") as g:
+                self.assertEqual(g.read(), "replaced ✓")
+
+            with self.assertRaises(RuntimeError):
+                with atomic_write(path) as f:
+                    f.write(b"partial")
+                    raise RuntimeError("failed")
+            with open(path, encoding="utf-8") as g:
+                self.assertEqual(g.read(), "replaced ✓")
+            self.assertEqual(os.listdir(directory), ["file"])
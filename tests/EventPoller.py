@@ -0,0 +1,188 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+from github.Event import Event
+from github.EventPoller import EventFeed
+from github.EventPoller import EventPoller as EventPollerImpl
+from github.GithubException import UnknownObjectException
+from github.Notification import Notification
+from github.PaginatedList import PaginatedList
+
+from . import Framework
+
+
+class EventPoller(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.repo = self.g.withLazy(True).get_repo("PyGithub/PyGithub")
+
+    def feed(self, **kwargs):
+        return self.repo.get_events().feed(**kwargs)
+
+    @staticmethod
+    def ids(elements):
+        return [element.id for element in elements]
+
+    def testFirstPollReturnsFirstPage(self):
+        feed = self.feed()
+
+        self.assertEqual(feed.next_poll, 0)
+        # events are listed newest first and returned oldest first, the next page is not fetched
+        self.assertEqual(self.ids(feed.poll()), ["4", "5"])
+        self.assertEqual(feed.poll_interval, 60)
+        self.assertGreater(feed.next_poll, 0)
+
+    def testPollIsConditional(self):
+        feed = self.feed()
+        self.assertEqual(self.ids(feed.poll()), ["1", "2"])
+
+        # the second poll is sent with the ETag of the first poll
+        self.assertEqual(feed.poll(), [])
+        self.assertEqual(feed.poll_interval, 90)
+
+    def testPollStopsPagingAtSeenEvent(self):
+        feed = self.feed()
+        feed.poll()
+
+        # the second page contains an event seen before, the third page is not fetched
+        self.assertEqual(self.ids(feed.poll()), ["3", "4", "5"])
+        self.assertEqual(self.ids(feed.poll()), ["6"])
+
+    def testPollDeduplicates(self):
+        feed = self.feed()
+        feed.poll()
+
+        # the etag changes, but the events do not
+        self.assertEqual(feed.poll(), [])
+
+    def testSeenSize(self):
+        feed = self.feed(seen_size=2)
+        feed.poll()
+        self.assertEqual(self.ids(feed.poll()), ["3", "4"])
+
+        # events 1 and 2 have been forgotten
+        self.assertEqual(self.ids(feed.poll()), ["1", "2"])
+
+    def testUpdatedNotificationIsNew(self):
+        feed = PaginatedList(Notification, self.g.requester, "/notifications", None).feed()
+        self.assertEqual(self.ids(feed.poll()), ["1", "2"])
+
+        # notification 1 has been updated
+        self.assertEqual(self.ids(feed.poll()), ["1"])
+        # the default poll interval applies without X-Poll-Interval header
+        self.assertEqual(feed.poll_interval, 60)
+
+    def testPollFailure(self):
+        feed = self.feed()
+
+        with self.assertRaises(UnknownObjectException):
+            feed.poll()
+        self.assertGreater(feed.next_poll, 0)
+
+    def testGraphQlListIsNotSupported(self):
+        pl = PaginatedList(Event, self.g.requester, None, None, graphql_query="query { }", list_item=["events"])
+        with self.assertRaises(RuntimeError):
+            pl.feed()
+
+    def testPollDue(self):
+        received = []
+        poller = EventPollerImpl()
+        feed = poller.add(self.repo.get_events(), lambda event: received.append(event.id))
+        events = PaginatedList(Event, self.g.requester, "/users/jacquev6/events", None)
+        other = poller.add(events.feed(), lambda event: received.append(f"other-{event.id}"))
+        self.assertIsInstance(feed, EventFeed)
+        self.assertEqual(poller.feeds, [feed, other])
+
+        with mock.patch("github.EventPoller.time.monotonic", return_value=1000.0):
+            self.assertEqual(poller.poll_due(), 4)
+            self.assertEqual(received, ["1", "2", "other-7", "other-8"])
+            # feeds are not due before their poll interval
+            self.assertEqual(poller.poll_due(), 0)
+        with mock.patch("github.EventPoller.time.monotonic", return_value=1060.0):
+            poller.remove(other)
+            self.assertEqual(poller.poll_due(), 1)
+        self.assertEqual(received, ["1", "2", "other-7", "other-8", "3"])
+
+    def testPollDueReportsErrors(self):
+        errors = []
+        poller = EventPollerImpl(on_error=lambda feed, e: errors.append((feed, e)))
+        feed = poller.add(self.feed(), lambda event: None)
+
+        self.assertEqual(poller.poll_due(), 0)
+        self.assertEqual(len(errors), 1)
+        self.assertIs(errors[0][0], feed)
+        self.assertIsInstance(errors[0][1], UnknownObjectException)
+
+        poller = EventPollerImpl()
+        poller.add(self.feed(), lambda event: None)
+        with self.assertLogs("github.EventPoller", "WARNING"):
+            poller.poll_due()
+
+    def testCallbackErrors(self):
+        errors = []
+        received = []
+
+        def callback(event):
+            received.append(event.id)
+            raise ValueError(event.id)
+
+        poller = EventPollerImpl(on_error=lambda feed, e: errors.append((feed, e)))
+        feed = poller.add(self.repo.get_events(), callback)
+
+        # a failing callback is called with the remaining elements, and the feed is polled again
+        with mock.patch("github.EventPoller.time.monotonic", return_value=1000.0):
+            self.assertEqual(poller.poll_due(), 2)
+        with mock.patch("github.EventPoller.time.monotonic", return_value=1060.0):
+            self.assertEqual(poller.poll_due(), 1)
+        self.assertEqual(received, ["1", "2", "3"])
+        self.assertEqual([(f, str(e)) for f, e in errors], [(feed, "1"), (feed, "2"), (feed, "3")])
+
+    def testThread(self):
+        received = threading.Event()
+        with self.replayData("EventPoller.testThread.txt"):
+            with EventPollerImpl() as poller:
+                poller.add(self.feed(), lambda event: received.set())
+                self.assertTrue(received.wait(10))
+                with self.assertRaises(RuntimeError):
+                    poller.start()
+
+    def testThreadSurvivesCallbackErrors(self):
+        received = []
+        done = threading.Event()
+
+        def callback(event):
+            received.append(event.id)
+            if len(received) == 2:
+                done.set()
+            raise ValueError(event.id)
+
+        with self.replayData("EventPoller.testThread.txt"), self.assertLogs("github.EventPoller", "WARNING") as logs:
+            with EventPollerImpl() as poller:
+                poller.add(self.feed(), callback)
+                # the first failing callback does not stop the thread
+                self.assertTrue(done.wait(10))
+        self.assertEqual(received, ["1", "2"])
+        self.assertEqual(len(logs.output), 2)
@@ -116,6 +116,9 @@ class FakeHttpResponse:
     def raise_for_status(self):
         pass
 
+    def close(self):
+        pass
+
 
 def fixAuthorizationHeader(headers):
     if "Authorization" in headers:
@@ -250,7 +253,7 @@ class RecordingConnection(Connection):
                 self.__writeLine(base64.b64encode(chunk).decode("ascii"))
             self.__writeLine("")
         else:
-            self.__writeLine(output)
+            self.__writeLine(output.decode("utf-8") if isinstance(output, bytes) else output)
         self.__writeLine("")
 
         self.addRequest(self.__request.with_response(status, dict(headers), output))
@@ -51,6 +51,7 @@ import zipfile
 from datetime import datetime, timezone
 
 from github import GithubException
+from github.UploadStream import UploadStream
 
 from . import Framework
 
@@ -316,3 +317,35 @@ class GitRelease(Framework.TestCase):
         self.assertTrue(asset_list is not None)
         self.assertEqual(len(asset_list), 1)
         self.tearDownNewRelease()
+
+    def testUploadAssetFromStream(self):
+        self.setUpNewRelease()
+        data = FileLikeStub().dat
+        stream = UploadStream((data[i : i + 10] for i in range(0, len(data), 10)), size=len(data))
+        release = self.new_release
+        release.upload_asset_from_stream(
+            stream,
+            name="file_like",
+            content_type="text/plain",
+            label="another unit test artifact",
+        )
+        asset_list = [x for x in release.get_assets()]
+        self.assertEqual(len(asset_list), 1)
+        self.assertEqual(asset_list[0].name, "file_like")
+        self.tearDownNewRelease()
+
+    def testUploadAssets(self):
+        self.setUpNewRelease()
+        release = self.new_release
+        # the upload runs in a worker thread, which cannot infer the replay data file from the stack
+        progress = []
+        with self.replayData("GitRelease.testUploadAssets.txt"):
+            assets = release.upload_assets(
+                [self.artifact_path],
+                content_type="application/zip",
+                labels={self.artifact_path: "unit test artifact"},
+                progress={self.artifact_path: lambda sent, total: progress.append((sent, total))},
+            )
+        self.assertEqual([asset.name for asset in assets], ["archive.zip"])
+        self.assertEqual(progress[-1][0], progress[-1][1])
+        self.tearDownNewRelease()
@@ -36,6 +36,8 @@
 ################################################################################
 
 import time  # NOQA
+from datetime import datetime, timezone
+from unittest import mock
 
 import requests  # NOQA
 from urllib3.exceptions import InsecureRequestWarning
@@ -43,6 +45,7 @@ from urllib3.exceptions import InsecureRequestWarning
 import github
 from github import Consts
 from github.Auth import AppInstallationAuth, Login
+from github.InstallationTokenCache import MemoryInstallationTokenCache
 
 from . import Framework
 
@@ -193,6 +196,14 @@ class GithubIntegration(Framework.BasicTestCase):
                 # change it here is well
                 lazy=True,
                 api_version="version",
+                response_cache=github.ResponseCache.MemoryResponseCache(),
+                rate_limit_scheduler=github.RateLimitScheduler.RateLimitScheduler(),
+                json_backend=github.JsonBackend.StdlibJsonBackend(),
+                lazy_attributes=True,
+                retain_raw_data=False,
+                identity_map=github.IdentityMap.IdentityMap(),
+                persisted_graphql_queries=True,
+                processing_202_retries=3,
             )
 
             # assert kwargs consists of ALL requester constructor arguments
@@ -212,6 +223,28 @@ class GithubIntegration(Framework.BasicTestCase):
             self.assertEqual(repo.full_name, "PyGithub/PyGithub")
             self.assertEqual(repo.id, 3544490)
 
+    def testGetGithubForInstallationSharesAccessToken(self):
+        # Replay data copied from testGetGithubForInstallation, with a single access token request
+        auth = github.Auth.AppAuth(APP_ID, PRIVATE_KEY)
+        github_integration = github.GithubIntegration(auth=auth)
+        self.assertIsInstance(github_integration.token_cache, MemoryInstallationTokenCache)
+
+        # control the current time used to check the expiry of the access token
+        with mock.patch("github.Auth.datetime") as dt:
+            dt.now = mock.Mock(return_value=datetime(2023, 6, 19, 7, 15, 0, tzinfo=timezone.utc))
+            for _ in range(2):
+                g = github_integration.get_github_for_installation(36541767)
+                self.assertIs(g.requester.auth.token_cache, github_integration.token_cache)
+                self.assertEqual(g.get_repo("PyGithub/PyGithub").id, 3544490)
+
+    def testGetGithubForInstallationWithoutTokenCache(self):
+        auth = github.Auth.AppAuth(APP_ID, PRIVATE_KEY)
+        github_integration = github.GithubIntegration(auth=auth, token_cache=None)
+        self.assertIsNone(github_integration.token_cache)
+        g = github_integration.get_github_for_installation(36541767)
+        self.assertIsNone(g.requester.auth.token_cache)
+        self.assertIs(github_integration.withLazy(True).token_cache, None)
+
     def testGetAccessToken(self):
         auth = github.Auth.AppAuth(APP_ID, PRIVATE_KEY)
         github_integration = github.GithubIntegration(
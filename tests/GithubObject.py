@@ -28,13 +28,22 @@
 
 from __future__ import annotations
 
+import copy
+import json
+import os
+import pickle
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest import mock
 
+import github.PaginatedList
 import github.Repository
 import github.RepositoryDiscussion
+from github import Consts
+from github.GithubException import BadAttributeException
+from github.Requester import Requester
 
 from . import Framework
 
@@ -181,6 +190,22 @@ class GithubObject(unittest.TestCase):
             self.assertEqual(gho._ValuedAttribute, type(actual), value)
             self.assertEqual(expected, actual.value, value)
 
+    def testMakeDatetimeAttributeMemoized(self):
+        first = gho.GithubObject._makeDatetimeAttribute("".join(["2021-01-23T12:34:56", "Z"]))
+        second = gho.GithubObject._makeDatetimeAttribute("".join(["2021-01-23T12:34:56", "Z"]))
+        self.assertIs(first.value, second.value)
+
+    def testMakeStringAttributeInterned(self):
+        first = gho.GithubObject._makeStringAttribute("".join(["comp", "leted"]))
+        second = gho.GithubObject._makeStringAttribute("".join(["comp", "leted"]))
+        self.assertIs(first.value, second.value)
+
+        # long strings are not interned
+        first = gho.GithubObject._makeStringAttribute("".join(["x"] * 100))
+        second = gho.GithubObject._makeStringAttribute("".join(["x"] * 100))
+        self.assertEqual(first.value, second.value)
+        self.assertIsNot(first.value, second.value)
+
     def testMakeHttpDatetimeAttribute(self):
         for value, expected in [
             (None, None),
@@ -243,6 +268,20 @@ class GithubObject(unittest.TestCase):
             self.assertEqual(int, e.exception.expected_type)
             self.assertIsNone(e.exception.transformation_exception)
 
+    def testAttributesHaveNoDict(self):
+        for attribute in [gho.NotSet, gho._ValuedAttribute(1), gho._BadAttribute("1", int)]:
+            self.assertFalse(hasattr(attribute, "__dict__"))
+
+    def testSharedAttributes(self):
+        for value in [None, True, False]:
+            self.assertIs(gho._ValuedAttribute(value), gho._ValuedAttribute(value))
+            self.assertIs(value, gho._ValuedAttribute(value).value)
+            self.assertIs(gho._ValuedAttribute(value), pickle.loads(pickle.dumps(gho._ValuedAttribute(value))))
+        self.assertIsNot(gho._ValuedAttribute(1), gho._ValuedAttribute(1))
+        self.assertEqual(1, gho._ValuedAttribute(1).value)
+        self.assertIs(gho.GithubObject._makeBoolAttribute(True), gho.GithubObject._makeBoolAttribute(True))
+        self.assertIs(gho.GithubObject._makeStringAttribute(None), gho.GithubObject._makeIntAttribute(None))
+
 
 class CompletableGithubObjectWithPaginatedProperty(Framework.TestCase):
     def testRepoCommitFilesDefault(self):
@@ -831,6 +870,173 @@ class CompletableGithubObjectWithPaginatedProperty(Framework.TestCase):
                 )
 
 
+class LazyAttributes(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        flag = gho.GithubObject.CHECK_AFTER_INIT_FLAG
+        gho.GithubObject.setCheckAfterInitFlag(False)
+        self.addCleanup(gho.GithubObject.setCheckAfterInitFlag, flag)
+        # the response body of the first request is a full repository
+        with open(os.path.join(Framework.BasicTestCase.replayDataFolder, "Repository.setUp.txt")) as f:
+            self.attributes = json.loads(f.readlines()[9])
+
+    def repository(
+        self, lazy_attributes: bool, attributes: dict[str, Any] | None = None
+    ) -> github.Repository.Repository:
+        requester = Requester(
+            auth=None,
+            base_url=Consts.DEFAULT_BASE_URL,
+            timeout=Consts.DEFAULT_TIMEOUT,
+            user_agent=Consts.DEFAULT_USER_AGENT,
+            per_page=Consts.DEFAULT_PER_PAGE,
+            verify=True,
+            retry=None,
+            pool_size=None,
+            lazy_attributes=lazy_attributes,
+        )
+        attributes = copy.deepcopy(attributes or self.attributes)
+        return github.Repository.Repository(requester, {}, attributes, completed=True)
+
+    @staticmethod
+    def properties(obj: gho.GithubObject) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for name, value in vars(type(obj)).items():
+            if isinstance(value, property):
+                try:
+                    values[name] = repr(getattr(obj, name))
+                except Exception as e:
+                    values[name] = type(e)
+        return values
+
+    def testAttributesDecodedOnAccess(self):
+        repo = self.repository(lazy_attributes=True)
+        self.assertNotIn("_full_name", vars(repo))
+        self.assertNotIn("_owner", vars(repo))
+        self.assertEqual(repo.full_name, "PyGithub/PyGithub")
+        self.assertIn("_full_name", vars(repo))
+        self.assertNotIn("_owner", vars(repo))
+        self.assertEqual(repo.owner.login, "PyGithub")
+        self.assertIs(repo.owner, repo.owner)
+
+    def testAttributesEqualEagerAttributes(self):
+        eager = self.repository(lazy_attributes=False)
+        lazy = self.repository(lazy_attributes=True)
+        self.assertEqual(self.properties(lazy), self.properties(eager))
+        self.assertEqual(lazy.raw_data, eager.raw_data)
+
+    def testMissingAttributes(self):
+        attributes = {k: v for k, v in self.attributes.items() if k not in ["description", "id"]}
+        eager = self.repository(lazy_attributes=False, attributes=attributes)
+        lazy = self.repository(lazy_attributes=True, attributes=attributes)
+        self.assertEqual(self.properties(lazy), self.properties(eager))
+
+    def testBadAttributes(self):
+        attributes = dict(self.attributes, forks_count="many", created_at=123)
+        for lazy_attributes in [False, True]:
+            repo = self.repository(lazy_attributes=lazy_attributes, attributes=attributes)
+            self.assertEqual(repo.name, "PyGithub")
+            with self.assertRaises(BadAttributeException):
+                repo.forks_count
+            with self.assertRaises(BadAttributeException):
+                repo.created_at
+
+    def testConcurrentAccess(self):
+        repos = [self.repository(lazy_attributes=True) for _ in range(20)]
+        expected = self.properties(self.repository(lazy_attributes=False))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for properties in executor.map(self.properties, repos * 4):
+                self.assertEqual(properties, expected)
+
+
+class RetainRawData(unittest.TestCase):
+    headers = {"etag": 'W/"1234"', "last-modified": "Sat, 25 Feb 2012 12:53:47 GMT", "x-ratelimit-remaining": "4999"}
+
+    def setUp(self):
+        super().setUp()
+        flag = gho.GithubObject.CHECK_AFTER_INIT_FLAG
+        gho.GithubObject.setCheckAfterInitFlag(False)
+        self.addCleanup(gho.GithubObject.setCheckAfterInitFlag, flag)
+        # the response body of the first request is a full repository
+        with open(os.path.join(Framework.BasicTestCase.replayDataFolder, "Repository.setUp.txt")) as f:
+            self.attributes = json.loads(f.readlines()[9])
+
+    @staticmethod
+    def requester(retain_raw_data: bool, lazy_attributes: bool = False) -> Requester:
+        return Requester(
+            auth=None,
+            base_url=Consts.DEFAULT_BASE_URL,
+            timeout=Consts.DEFAULT_TIMEOUT,
+            user_agent=Consts.DEFAULT_USER_AGENT,
+            per_page=Consts.DEFAULT_PER_PAGE,
+            verify=True,
+            retry=None,
+            pool_size=None,
+            lazy_attributes=lazy_attributes,
+            retain_raw_data=retain_raw_data,
+        )
+
+    def repository(
+        self, requester: Requester, attributes: dict[str, Any] | None = None
+    ) -> github.Repository.Repository:
+        attributes = copy.deepcopy(attributes or self.attributes)
+        return github.Repository.Repository(requester, dict(self.headers), attributes, completed=True)
+
+    def testRawDataDiscarded(self):
+        retained = self.repository(self.requester(retain_raw_data=True))
+        discarded = self.repository(self.requester(retain_raw_data=False))
+        self.assertIsNotNone(vars(retained)["_rawData"])
+        self.assertIsNone(vars(discarded)["_rawData"])
+        self.assertIsNone(vars(discarded.owner)["_rawData"])
+        self.assertEqual(LazyAttributes.properties(discarded), LazyAttributes.properties(retained))
+
+    def testHeadersShared(self):
+        requester = self.requester(retain_raw_data=False)
+        repo = self.repository(requester)
+        other = self.repository(requester)
+        self.assertEqual(repo.raw_headers, {"etag": 'W/"1234"', "last-modified": "Sat, 25 Feb 2012 12:53:47 GMT"})
+        self.assertEqual(repo.etag, 'W/"1234"')
+        self.assertIs(vars(repo)["_headers"], vars(other)["_headers"])
+        self.assertIs(vars(repo)["_headers"], vars(repo.owner)["_headers"])
+        # mutating the headers of one object does not change the shared headers
+        repo.raw_headers["etag"] = "changed"
+        self.assertEqual(other.raw_headers["etag"], 'W/"1234"')
+        self.assertEqual(repo.etag, 'W/"1234"')
+
+    def testRawDataReconstructed(self):
+        repo = self.repository(self.requester(retain_raw_data=False))
+        raw_data = repo.raw_data
+        self.assertEqual(raw_data["full_name"], "PyGithub/PyGithub")
+        self.assertEqual(raw_data["created_at"], self.attributes["created_at"])
+        self.assertEqual(raw_data["owner"]["login"], "PyGithub")
+        self.assertEqual(raw_data["permissions"], self.attributes["permissions"])
+
+        # objects created from the reconstructed raw data equal the original objects
+        recreated = self.repository(self.requester(retain_raw_data=True), raw_data)
+        self.assertEqual(LazyAttributes.properties(recreated), LazyAttributes.properties(repo))
+
+    def testRawDataReconstructedWithBadAttributes(self):
+        attributes = dict(self.attributes, forks_count="many")
+        repo = self.repository(self.requester(retain_raw_data=False), attributes)
+        self.assertEqual(repo.raw_data["forks_count"], "many")
+
+    def testRawDataDiscardedOnceLazilyDecoded(self):
+        repo = self.repository(self.requester(retain_raw_data=False, lazy_attributes=True))
+        self.assertIsNotNone(vars(repo)["_rawData"])
+        self.assertEqual(repo.raw_data["full_name"], "PyGithub/PyGithub")
+        self.assertIsNone(vars(repo)["_rawData"])
+
+    def testPaginatedList(self):
+        requester = self.requester(retain_raw_data=True)
+        repos = github.PaginatedList.PaginatedList(
+            github.Repository.Repository, requester, firstData=[self.attributes], firstHeaders=self.headers
+        )
+        self.assertIsNotNone(vars(repos[0])["_rawData"])
+        repos = repos.with_retain_raw_data(False)
+        self.assertIsNone(vars(repos[0])["_rawData"])
+        self.assertEqual(repos[0].full_name, "PyGithub/PyGithub")
+        self.assertTrue(requester.retain_raw_data)
+
+
 class TestingClass(gho.NonCompletableGithubObject):
     def _initAttributes(self) -> None:
         pass
@@ -0,0 +1,191 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import threading
+import unittest
+import unittest.mock
+
+import github
+from github.GraphQlBatcher import GraphQlBatcher, _parse_field, _rename_variables, add_rate_limit, estimate_nodes
+
+from . import Framework
+
+REPOSITORY = "repository(owner: $owner, name: $name) { nameWithOwner stargazerCount }"
+TYPES = {"owner": "String!", "name": "String!"}
+
+
+class GraphQlBatcherRequests(Framework.TestCase):
+    def testQuery(self):
+        batcher = GraphQlBatcher(self.g.requester, batch_size=2)
+        with self.replayData("GraphQlBatcher.testQuery.txt"):
+            with batcher:
+                pygithub = batcher.query(REPOSITORY, {"owner": "PyGithub", "name": "PyGithub"}, TYPES)
+                unknown = batcher.query(REPOSITORY, {"owner": "PyGithub", "name": "unknown"}, TYPES)
+                # the batch is full and sent
+                self.assertEqual(batcher.pending, 0)
+                self.assertEqual(batcher.requests, 1)
+                viewer = batcher.query("me: viewer { login }")
+                self.assertEqual(batcher.pending, 1)
+        self.assertEqual(batcher.pending, 0)
+        self.assertEqual(batcher.requests, 2)
+
+        self.assertEqual(
+            pygithub.result(), {"repository": {"nameWithOwner": "PyGithub/PyGithub", "stargazerCount": 7150}}
+        )
+        self.assertEqual(viewer.result(), {"me": {"login": "EnricoMi"}})
+        with self.assertRaises(github.UnknownObjectException) as raisedexp:
+            unknown.result()
+        self.assertEqual(raisedexp.exception.status, 404)
+        self.assertEqual(
+            raisedexp.exception.message, "Could not resolve to a Repository with the name 'PyGithub/unknown'."
+        )
+        self.assertEqual(raisedexp.exception.data["errors"][0]["path"], ["repository"])
+
+    def testResultSendsPendingQueries(self):
+        batcher = GraphQlBatcher(self.g.requester)
+        future = batcher.query("me: viewer { login }")
+        self.assertFalse(future.done())
+        with self.replayData("GraphQlBatcher.testResultSendsPendingQueries.txt"):
+            self.assertEqual(future.result(), {"me": {"login": "EnricoMi"}})
+        self.assertEqual(batcher.requests, 1)
+
+
+class GraphQlBatcherTests(unittest.TestCase):
+    def testParseField(self):
+        self.assertEqual(_parse_field(" viewer { login } "), ("viewer", "viewer { login }"))
+        self.assertEqual(_parse_field('me: user(login: "a{") { login }'), ("me", 'user(login: "a{") { login }'))
+        for selection in ["{ viewer { login } }", "viewer { login } user { login }", "viewer { login"]:
+            with self.assertRaises(ValueError):
+                _parse_field(selection)
+
+    def testRenameVariables(self):
+        self.assertEqual(_rename_variables(REPOSITORY, TYPES, "q0_").count("$q0_"), 2)
+        selection = 'search(query: "price: $owner \\" $owner", first: $first) @include(if: $owner) { issueCount }'
+        self.assertEqual(
+            _rename_variables(selection, {"owner", "first"}, "q1_"),
+            'search(query: "price: $owner \\" $owner", first: $q1_first) @include(if: $q1_owner) { issueCount }',
+        )
+        # variables not given are left untouched
+        self.assertEqual(_rename_variables(selection, set(), "q1_"), selection)
+
+    def testEstimateNodes(self):
+        self.assertEqual(estimate_nodes("viewer { login }", {}), 1)
+        field = "repository { issues(first: $n) { nodes { labels(last: 10) { nodes { name } } } } }"
+        self.assertEqual(estimate_nodes(field, {"n": 50}), 50 + 50 * 10)
+        # unknown page sizes are null
+        self.assertEqual(estimate_nodes(field, {}), 10)
+        field = "repository { issues(first: $first, last: $last) { nodes { id } } }"
+        self.assertEqual(estimate_nodes(field, {"last": 20}), 20)
+        self.assertEqual(estimate_nodes(f"query Q($first: Int, $last: Int) {{ {field} }}", {"first": 30}), 30)
+
+    def testAddRateLimit(self):
+        rate_limit = "rateLimit { cost remaining }"
+        self.assertEqual(add_rate_limit("{ viewer { login } }"), f"{{ viewer {{ login }}\n  {rate_limit}\n}}")
+        query = add_rate_limit(
+            'query Q($q: String = "}") { search(query: $q) { ...Page } }\nfragment Page on SearchResultItemConnection {'
+            " nodes { __typename } }"
+        )
+        self.assertEqual(
+            query,
+            f'query Q($q: String = "}}") {{ search(query: $q) {{ ...Page }}\n  {rate_limit}\n}}\n'
+            "fragment Page on SearchResultItemConnection { nodes { __typename } }",
+        )
+        query = add_rate_limit("fragment F on User { login }\nquery { viewer { ...F } }")
+        self.assertEqual(query, f"fragment F on User {{ login }}\nquery {{ viewer {{ ...F }}\n  {rate_limit}\n}}")
+        with self.assertRaises(ValueError):
+            add_rate_limit("fragment F on User { login }")
+
+    def testBatches(self):
+        sent = []
+
+        class Requester:
+            def graphql_request(self, query, variables):
+                sent.append(query)
+                fields = query.splitlines()[1:-1]
+                return {}, {"data": {field.split(":")[0].strip(): len(sent) for field in fields}}
+
+        field = "repository { issues(first: 100) { nodes { labels(first: 100) { nodes { name } } } } }"
+        with GraphQlBatcher(Requester(), batch_size=10) as batcher:
+            futures = [batcher.query(field) for _ in range(120)]
+        self.assertEqual([len(query.splitlines()) - 2 for query in sent], [10] * 12)
+
+        sent.clear()
+        with GraphQlBatcher(Requester(), batch_size=100) as batcher:
+            futures = [batcher.query(field) for _ in range(120)]
+        # each query requests 10,100 nodes, so at most 49 queries fit into a single request
+        self.assertEqual([len(query.splitlines()) - 2 for query in sent], [49, 49, 2, 20])
+        self.assertEqual([future.result() for future in futures[48:50]], [{"repository": 1}, {"repository": 2}])
+
+    def testPersistedQueries(self):
+        requester = github.Github(persisted_graphql_queries=True).requester
+        with unittest.mock.patch.object(requester, "requestJsonAndCheck") as request:
+            request.return_value = ({}, {"data": {"q0": {"login": "EnricoMi"}}})
+            with GraphQlBatcher(requester) as batcher:
+                viewer = batcher.query("viewer { login }")
+        self.assertEqual(viewer.result(), {"viewer": {"login": "EnricoMi"}})
+        # batches are sent via the requester, which refers to persisted queries by hash
+        (verb, url), kwargs = request.call_args
+        self.assertEqual(url, requester.graphql_url)
+        self.assertNotIn("query", kwargs["input"])
+        self.assertEqual(set(kwargs["input"]["extensions"]), {"persistedQuery"})
+
+    def testVariables(self):
+        batcher = GraphQlBatcher(unittest.mock.Mock())
+        with self.assertRaises(ValueError):
+            batcher.query(REPOSITORY, {"owner": "PyGithub"}, TYPES)
+
+    def testCancelledFuturesAreNotSent(self):
+        requester = unittest.mock.Mock()
+        batcher = GraphQlBatcher(requester)
+        batcher.query("viewer { login }").cancel()
+        batcher.flush()
+        requester.graphql_request.assert_not_called()
+
+    def testRequestErrorFailsAllFutures(self):
+        requester = unittest.mock.Mock()
+        requester.graphql_request.side_effect = github.GithubException(502, None, None)
+        batcher = GraphQlBatcher(requester)
+        futures = [batcher.query("viewer { login }") for _ in range(3)]
+        self.assertTrue(all(isinstance(future.exception(), github.GithubException) for future in futures))
+        self.assertEqual(requester.graphql_request.call_count, 1)
+
+    def testConcurrentQueries(self):
+        requester = unittest.mock.Mock()
+        requester.graphql_request.side_effect = lambda query, variables: (
+            {},
+            {"data": {line.split(":")[0].strip(): "ok" for line in query.splitlines()[1:-1]}},
+        )
+        batcher = GraphQlBatcher(requester, batch_size=7)
+        futures = []
+
+        def query():
+            for _ in range(10):
+                futures.append(batcher.query("viewer { login }"))
+
+        threads = [threading.Thread(target=query) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual({future.result()["viewer"] for future in futures}, {"ok"})
+        self.assertEqual(batcher.requests, requester.graphql_request.call_count)
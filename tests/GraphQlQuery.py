@@ -0,0 +1,112 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import hashlib
+import unittest
+
+import github
+from github.GraphQlQuery import GraphQlQueryRegistry, registry
+
+from . import Framework
+
+VIEWER = "query Q { viewer { login } }"
+
+
+class GraphQlQueryRequests(Framework.TestCase):
+    def github(self):
+        return github.Github(
+            auth=self.oauth_token,
+            per_page=self.per_page,
+            seconds_between_requests=self.seconds_between_requests,
+            seconds_between_writes=self.seconds_between_writes,
+            persisted_graphql_queries=True,
+        )
+
+    def testPersistedQuery(self):
+        requester = self.github().requester
+        self.assertTrue(requester.persisted_graphql_queries)
+        with self.replayData("GraphQlQuery.testPersistedQuery.txt"):
+            # the unknown hash is followed by the document, later requests only send the hash
+            for _ in range(2):
+                _, data = requester.graphql_query(VIEWER, {})
+                self.assertEqual(data, {"data": {"viewer": {"login": "EnricoMi"}}})
+        self.assertIsNotNone(registry.get(hashlib.sha256(VIEWER.encode()).hexdigest()))
+
+    def testPersistedQueryNotSupported(self):
+        requester = self.github().requester
+        with self.replayData("GraphQlQuery.testPersistedQueryNotSupported.txt"):
+            # once not supported, the document is always sent
+            for _ in range(2):
+                _, data = requester.graphql_query(VIEWER, {})
+                self.assertEqual(data, {"data": {"viewer": {"login": "EnricoMi"}}})
+
+
+class GraphQlQueryTests(unittest.TestCase):
+    def testQuery(self):
+        queries = GraphQlQueryRegistry()
+        query = queries.query(VIEWER, "viewer")
+        self.assertEqual(query.name, "viewer")
+        self.assertEqual(query.document, VIEWER)
+        self.assertEqual(query.sha256, hashlib.sha256(VIEWER.encode()).hexdigest())
+        self.assertEqual(query.persisted_query, {"persistedQuery": {"version": 1, "sha256Hash": query.sha256}})
+        self.assertIs(queries.query(VIEWER), query)
+        self.assertIs(queries.get(query.sha256), query)
+        self.assertIsNone(queries.get("unknown"))
+        self.assertEqual(queries.queries(), [query])
+
+    def testTemplates(self):
+        queries = GraphQlQueryRegistry()
+        node = queries.node("User", "login")
+        self.assertIs(queries.node("User", "login"), node)
+        self.assertEqual(node.name, "node:User")
+        self.assertIn("... on User { login }", node.document)
+        self.assertIn("query Q($id: ID!)", node.document)
+        nodes = queries.nodes("User", "\n login\n")
+        self.assertIn("... on User {\n login\n}", nodes.document)
+        self.assertIn("nodes(ids: $ids)", nodes.document)
+        mutation = queries.named_mutation("addReaction", "reaction { id }")
+        self.assertEqual(
+            mutation.document,
+            "mutation Mutation($input: AddReactionInput!) { addReaction(input: $input) { reaction { id } } }",
+        )
+        self.assertEqual(len(queries), 3)
+
+    def testMaxSize(self):
+        queries = GraphQlQueryRegistry(maxsize=1)
+        first = queries.query("query A { viewer { login } }")
+        second = queries.query("query B { viewer { login } }")
+        # the least recently used query is discarded
+        self.assertEqual(queries.queries(), [second])
+        self.assertIs(queries.query(second.document), second)
+        self.assertIsNot(queries.query(first.document), first)
+        self.assertIsNone(queries.get(second.sha256))
+
+        queries = GraphQlQueryRegistry(maxsize=2)
+        node = queries.node("User", "login")
+        queries.query("query A { viewer { login } }")
+        # using a template keeps its document registered
+        self.assertIs(queries.node("User", "login"), node)
+        queries.query("query B { viewer { login } }")
+        self.assertEqual([query.name for query in queries.queries()], ["node:User", None])
+
+        self.assertEqual(len(GraphQlQueryRegistry(maxsize=0).query(VIEWER).sha256), 64)
@@ -0,0 +1,133 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import copy
+import gc
+import json
+import os
+import pickle
+import unittest
+
+import github
+from github.GithubObject import GithubObject
+from github.IdentityMap import IdentityMap
+from github.Issue import Issue
+from github.PaginatedList import PaginatedList
+
+from . import Framework
+
+
+class IdentityMapRequests(Framework.TestCase):
+    def testNestedObjectsSharedAcrossList(self):
+        identity_map = IdentityMap()
+        g = github.Github(
+            auth=self.oauth_token,
+            per_page=self.per_page,
+            seconds_between_requests=self.seconds_between_requests,
+            seconds_between_writes=self.seconds_between_writes,
+            lazy=True,
+            identity_map=identity_map,
+        )
+        with self.replayData("Repository.testGetIssues.txt"):
+            issues = list(g.get_repo("PyGithub/PyGithub").get_issues())
+        self.assertEqual(len(issues), 16)
+        users = [issue.user for issue in issues if issue.user.login == "jacquev6"]
+        self.assertEqual(len(users), 14)
+        for user in users:
+            self.assertIs(user, users[0])
+        # users, assignees, milestones and labels of all issues are 9 distinct resources
+        self.assertEqual(identity_map.misses, 9)
+        self.assertEqual(identity_map.hits, 66)
+
+
+class IdentityMapTests(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        flag = GithubObject.CHECK_AFTER_INIT_FLAG
+        GithubObject.setCheckAfterInitFlag(False)
+        self.addCleanup(GithubObject.setCheckAfterInitFlag, flag)
+        # the response body of the only request is a list of issues
+        with open(os.path.join(Framework.BasicTestCase.replayDataFolder, "Repository.testGetIssues.txt")) as f:
+            self.issues = json.loads(f.readlines()[9])
+
+    def list(self, g: github.Github) -> list[Issue]:
+        return list(PaginatedList(Issue, g.requester, firstData=copy.deepcopy(self.issues), firstHeaders={}))
+
+    def testShared(self):
+        identity_map = IdentityMap()
+        g = github.Github(identity_map=identity_map)
+        issues = self.list(g)
+        self.assertIs(issues[0].user, issues[2].user)
+        self.assertIsNot(issues[0].user, issues[1].user)
+        self.assertEqual(identity_map.misses, 9)
+        self.assertEqual(identity_map.hits, 66)
+        self.assertEqual(len(identity_map), 9)
+
+        # the same resources of other lists are shared while alive
+        self.assertIs(self.list(g)[0].user, issues[0].user)
+
+    def testNotSharedWithoutIdentityMap(self):
+        issues = self.list(github.Github())
+        self.assertEqual(issues[0].user.login, issues[2].user.login)
+        self.assertIsNot(issues[0].user, issues[2].user)
+
+    def testNotSharedAcrossRequesters(self):
+        identity_map = IdentityMap()
+        issues = self.list(github.Github(identity_map=identity_map))
+        others = self.list(github.Github(identity_map=identity_map))
+        self.assertIsNot(issues[0].user, others[0].user)
+        self.assertEqual(len(identity_map), 18)
+
+    def testWeakReferences(self):
+        identity_map = IdentityMap()
+        issues = self.list(github.Github(identity_map=identity_map))
+        self.assertEqual(len(identity_map), 9)
+        del issues
+        gc.collect()
+        self.assertEqual(len(identity_map), 0)
+
+    def testClear(self):
+        identity_map = IdentityMap()
+        g = github.Github(identity_map=identity_map)
+        issues = self.list(g)
+        identity_map.clear()
+        self.assertEqual(len(identity_map), 0)
+        self.assertIsNot(self.list(g)[0].user, issues[0].user)
+
+    def testKey(self):
+        requester = github.Github().requester
+        self.assertEqual(
+            IdentityMap.key(Issue, requester, {"url": "https://api.github.com/repos/o/r/issues/1", "node_id": "I_1"}),
+            (Issue, id(requester), "https://api.github.com/repos/o/r/issues/1"),
+        )
+        self.assertEqual(IdentityMap.key(Issue, requester, {"node_id": "I_1"}), (Issue, id(requester), "I_1"))
+        self.assertIsNone(IdentityMap.key(Issue, requester, {"number": 1}))
+        self.assertIsNone(IdentityMap.key(Issue, requester, None))
+
+    def testPickle(self):
+        identity_map = IdentityMap()
+        issues = self.list(github.Github(identity_map=identity_map))
+        unpickled = pickle.loads(pickle.dumps(identity_map))
+        self.assertEqual(len(unpickled), 0)
+        self.assertEqual(unpickled.hits, identity_map.hits)
+        self.assertEqual(len(issues), 16)
@@ -112,6 +112,14 @@ class Installation(Framework.BasicTestCase):
                 # change it here is well
                 lazy=True,
                 api_version="version",
+                response_cache=github.ResponseCache.MemoryResponseCache(),
+                rate_limit_scheduler=github.RateLimitScheduler.RateLimitScheduler(),
+                json_backend=github.JsonBackend.StdlibJsonBackend(),
+                lazy_attributes=True,
+                retain_raw_data=False,
+                identity_map=github.IdentityMap.IdentityMap(),
+                persisted_graphql_queries=True,
+                processing_202_retries=3,
             )
 
             # assert kwargs consists of ALL requester constructor arguments
@@ -0,0 +1,202 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import github
+from github.Auth import AppAuth, AppInstallationAuth
+from github.InstallationAuthorization import InstallationAuthorization
+from github.InstallationTokenCache import (
+    FileInstallationTokenCache,
+    InstallationTokenCache,
+    MemoryInstallationTokenCache,
+)
+
+from .GithubIntegration import APP_ID, PRIVATE_KEY
+
+
+class InstallationTokenCacheTests(abc.ABC):
+    @abc.abstractmethod
+    def create_cache(self) -> InstallationTokenCache:
+        """
+        Returns a new, empty cache of the tested implementation.
+        """
+
+    def testGetSetDelete(self):
+        cache = self.create_cache()
+        key = cache.key(APP_ID, "https://api.github.com", 123, None)
+        self.assertIsNone(cache.get(key))
+
+        cache.set(key, {"token": "token", "expires_at": "2024-11-25T01:00:02Z"})
+        self.assertEqual(cache.get(key), {"token": "token", "expires_at": "2024-11-25T01:00:02Z"})
+
+        cache.delete(key)
+        self.assertIsNone(cache.get(key))
+        cache.delete(key)
+
+        cache.set(key, {"token": "token"})
+        cache.clear()
+        self.assertIsNone(cache.get(key))
+
+    def testPickle(self):
+        cache = self.create_cache()
+        key = cache.key(APP_ID, "https://api.github.com", 123, None)
+        cache.set(key, {"token": "token"})
+        cache2 = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(cache2.get(key), {"token": "token"})
+        with cache2.lock(key):
+            pass
+
+    def testLocksDoNotGrow(self):
+        cache = self.create_cache()
+        locks = set(vars(cache)["_InstallationTokenCache__locks"])
+        for installation_id in range(1000):
+            with cache.lock(cache.key(APP_ID, "https://api.github.com", installation_id, None)):
+                pass
+        self.assertEqual(set(vars(cache)["_InstallationTokenCache__locks"]), locks)
+
+
+class MemoryTokenCache(InstallationTokenCacheTests, unittest.TestCase):
+    def create_cache(self) -> InstallationTokenCache:
+        return MemoryInstallationTokenCache()
+
+    def testLeastRecentlyUsedEviction(self):
+        cache = MemoryInstallationTokenCache(max_size=2)
+        cache.set("a", {"token": "a"})
+        cache.set("b", {"token": "b"})
+        cache.get("a")
+        cache.set("c", {"token": "c"})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), {"token": "a"})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), {"token": "c"})
+
+
+class FileTokenCache(InstallationTokenCacheTests, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def create_cache(self) -> InstallationTokenCache:
+        return FileInstallationTokenCache(os.path.join(self.directory.name, "tokens"))
+
+    def testSharedDirectory(self):
+        cache = self.create_cache()
+        cache2 = self.create_cache()
+        key = cache.key(APP_ID, "https://api.github.com", 123, {"contents": "read"})
+        cache.set(key, {"token": "token"})
+        self.assertEqual(cache2.get(key), {"token": "token"})
+        self.assertIsNone(cache2.get(cache.key(APP_ID, "https://api.github.com", 123, None)))
+
+    def testCorruptFile(self):
+        cache = self.create_cache()
+        key = cache.key(APP_ID, "https://api.github.com", 123, None)
+        cache.set(key, {"token": "token"})
+        for name in os.listdir(cache.directory):
+            with open(os.path.join(cache.directory, name), "w") as f:
+                f.write("{")
+        self.assertIsNone(cache.get(key))
+
+
+class AppInstallationAuthTokenCache(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.check_after_init = github.GithubObject.GithubObject.CHECK_AFTER_INIT_FLAG
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(False)
+        self.app_auth = AppAuth(APP_ID, PRIVATE_KEY)
+        self.tokens = 0
+        self.tokens_lock = threading.Lock()
+
+    def tearDown(self):
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(self.check_after_init)
+        super().tearDown()
+
+    def get_access_token(self, installation_id, permissions=None):
+        # simulate some latency so that concurrent callers overlap
+        time.sleep(0.01)
+        with self.tokens_lock:
+            self.tokens += 1
+            token = f"token {self.tokens}"
+        return InstallationAuthorization(
+            requester=None, headers={}, attributes={"token": token, "expires_at": "2099-01-01T00:00:00Z"}
+        )
+
+    def auth(self, cache, permissions=None, base_url="https://api.github.com"):
+        auth = AppInstallationAuth(self.app_auth, 29782936, permissions, token_cache=cache)
+        github.Github(auth=auth, base_url=base_url)
+        return auth
+
+    def testSharedToken(self):
+        cache = MemoryInstallationTokenCache()
+        with mock.patch("github.GithubIntegration.GithubIntegration.get_access_token", self.get_access_token):
+            self.assertEqual(self.auth(cache).token, "token 1")
+            self.assertEqual(self.auth(cache).token, "token 1")
+            # different permissions and base urls use different tokens
+            self.assertEqual(self.auth(cache, {"contents": "read"}).token, "token 2")
+            self.assertEqual(self.auth(cache, base_url="https://github.enterprise.com/api/v3").token, "token 3")
+            # not sharing tokens
+            self.assertEqual(self.auth(None).token, "token 4")
+            self.assertEqual(self.auth(None).token, "token 5")
+        self.assertEqual(self.tokens, 5)
+
+    def testNoTokenCacheByDefault(self):
+        with mock.patch("github.GithubIntegration.GithubIntegration.get_access_token", self.get_access_token):
+            auths = [self.app_auth.get_installation_auth(29782936) for _ in range(2)]
+            for auth in auths:
+                github.Github(auth=auth)
+            self.assertEqual([auth.token_cache for auth in auths], [None, None])
+            # instances do not share access tokens unless given a cache
+            self.assertEqual([auth.token for auth in auths], ["token 1", "token 2"])
+
+    def testExpiredToken(self):
+        cache = MemoryInstallationTokenCache()
+        key = cache.key(APP_ID, "https://api.github.com", 29782936, None)
+        cache.set(key, {"token": "expired token", "expires_at": "2024-01-01T00:00:00Z"})
+        with mock.patch("github.GithubIntegration.GithubIntegration.get_access_token", self.get_access_token):
+            self.assertEqual(self.auth(cache).token, "token 1")
+        self.assertEqual(cache.get(key)["token"], "token 1")
+
+    def testSingleFlight(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for cache in [MemoryInstallationTokenCache(), FileInstallationTokenCache(directory.name)]:
+            with self.subTest(cache=type(cache).__name__):
+                self.tokens = 0
+                auths = [self.auth(cache) for _ in range(16)]
+                with mock.patch("github.GithubIntegration.GithubIntegration.get_access_token", self.get_access_token):
+                    with ThreadPoolExecutor(max_workers=16) as executor:
+                        tokens = set(executor.map(lambda auth: auth.token, auths))
+                self.assertEqual(tokens, {"token 1"})
+                self.assertEqual(self.tokens, 1)
@@ -0,0 +1,126 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import json
+import pickle
+import unittest
+from typing import Any
+from unittest import mock
+
+import requests
+
+import github
+from github.JsonBackend import JsonBackend, OrjsonJsonBackend, StdlibJsonBackend
+
+from . import Framework
+
+
+class JsonBackendRequests(Framework.TestCase):
+    def testRequestsWithOrjsonBackend(self):
+        g = github.Github(
+            auth=self.oauth_token,
+            per_page=self.per_page,
+            seconds_between_requests=self.seconds_between_requests,
+            seconds_between_writes=self.seconds_between_writes,
+            json_backend=OrjsonJsonBackend(),
+        )
+        self.assertIsInstance(g.requester.json_backend, OrjsonJsonBackend)
+        with self.replayData("AuthenticatedUser.testCreateGist.txt"):
+            gist = g.get_user().create_gist(
+                True,
+                {"foobar.txt": github.InputFileContent("File created by PyGithub")},
+                "Gist created by PyGithub",
+            )
+        self.assertEqual(gist.description, "Gist created by PyGithub")
+        self.assertEqual(gist.files["foobar.txt"].content, "File created by PyGithub")
+
+    def testDefaultBackend(self):
+        self.assertIsInstance(self.g.requester.json_backend, StdlibJsonBackend)
+
+
+class RecordingJsonBackend(StdlibJsonBackend):
+    def __init__(self) -> None:
+        self.documents: list[str | bytes] = []
+
+    def loads(self, data: str | bytes) -> Any:
+        self.documents.append(data)
+        return super().loads(data)
+
+
+class JsonBackendResponseBytes(unittest.TestCase):
+    def testLoadsResponseBytes(self):
+        content = json.dumps({"login": "jacquev6", "id": 327146, "name": "Vincent Jacques ✓"}).encode("utf-8")
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json; charset=utf-8"
+        response._content = content
+
+        backend = RecordingJsonBackend()
+        g = github.Github(json_backend=backend)
+        with mock.patch.object(requests.Session, "get", return_value=response):
+            user = g.get_user("jacquev6")
+        self.assertEqual(user.name, "Vincent Jacques ✓")
+        # the body is handed to the backend as read from the connection, without decoding it to str first
+        self.assertEqual(backend.documents, [content])
+
+        with mock.patch.object(requests.Session, "get", return_value=response):
+            status, _, output = g.requester.requestJson("GET", "/users/jacquev6")
+        self.assertEqual(status, 200)
+        self.assertEqual(output, content.decode("utf-8"))
+
+
+class JsonBackendTests:
+    backend: JsonBackend
+
+    def testLoads(self):
+        document = {"id": 1, "name": "PyGithub ✓", "topics": ["github", "api"], "fork": False, "parent": None}
+        text = json.dumps(document)
+        self.assertEqual(self.backend.loads(text), document)
+        self.assertEqual(self.backend.loads(text.encode("utf-8")), document)
+
+    def testLoadsInvalid(self):
+        with self.assertRaises(ValueError):
+            self.backend.loads("not json")
+        with self.assertRaises(ValueError):
+            self.backend.loads(b'{"id": ')
+
+    def testDumps(self):
+        document = {"title": "Issue ✓", "labels": ["bug"], "milestone": None, "draft": True, "number": 12}
+        text = self.backend.dumps(document)
+        self.assertIsInstance(text, str)
+        self.assertEqual(json.loads(text), document)
+        self.assertEqual(json.loads(self.backend.dumps({1: "one"})), {"1": "one"})
+
+    def testPickle(self):
+        self.assertIsInstance(pickle.loads(pickle.dumps(self.backend)), type(self.backend))
+
+
+class StdlibJsonBackendTest(JsonBackendTests, unittest.TestCase):
+    backend = StdlibJsonBackend()
+
+
+class OrjsonJsonBackendTest(JsonBackendTests, unittest.TestCase):
+    backend = OrjsonJsonBackend()
+
+    def testFastest(self):
+        self.assertIsInstance(JsonBackend.fastest(), OrjsonJsonBackend)
@@ -43,9 +43,18 @@
 #                                                                              #
 ################################################################################
 
+import threading
+import time
+import unittest
 from datetime import datetime, timezone
+from itertools import islice
+from unittest import mock
 
+from github.GithubException import GithubException, RateLimitExceededException
+from github.NamedUser import NamedUser
+from github.PaginatedList import GraphQlPageCost
 from github.PaginatedList import PaginatedList as PaginatedListImpl
+from github.Requester import Requester
 
 from . import Framework
 
@@ -70,6 +79,13 @@ class PaginatedList(Framework.TestCase):
         self.assertEqual(len(list(users)), 102)
         self.assertEqual(len({user.github_com_login for user in users}), 102)
 
+    def testPrefetch(self):
+        with self.replayData("PaginatedList.testIteration.txt"):
+            # a single worker fetches pages in the order of the replay data
+            self.assertEqual(len(list(self.list.prefetch(workers=1))), 333)
+            # all pages are fetched, iterating again does not send requests
+            self.assertEqual(len(list(self.list)), 333)
+
     def testSeveralIterations(self):
         with self.replayData("PaginatedList.testIteration.txt"):
             self.assertEqual(len(list(self.list)), 333)
@@ -670,6 +686,16 @@ class PaginatedList(Framework.TestCase):
         transformer = PaginatedListImpl.override_attributes(overrides_dict)
         self.assertDictEqual(transformer(input_dict), {"a": 1, "b": 2, "c": 4, "d": 5, "e": 6})
 
+    def testParseLinkHeader(self):
+        headers = {
+            "link": '<https://api.github.com/users?page=2>; rel="next", <https://api.github.com/users?page=5>; rel="last"'
+        }
+        self.assertDictEqual(
+            PaginatedListImpl.parse_link_header(headers),
+            {"next": "https://api.github.com/users?page=2", "last": "https://api.github.com/users?page=5"},
+        )
+        self.assertDictEqual(PaginatedListImpl.parse_link_header({}), {})
+
     def testGraphQlPagination(self):
         repo = self.g.get_repo("PyGithub/PyGithub")
         discussions = repo.get_discussions("id number")
@@ -682,6 +708,7 @@ class PaginatedList(Framework.TestCase):
         self.assertEqual(len(discussions_list), 65)
         self.assertEqual(discussions_list[0].number, 3044)
         self.assertEqual(discussions_list[-1].number, 1780)
+        self.assertEqual([page.page_size for page in discussions.graphql_page_costs], [30, 30, 30])
 
         reversed_list = list(rev)
         self.assertEqual(rev.totalCount, 65)
@@ -690,3 +717,218 @@ class PaginatedList(Framework.TestCase):
 
         # accessing totalCount before iterating the PaginatedList triggers another request
         self.assertEqual(repo.get_discussions("id number").totalCount, 65)
+
+
+class PaginatedListPrefetch(unittest.TestCase):
+    pages = 20
+
+    def request(self, verb, url, parameters=None, headers=None):
+        page = int(Requester.get_parameters_of_url(url).get("page", ["1"])[0])
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # later pages respond faster, so responses complete out of order
+        time.sleep((self.pages - page) / 1000)
+        with self.lock:
+            self.in_flight -= 1
+        links = [f'<https://api.github.com/users?page={self.pages}>; rel="last"']
+        if page < self.pages:
+            links.insert(0, f'<https://api.github.com/users?page={page + 1}>; rel="next"')
+        return {"link": ", ".join(links)}, [{"id": page * 10 + i} for i in range(3)]
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requester = mock.Mock(per_page=30, pool_size=10)
+        self.requester.requestJsonAndCheck.side_effect = self.request
+
+    def testPrefetchYieldsInOrder(self):
+        users = PaginatedListImpl(NamedUser, self.requester, "https://api.github.com/users")
+        ids = [user.id for user in users.prefetch(workers=4, max_pages_in_flight=4)]
+        self.assertEqual(ids, [page * 10 + i for page in range(1, self.pages + 1) for i in range(3)])
+        self.assertEqual(self.requester.requestJsonAndCheck.call_count, self.pages)
+        self.assertLessEqual(self.max_in_flight, 4)
+        self.assertEqual([user.id for user in users], ids)
+
+    def testPrefetchInterrupted(self):
+        users = PaginatedListImpl(NamedUser, self.requester, "https://api.github.com/users")
+        for index, user in enumerate(users.prefetch(workers=2)):
+            if index == 4:
+                break
+        # the first two pages are fetched, iteration continues with the third page
+        self.assertEqual([user.id for user in users][:7], [10, 11, 12, 20, 21, 22, 30])
+        self.assertEqual(len(list(users)), 3 * self.pages)
+
+    def testPrefetchWorkersBoundedByPoolSize(self):
+        self.requester.pool_size = 2
+        users = PaginatedListImpl(NamedUser, self.requester, "https://api.github.com/users")
+        self.assertEqual(len(list(users.prefetch(workers=8))), 3 * self.pages)
+        self.assertLessEqual(self.max_in_flight, 2)
+
+    def testPrefetchValidatesArguments(self):
+        users = PaginatedListImpl(NamedUser, self.requester, "https://api.github.com/users")
+        # arguments are validated when calling prefetch, not when iterating
+        with self.assertRaises(AssertionError):
+            users.prefetch(workers=0)
+        with self.assertRaises(AssertionError):
+            users.prefetch(max_pages_in_flight=0)
+        self.requester.requestJsonAndCheck.assert_not_called()
+
+
+class PaginatedListMapConcurrent(unittest.TestCase):
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+        self.requester = mock.Mock(per_page=30, pool_size=10)
+        self.requester.requestJsonAndCheck.side_effect = lambda verb, url, parameters=None, headers=None: (
+            {},
+            [{"id": id} for id in range(20)],
+        )
+        self.users = PaginatedListImpl(NamedUser, self.requester, "https://api.github.com/users")
+
+    def fn(self, user):
+        with self.lock:
+            self.calls.append(user.id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # later elements complete faster, so calls complete out of order
+        time.sleep((20 - user.id) / 2000)
+        with self.lock:
+            self.in_flight -= 1
+        if user.id % 7 == 3:
+            raise GithubException(404, {"message": "Not Found"}, {})
+        return user.id * 2
+
+    def testOrdered(self):
+        results = list(self.users.map_concurrent(self.fn, workers=4))
+        self.assertEqual([user.id for user, _ in results], list(range(20)))
+        self.assertEqual([result for _, result in results if not isinstance(result, GithubException)][:4], [0, 2, 4, 8])
+        self.assertEqual([user.id for user, result in results if isinstance(result, GithubException)], [3, 10, 17])
+        self.assertLessEqual(self.max_in_flight, 4)
+        self.assertGreater(self.max_in_flight, 1)
+
+    def testValidatesArguments(self):
+        # arguments are validated when calling map_concurrent, not when iterating
+        with self.assertRaises(AssertionError):
+            self.users.map_concurrent(self.fn, workers=0)
+        with self.assertRaises(AssertionError):
+            self.users.map_concurrent(self.fn, max_in_flight=0)
+        self.requester.requestJsonAndCheck.assert_not_called()
+
+    def testUnordered(self):
+        results = list(self.users.map_concurrent(self.fn, workers=4, ordered=False))
+        self.assertEqual(sorted(user.id for user, _ in results), list(range(20)))
+        for user, result in results:
+            if not isinstance(result, GithubException):
+                self.assertEqual(result, user.id * 2)
+
+    def testWorkersBoundedByPoolSize(self):
+        self.requester.pool_size = 2
+        self.assertEqual(len(list(self.users.map_concurrent(self.fn, workers=8))), 20)
+        self.assertLessEqual(self.max_in_flight, 2)
+
+    def testMaxInFlight(self):
+        results = self.users.map_concurrent(self.fn, workers=4, max_in_flight=2)
+        next(results)
+        self.assertLessEqual(len(self.calls), 3)
+        results.close()
+
+    def testRateLimitExceeded(self):
+        def fn(user):
+            if user.id == 5:
+                raise RateLimitExceededException(403, {"message": "API rate limit exceeded"}, {})
+            return user.id
+
+        results = self.users.map_concurrent(fn, workers=1, max_in_flight=1)
+        self.assertEqual([result for _, result in islice(results, 5)], [0, 1, 2, 3, 4])
+        with self.assertRaises(RateLimitExceededException):
+            next(results)
+
+
+class PaginatedListGraphQlCost(unittest.TestCase):
+    query = """
+        query Q($first: Int, $last: Int, $before: String, $after: String) {
+          repository(owner: "PyGithub", name: "PyGithub") {
+            discussions(first: $first, last: $last, before: $before, after: $after) {
+              totalCount
+              pageInfo { startCursor endCursor hasNextPage hasPreviousPage }
+              nodes { id comments(first: 100) { nodes { id replies(first: 100) { nodes { id } } } } }
+            }
+          }
+        }
+        """
+    total = 200
+
+    def graphql_query(self, query, variables):
+        self.assertEqual(query.count("rateLimit { cost remaining }"), 1)
+        start = int(variables.get("after") or 0)
+        end = min(start + variables["first"], self.total)
+        page = {
+            "totalCount": self.total,
+            "pageInfo": {
+                "startCursor": str(start),
+                "endCursor": str(end),
+                "hasNextPage": end < self.total,
+                "hasPreviousPage": start > 0,
+            },
+            "nodes": [{"id": str(index)} for index in range(start, end)],
+        }
+        # pages cost a rate limit point per 10 discussions
+        cost = variables["first"] // 10 + 1
+        return {}, {"data": {"repository": {"discussions": page}, "rateLimit": {"cost": cost, "remaining": 4000}}}
+
+    def setUp(self):
+        self.requester = mock.Mock(per_page=100)
+        self.requester.graphql_query.side_effect = self.graphql_query
+
+    def discussions(self):
+        return PaginatedListImpl(
+            NamedUser, self.requester, graphql_query=self.query, list_item=["repository", "discussions"]
+        )
+
+    def testPageSizeWithinNodeLimit(self):
+        discussions = self.discussions()
+        self.assertEqual(len(list(discussions)), self.total)
+        # each discussion requests 10,101 nodes, so a page holds at most 49 discussions
+        self.assertEqual(discussions.graphql_page_costs, [GraphQlPageCost(49, 494949, 5, 4000)] * 5)
+
+    def testPageSizeWithinMaxCost(self):
+        discussions = self.discussions().with_graphql_max_cost(3)
+        self.assertEqual(len(list(discussions)), self.total)
+        self.assertEqual(
+            [(page.page_size, page.cost) for page in discussions.graphql_page_costs],
+            [(49, 5), (29, 3), (29, 3), (29, 3), (29, 3), (29, 3), (29, 3)],
+        )
+        # the max cost is retained by copies
+        copy = discussions.with_retain_raw_data(False)
+        self.assertEqual(len(list(copy)), self.total)
+        self.assertEqual(copy.graphql_page_costs[1].page_size, 29)
+
+    def testRateLimitWithFragment(self):
+        query = """
+        query Q($first: Int, $last: Int, $before: String, $after: String) {
+          repository(owner: "PyGithub", name: "PyGithub") {
+            discussions(first: $first, last: $last, before: $before, after: $after) {
+              totalCount
+              pageInfo { startCursor endCursor hasNextPage hasPreviousPage }
+              nodes { ...D }
+            }
+          }
+        }
+        fragment D on Discussion { id }
+        """
+        discussions = PaginatedListImpl(
+            NamedUser, self.requester, graphql_query=query, list_item=["repository", "discussions"]
+        )
+        self.assertEqual(len(list(discussions)), self.total)
+        # the rate limit is selected by the operation, not by the fragment at the end of the query
+        operation, fragment = self.requester.graphql_query.call_args.args[0].split("fragment D on Discussion")
+        self.assertIn("rateLimit { cost remaining }", operation)
+        self.assertNotIn("rateLimit", fragment)
+
+    def testMaxCostOfRestList(self):
+        with self.assertRaises(RuntimeError):
+            PaginatedListImpl(NamedUser, self.requester, "/users").with_graphql_max_cost(1)
@@ -0,0 +1,188 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import github
+from github.RateLimitScheduler import FileRateLimitState, MemoryRateLimitState
+
+from . import Framework
+
+
+def headers(remaining: int, reset: int, resource: str | None = None) -> dict[str, str]:
+    headers = {"x-ratelimit-remaining": str(remaining), "x-ratelimit-reset": str(reset), "x-ratelimit-limit": "5000"}
+    if resource is not None:
+        headers["x-ratelimit-resource"] = resource
+    return headers
+
+
+class RateLimitScheduler(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch("github.RateLimitScheduler.time")
+        self.time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.time.time.return_value = 1000.0
+
+    def testResource(self):
+        resource = github.RateLimitScheduler.RateLimitScheduler.resource
+        self.assertEqual(resource("/repos/PyGithub/PyGithub", "/graphql"), "core")
+        self.assertEqual(resource("/search/issues?q=bug", "/graphql"), "search")
+        self.assertEqual(resource("/search/code?q=bug", "/graphql"), "code_search")
+        self.assertEqual(resource("/graphql", "/graphql"), "graphql")
+        self.assertEqual(resource("/api/v3/search/code?q=bug", "/api/graphql"), "code_search")
+        self.assertEqual(resource("/api/graphql", "/api/graphql"), "graphql")
+        self.assertEqual(resource("https://api.github.com/graphql", "/graphql"), "graphql")
+        self.assertEqual(resource("https://api.github.com/repos/PyGithub/PyGithub", "/graphql"), "core")
+        self.assertEqual(resource("https://my.enterprise.com/api/graphql", "/api/graphql"), "graphql")
+        self.assertEqual(resource("https://my.enterprise.com/api/v3/search/code?q=bug", "/api/graphql"), "code_search")
+
+    def testUnknownBudget(self):
+        scheduler = github.RateLimitScheduler.RateLimitScheduler()
+        self.assertIsNone(scheduler.budget("core"))
+        self.assertEqual(scheduler.acquire("core"), 0)
+        scheduler.update("core", {})
+        self.assertIsNone(scheduler.budget("core"))
+
+    def testBurstThenPace(self):
+        scheduler = github.RateLimitScheduler.RateLimitScheduler(burst=2)
+        # 100 requests within 100 seconds: one request per second
+        scheduler.update("core", headers(100, 1100))
+        self.assertEqual(scheduler.acquire("core"), 0)
+        self.assertEqual(scheduler.acquire("core"), 0)
+        # bucket is empty, requests are reserved ahead of time
+        self.assertAlmostEqual(scheduler.acquire("core"), 1.0, delta=0.05)
+        self.assertAlmostEqual(scheduler.acquire("core"), 2.0, delta=0.05)
+        self.assertEqual(scheduler.budget("core")["remaining"], 96)
+
+        # bucket refills over time
+        self.time.time.return_value = 1010.0
+        self.assertEqual(scheduler.acquire("core"), 0)
+
+    def testExhaustedBudget(self):
+        scheduler = github.RateLimitScheduler.RateLimitScheduler(reserve=10)
+        scheduler.update("core", headers(10, 1100))
+        self.assertEqual(scheduler.acquire("core"), 100)
+        # other resources are not affected
+        self.assertEqual(scheduler.acquire("search"), 0)
+
+        # budget is unknown after reset
+        self.time.time.return_value = 1100.0
+        self.assertEqual(scheduler.acquire("core"), 0)
+        self.assertIsNone(scheduler.budget("core"))
+
+    def testResourceHeader(self):
+        scheduler = github.RateLimitScheduler.RateLimitScheduler()
+        scheduler.update("search", headers(0, 1060, "code_search"))
+        self.assertIsNone(scheduler.budget("search"))
+        self.assertEqual(scheduler.acquire("code_search"), 60)
+
+    def testUpdate(self):
+        scheduler = github.RateLimitScheduler.RateLimitScheduler()
+        scheduler.update("core", headers(100, 1100))
+        scheduler.acquire("core")
+        scheduler.acquire("core")
+        # responses of requests sent before the reservations do not increase the remaining budget
+        scheduler.update("core", headers(100, 1100))
+        self.assertEqual(scheduler.budget("core")["remaining"], 98)
+        scheduler.update("core", headers(90, 1100))
+        self.assertEqual(scheduler.budget("core")["remaining"], 90)
+        # a new window replaces the budget
+        scheduler.update("core", headers(5000, 4600))
+        self.assertEqual(scheduler.budget("core")["remaining"], 5000)
+
+    def testConcurrentReservations(self):
+        scheduler = github.RateLimitScheduler.RateLimitScheduler(burst=1)
+        scheduler.update("core", headers(100, 1100))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            delays = sorted(executor.map(lambda _: scheduler.acquire("core"), range(10)))
+        for i, delay in enumerate(delays):
+            self.assertAlmostEqual(delay, i, delta=0.05)
+
+    def testFileState(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rate-limit.json")
+            scheduler = github.RateLimitScheduler.RateLimitScheduler(burst=1, state=FileRateLimitState(path))
+            scheduler2 = github.RateLimitScheduler.RateLimitScheduler(burst=1, state=FileRateLimitState(path))
+            scheduler.update("core", headers(100, 1100))
+            self.assertEqual(scheduler.acquire("core"), 0)
+            self.assertAlmostEqual(scheduler2.acquire("core"), 1.0, delta=0.05)
+            self.assertEqual(scheduler.budget("core")["remaining"], 98)
+
+            with open(path, "w") as f:
+                f.write("{")
+            self.assertIsNone(scheduler.budget("core"))
+
+    def testPickle(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for state in [MemoryRateLimitState(), FileRateLimitState(os.path.join(directory, "rate-limit.json"))]:
+                with self.subTest(state=type(state).__name__):
+                    scheduler = github.RateLimitScheduler.RateLimitScheduler(state=state)
+                    scheduler.update("core", headers(100, 1100))
+                    scheduler2 = pickle.loads(pickle.dumps(scheduler))
+                    self.assertEqual(scheduler2.budget("core")["remaining"], 100)
+
+
+class RateLimitSchedulerRequester(Framework.BasicTestCase):
+    def testSchedulerIsUsed(self):
+        scheduler = github.RateLimitScheduler.RateLimitScheduler()
+        g = github.Github(
+            auth=self.oauth_token,
+            seconds_between_requests=None,
+            seconds_between_writes=None,
+            rate_limit_scheduler=scheduler,
+        )
+        with self.replayData("ConditionalRequestUpdate.setUp.txt"):
+            with mock.patch.object(scheduler, "acquire", return_value=1.5) as acquire:
+                with mock.patch.object(scheduler, "update") as update:
+                    with mock.patch("github.Requester.time.sleep") as sleep:
+                        g.get_repo("akfish/PyGithub")
+        acquire.assert_called_once_with("core")
+        update.assert_called_once()
+        self.assertEqual(update.call_args.args[0], "core")
+        self.assertEqual(update.call_args.args[1]["x-ratelimit-remaining"], "4988")
+        sleep.assert_called_once_with(1.5)
+
+    def testGraphQlResource(self):
+        with self.replayData("RateLimitSchedulerRequester.testGraphQlResource.txt"):
+            for base_url in ["https://api.github.com", "https://my.enterprise.com/api/v3"]:
+                with self.subTest(base_url=base_url):
+                    scheduler = github.RateLimitScheduler.RateLimitScheduler()
+                    g = github.Github(
+                        auth=self.oauth_token,
+                        base_url=base_url,
+                        seconds_between_requests=None,
+                        seconds_between_writes=None,
+                        rate_limit_scheduler=scheduler,
+                    )
+                    with mock.patch.object(scheduler, "acquire", wraps=scheduler.acquire) as acquire:
+                        _, data = g.requester.graphql_query("query { viewer { login } }", {})
+                    self.assertEqual(data, {"data": {"viewer": {"login": "jacquev6"}}})
+                    acquire.assert_called_once_with("graphql")
+                    self.assertEqual(scheduler.budget("graphql")["remaining"], 4999)
+                    self.assertIsNone(scheduler.budget("core"))
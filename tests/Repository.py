@@ -2260,6 +2260,31 @@ class Repository(Framework.TestCase):
             ],
         )
 
+    def testStatisticsProcessing202Backoff(self):
+        with mock.patch("github.Requester.time.sleep") as sleep:
+            stats = self.repo.get_stats_participation()
+        self.assertEqual(stats.owner[:3], [1, 36, 8])
+        self.assertEqual(sleep.call_args_list, [mock.call(2), mock.call(4), mock.call(8)])
+
+    def testStatisticsProcessing202Retries(self):
+        requester = self.repo.requester.withProcessing202Retries(1)
+        self.assertEqual(requester.processing_202_retries, 1)
+        self.assertIs(requester.withProcessing202Retries(1), requester)
+        repo = github.Repository.Repository(requester, {}, {"url": self.repo.url})
+        with mock.patch("github.Requester.time.sleep") as sleep:
+            with self.assertRaises(github.GithubException) as raisedexp:
+                repo.get_stats_participation()
+        self.assertEqual(raisedexp.exception.status, 202)
+        self.assertEqual(raisedexp.exception.message, "Response is still being computed after 1 retries")
+        self.assertEqual(sleep.call_args_list, [mock.call(2)])
+
+    def testStatisticsWithoutProcessing202Retries(self):
+        # replay data of the first request of testStatisticsProcessing202Retries
+        repo = github.Repository.Repository(self.repo.requester.withProcessing202Retries(0), {}, {"url": self.repo.url})
+        with mock.patch("github.Requester.time.sleep") as sleep:
+            self.assertIsNone(repo.get_stats_participation())
+        sleep.assert_not_called()
+
     def testStatisticsPunchCard(self):
         with mock.patch("github.Requester.Consts.PROCESSING_202_WAIT_TIME", 0):
             stats = self.repo.get_stats_punch_card()
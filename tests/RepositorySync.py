@@ -0,0 +1,197 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+
+from github.GithubException import GithubException, UnknownObjectException
+from github.RepositorySync import FileSyncState, MemorySyncState, SyncEvent
+from github.RepositorySync import RepositorySync as RepositorySyncImpl
+
+from . import Framework
+
+
+class RepositorySync(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.repository = self.g.withLazy(True).get_repo("PyGithub/PyGithub")
+
+    @staticmethod
+    def summary(events):
+        # issues and pull requests by number, comments by id, commits by the first character of their sha
+        return [
+            (
+                event.resource,
+                event.action,
+                event.object.sha[0]
+                if event.resource == "commits"
+                else getattr(event.object, "number", event.object.id),
+            )
+            for event in events
+        ]
+
+    def testFirstSyncReturnsAllResources(self):
+        sync = RepositorySyncImpl(self.repository, check_events=True)
+
+        events = sync.sync()
+
+        self.assertEqual(
+            self.summary(events),
+            [
+                ("issues", "created", 1),
+                ("issues", "created", 2),
+                ("issue_comments", "created", 10),
+                ("pulls", "created", 21),
+                ("pulls", "created", 20),
+                ("commits", "created", "a"),
+                ("commits", "created", "b"),
+            ],
+        )
+        self.assertTrue(all(event.repository == "PyGithub/PyGithub" for event in events))
+        self.assertIsInstance(events[0], SyncEvent)
+        with sync.state.transaction() as state:
+            self.assertEqual(
+                state["3544490"],
+                {
+                    "issues": {"since": "2024-01-01T00:05:00Z", "ids": [2000000002]},
+                    "issue_comments": {"since": "2024-01-01T00:03:00Z", "ids": [10]},
+                    "pulls": {"since": "2024-01-01T00:04:00Z", "ids": [1600000020]},
+                    "commits": {"heads": {"main": "b" * 40}},
+                    "events": {"etag": '"events-1"'},
+                },
+            )
+
+    def testUnchangedEventsSkipListing(self):
+        sync = RepositorySyncImpl(self.repository, resources=["issues"], check_events=True)
+        self.assertEqual(self.summary(sync.sync()), [("issues", "created", 1)])
+
+        # the events are requested with the stored ETag, the 304 response skips listing the resources
+        self.assertEqual(sync.sync(), [])
+
+    def testSyncReturnsDeltas(self):
+        sync = RepositorySyncImpl(self.repository)
+        sync.sync()
+
+        self.assertEqual(
+            self.summary(sync.sync()),
+            [
+                ("issues", "created", 3),
+                ("issues", "updated", 1),
+                ("issues", "created", 4),
+                ("pulls", "created", 22),
+                ("pulls", "updated", 21),
+                # commit c is older than the previous head b, but has been merged since
+                ("commits", "created", "c"),
+                ("commits", "created", "d"),
+            ],
+        )
+        # resources at the mark are known by their ids
+        with sync.state.transaction() as state:
+            self.assertEqual(state["3544490"]["issues"], {"since": "2024-01-01T00:09:00Z", "ids": [2000000004]})
+
+        self.assertEqual(self.summary(sync.sync()), [("issues", "created", 5)])
+        with sync.state.transaction() as state:
+            self.assertEqual(
+                state["3544490"]["issues"],
+                {"since": "2024-01-01T00:09:00Z", "ids": [2000000004, 2000000005]},
+            )
+
+    def testWithoutEventsCheck(self):
+        sync = RepositorySyncImpl(self.repository, resources=["issues"])
+
+        self.assertEqual(self.summary(sync.sync()), [("issues", "created", 1)])
+        self.assertEqual(sync.sync(), [])
+        with sync.state.transaction() as state:
+            self.assertNotIn("events", state["3544490"])
+
+    def testChangeWithoutEvent(self):
+        sync = RepositorySyncImpl(self.repository, resources=["issue_comments"])
+        self.assertEqual(self.summary(sync.sync()), [("issue_comments", "created", 10)])
+
+        # editing a comment emits no repository event, the edited comment is returned nevertheless
+        self.assertEqual(self.summary(sync.sync()), [("issue_comments", "updated", 10)])
+
+    def testFailedSyncKeepsMarks(self):
+        sync = RepositorySyncImpl(self.repository, resources=["issues"], check_events=True)
+
+        with self.assertRaises(UnknownObjectException):
+            sync.sync()
+        with sync.state.transaction() as state:
+            self.assertEqual(state, {})
+
+        with self.assertRaises(GithubException) as raisedexp:
+            sync.sync()
+        self.assertEqual(raisedexp.exception.status, 500)
+        with sync.state.transaction() as state:
+            self.assertEqual(state, {})
+
+    def testSyncAll(self):
+        repositories = [self.g.withLazy(True).get_repo(f"PyGithub/Repo{index}") for index in range(2)]
+        state = MemorySyncState()
+
+        with self.replayData("RepositorySync.testSyncAll.txt"):
+            events = list(RepositorySyncImpl.sync_all(repositories, state, ["issues"], check_events=True, workers=1))
+            self.assertEqual([event.repository for event in events], ["PyGithub/Repo0", "PyGithub/Repo1"])
+            self.assertEqual(list(RepositorySyncImpl.sync_all(repositories, state, ["issues"], check_events=True)), [])
+        with state.transaction() as marks:
+            self.assertEqual(sorted(marks), ["1000", "1001"])
+
+    def testRenamedRepository(self):
+        state = MemorySyncState()
+        with state.transaction() as marks:
+            marks["3544490"] = {"issues": {"since": "2024-01-01T00:00:00Z", "ids": [2000000001]}}
+
+        # the repository has been renamed, its marks are found by its id
+        repository = self.g.withLazy(True).get_repo("PyGithub/Renamed")
+        self.assertEqual(RepositorySyncImpl(repository, state, resources=["issues"]).sync(), [])
+        with state.transaction() as marks:
+            self.assertEqual(list(marks), ["3544490"])
+
+    def testUnknownResource(self):
+        with self.assertRaises(AssertionError):
+            RepositorySyncImpl(self.repository, resources=["releases"])
+
+    def testFileSyncState(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sync.json")
+            RepositorySyncImpl(self.repository, FileSyncState(path), ["issues"], check_events=True).sync()
+
+            state = pickle.loads(pickle.dumps(FileSyncState(path)))
+            self.assertEqual(state.path, path)
+            self.assertEqual(RepositorySyncImpl(self.repository, state, ["issues"], check_events=True).sync(), [])
+            with state.transaction() as marks:
+                self.assertEqual(
+                    marks["3544490"],
+                    {
+                        "issues": {"since": "2024-01-01T00:00:00Z", "ids": [2000000001]},
+                        "events": {"etag": '"events-1"'},
+                    },
+                )
+
+    def testMemorySyncStateIsPicklable(self):
+        state = MemorySyncState()
+        with state.transaction() as marks:
+            marks["3544490"] = {"events": {"etag": '"events-1"'}}
+        with pickle.loads(pickle.dumps(state)).transaction() as marks:
+            self.assertEqual(marks, {"3544490": {"events": {"etag": '"events-1"'}}})
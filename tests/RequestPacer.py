@@ -0,0 +1,69 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from github.RequestPacer import PacingStatistics
+from github.RequestPacer import RequestPacer as Pacer
+
+
+class RequestPacer(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch("github.RequestPacer.monotonic", return_value=1000.0)
+        self.monotonic = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def testUnpaced(self):
+        pacer = Pacer(None, None)
+        self.assertEqual([pacer.reserve("GET") for _ in range(3)], [0, 0, 0])
+        pacer.release("GET")
+        self.assertEqual(pacer.statistics, PacingStatistics(3, 0, 0.0, 0.0))
+
+    def testConcurrentCallersQueue(self):
+        pacer = Pacer(1.0, None)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            delays = sorted(executor.map(lambda _: pacer.reserve("GET"), range(8)))
+        self.assertEqual(delays, [0, 1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(pacer.statistics, PacingStatistics(8, 7, 28.0, 7.0))
+        self.assertEqual(pacer.statistics.mean_delay, 3.5)
+
+    def testPacedFromEndOfRequest(self):
+        pacer = Pacer(1.0, 3.0)
+        self.assertEqual(pacer.reserve("POST"), 0)
+        # request takes 2 seconds
+        self.monotonic.return_value = 1002.0
+        pacer.release("POST")
+        self.assertEqual(pacer.reserve("GET"), 1)
+        self.assertEqual(pacer.reserve("DELETE"), 3)
+        self.assertEqual(pacer.reserve("GET"), 4)
+
+    def testPickle(self):
+        pacer = Pacer(1.0, 3.0)
+        pacer.reserve("GET")
+        pacer2 = pickle.loads(pickle.dumps(pacer))
+        self.assertEqual(pacer2.reserve("GET"), 0)
+        self.assertEqual(pacer2.statistics.requests, 2)
@@ -31,9 +31,14 @@
 from __future__ import annotations
 
 import contextlib
-from datetime import datetime, timedelta, timezone
+import os
+import tempfile
+import threading
+import unittest
 from unittest import mock
 
+import requests
+
 import github
 from github import Consts
 from github import Requester as gr
@@ -62,6 +67,10 @@ class Requester(Framework.TestCase):
 
         # create a Requester with non-default arguments
         auth = TestAuth(123, "key")
+        response_cache = github.ResponseCache.MemoryResponseCache()
+        rate_limit_scheduler = github.RateLimitScheduler.RateLimitScheduler()
+        json_backend = github.JsonBackend.StdlibJsonBackend()
+        identity_map = github.IdentityMap.IdentityMap()
         requester = github.Requester.Requester(
             auth=auth,
             base_url="https://base.url",
@@ -77,6 +86,14 @@ class Requester(Framework.TestCase):
             # change it here is well
             lazy=True,
             api_version="version",
+            response_cache=response_cache,
+            rate_limit_scheduler=rate_limit_scheduler,
+            json_backend=json_backend,
+            lazy_attributes=True,
+            retain_raw_data=False,
+            identity_map=identity_map,
+            persisted_graphql_queries=True,
+            processing_202_retries=3,
         )
         kwargs = requester.kwargs
 
@@ -97,6 +114,14 @@ class Requester(Framework.TestCase):
                 seconds_between_writes=3.4,
                 lazy=True,
                 api_version="version",
+                response_cache=response_cache,
+                rate_limit_scheduler=rate_limit_scheduler,
+                json_backend=json_backend,
+                lazy_attributes=True,
+                retain_raw_data=False,
+                identity_map=identity_map,
+                persisted_graphql_queries=True,
+                processing_202_retries=3,
             ),
         )
 
@@ -118,6 +143,10 @@ class Requester(Framework.TestCase):
 
         # create a Requester with non-default arguments
         auth = TestAuth(123, "key")
+        response_cache = github.ResponseCache.MemoryResponseCache()
+        rate_limit_scheduler = github.RateLimitScheduler.RateLimitScheduler()
+        json_backend = github.JsonBackend.StdlibJsonBackend()
+        identity_map = github.IdentityMap.IdentityMap()
         requester = github.Requester.Requester(
             auth=auth,
             base_url="https://base.url",
@@ -133,6 +162,14 @@ class Requester(Framework.TestCase):
             # change it here is well
             lazy=True,
             api_version="version",
+            response_cache=response_cache,
+            rate_limit_scheduler=rate_limit_scheduler,
+            json_backend=json_backend,
+            lazy_attributes=True,
+            retain_raw_data=False,
+            identity_map=identity_map,
+            persisted_graphql_queries=True,
+            processing_202_retries=3,
         )
 
         # create a copy with different auth
@@ -155,6 +192,14 @@ class Requester(Framework.TestCase):
                 seconds_between_writes=3.4,
                 lazy=True,
                 api_version="version",
+                response_cache=response_cache,
+                rate_limit_scheduler=rate_limit_scheduler,
+                json_backend=json_backend,
+                lazy_attributes=True,
+                retain_raw_data=False,
+                identity_map=identity_map,
+                persisted_graphql_queries=True,
+                processing_202_retries=3,
             ),
         )
 
@@ -297,6 +342,19 @@ class Requester(Framework.TestCase):
         mocked_custom_connection.close.assert_called_once_with()
         self.assertIsNone(requester._Requester__connection)
 
+    def testConnectionPendingRequestIsPerThread(self):
+        for connectionClass in [gr.HTTPRequestsConnectionClass, gr.HTTPSRequestsConnectionClass]:
+            cnx = connectionClass("api.github.com")
+            cnx.request("GET", "/user", None, {"Accept": "json"})
+            thread = threading.Thread(target=lambda: cnx.request("POST", "/repos", "input", {}, stream=True))
+            thread.start()
+            thread.join()
+            self.assertEqual(
+                (cnx.verb, cnx.url, cnx.input, cnx.headers, cnx.stream),
+                ("GET", "/user", None, {"Accept": "json"}, False),
+            )
+            cnx.close()
+
     def testLoggingRedirection(self):
         self.assertEqual(self.g.get_repo("EnricoMi/test").name, "test-renamed")
         self.logger.info.assert_called_once_with(
@@ -663,20 +721,19 @@ class RequesterThrottleTestCase(Framework.TestCase):
         self.setPerPage(10)
         super().setUp()
 
-    mock_time = [datetime.now(timezone.utc)]
+    mock_time = [1000.0]
 
     def sleep(self, seconds):
-        self.mock_time[0] = self.mock_time[0] + timedelta(seconds=seconds)
+        self.mock_time[0] = self.mock_time[0] + seconds
 
-    def now(self, tz=None):
+    def monotonic(self):
         return self.mock_time[0]
 
     @contextlib.contextmanager
     def mock_sleep(self):
         with mock.patch("github.Requester.time.sleep", side_effect=self.sleep) as sleep_mock, mock.patch(
-            "github.Requester.datetime"
-        ) as datetime_mock:
-            datetime_mock.now = self.now
+            "github.RequestPacer.monotonic", side_effect=self.monotonic
+        ):
             yield sleep_mock
 
 
@@ -707,6 +764,7 @@ class RequesterThrottled(RequesterThrottleTestCase):
                 self.assertEqual(len(releases), 30)
 
         self.assertEqual(sleep_mock.call_args_list, [mock.call(1), mock.call(1), mock.call(1)])
+        self.assertEqual(self.g.requester.pacing_statistics, (4, 3, 3.0, 1.0))
 
     def testShouldDeferWrites(self):
         with self.mock_sleep() as sleep_mock:
@@ -751,3 +809,134 @@ class RequesterThrottled(RequesterThrottleTestCase):
                 mock.call(1),
             ],
         )
+
+
+class RequesterDownload(unittest.TestCase):
+    content = bytes(range(256)) * 40
+
+    def setUp(self):
+        super().setUp()
+        self.requester = gr.Requester(
+            auth=None,
+            base_url="https://api.github.com",
+            timeout=15,
+            user_agent="PyGithub/Python",
+            per_page=30,
+            verify=True,
+            retry=None,
+            pool_size=None,
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "file")
+        self.requests = []
+        self.requests_lock = threading.Lock()
+        # number of responses that drop the connection after the first chunk
+        self.drops = 0
+        self.support_ranges = True
+        self.closed = 0
+
+    def getStream(self, url, parameters=None, headers=None, cnx=None, chunk_size=None):
+        with self.requests_lock:
+            self.requests.append(headers.get("Range"))
+            drop = self.drops > 0
+            self.drops -= 1
+        content = self.content
+        status = 200
+        response_headers = {}
+        if "Range" in headers and self.support_ranges:
+            start, end = headers["Range"].removeprefix("bytes=").split("-")
+            content = content[int(start) : int(end) + 1 if end else None]
+            status = 206
+            response_headers["content-range"] = f"bytes {start}-{int(start) + len(content) - 1}/{len(self.content)}"
+        response_headers["content-length"] = str(len(content))
+        chunks = [content[i : i + chunk_size] for i in range(0, len(content), chunk_size)]
+        test = self
+
+        class Chunks:
+            def __init__(self):
+                self.iterator = iter(chunks)
+                self.index = 0
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                if drop and self.index == 1:
+                    raise requests.exceptions.ChunkedEncodingError("connection dropped")
+                self.index += 1
+                return next(self.iterator)
+
+            def close(self):
+                with test.requests_lock:
+                    test.closed += 1
+
+        return status, response_headers, Chunks()
+
+    def getFile(self, **kwargs):
+        with mock.patch.object(self.requester, "getStream", side_effect=self.getStream):
+            self.requester.getFile("/download", self.path, **kwargs)
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def testDownload(self):
+        progress = mock.Mock()
+        self.assertEqual(self.getFile(chunk_size=4096, progress=progress), self.content)
+        self.assertEqual(self.requests, [None])
+        self.assertEqual(
+            progress.call_args_list, [mock.call(4096, 10240), mock.call(8192, 10240), mock.call(10240, 10240)]
+        )
+
+    def testResume(self):
+        self.drops = 2
+        self.assertEqual(self.getFile(chunk_size=1000), self.content)
+        self.assertEqual(self.requests, [None, "bytes=1000-", "bytes=2000-"])
+
+    def testResumeWithoutRangeSupport(self):
+        self.drops = 1
+        self.support_ranges = False
+        progress = mock.Mock()
+        self.assertEqual(self.getFile(chunk_size=1000, progress=progress), self.content)
+        self.assertEqual(self.requests, [None, "bytes=1000-"])
+        self.assertEqual(progress.call_args_list[-1], mock.call(10240, 10240))
+
+    def testResumeExceeded(self):
+        self.drops = 2
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            self.getFile(chunk_size=1000, max_resumes=1)
+        self.assertEqual(self.requests, [None, "bytes=1000-"])
+
+    def testParallelDownload(self):
+        progress = mock.Mock()
+        self.drops = 1
+        content = self.getFile(chunk_size=1000, size=len(self.content), workers=4, progress=progress)
+        self.assertEqual(content, self.content)
+        parts = ["bytes=0-2559", "bytes=2560-5119", "bytes=5120-7679", "bytes=7680-10239"]
+        self.assertTrue(set(parts).issubset(self.requests), self.requests)
+        # one part was resumed
+        self.assertEqual(len(self.requests), 5)
+        self.assertIn(
+            set(self.requests).difference(parts).pop(), [f"bytes={1000 + i * 2560}-{2559 + i * 2560}" for i in range(4)]
+        )
+        self.assertEqual(progress.call_args_list[-1], mock.call(10240, 10240))
+
+    def testParallelDownloadWithoutRangeSupport(self):
+        self.support_ranges = False
+        content = self.getFile(chunk_size=1000, size=len(self.content), workers=4)
+        self.assertEqual(content, self.content)
+        self.assertEqual(self.requests[-1], None)
+        # every response is closed, including those of the parts that were not downloaded
+        self.assertEqual(self.closed, len(self.requests))
+
+    def testParallelDownloadWithWrongSize(self):
+        for size in [len(self.content) - 1000, len(self.content) + 1000]:
+            with self.subTest(size=size):
+                self.requests = []
+                self.closed = 0
+                progress = mock.Mock()
+                content = self.getFile(chunk_size=1000, size=size, workers=4, progress=progress)
+                # the Content-Range of the parts does not match the size, the file is downloaded sequentially
+                self.assertEqual(content, self.content)
+                self.assertEqual(self.requests[-1], None)
+                self.assertEqual(self.closed, len(self.requests))
+                self.assertEqual(progress.call_args_list[-1], mock.call(len(self.content), size))
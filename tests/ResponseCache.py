@@ -0,0 +1,194 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import abc
+import os
+import pickle
+import tempfile
+import unittest
+
+import github
+from github.ResponseCache import CachedResponse, FileResponseCache, MemoryResponseCache
+
+from . import Framework
+
+
+class ResponseCache(Framework.TestCase):
+    def testRevalidate(self):
+        cache = MemoryResponseCache()
+        g = github.Github(
+            auth=self.oauth_token,
+            per_page=self.per_page,
+            seconds_between_requests=self.seconds_between_requests,
+            seconds_between_writes=self.seconds_between_writes,
+            response_cache=cache,
+        )
+
+        repo = g.get_repo("akfish/PyGithub")
+        self.assertEqual(len(cache), 1)
+
+        # second request is sent with If-None-Match, server responds with 304 Not Modified
+        repo2 = g.get_repo("akfish/PyGithub")
+        self.assertEqual(repo2.full_name, "akfish/PyGithub")
+        self.assertEqual(repo2.raw_data, repo.raw_data)
+        self.assertEqual(repo2.etag, repo.etag)
+        self.assertEqual(g.rate_limiting, (4988, 5000))
+
+    def testBaseUrlInKey(self):
+        cache = MemoryResponseCache()
+        g = github.Github(auth=self.oauth_token, base_url="https://my.enterprise.com/api/v3", response_cache=cache)
+        other = github.Github(
+            auth=self.oauth_token, base_url="https://other.enterprise.com/api/v3", response_cache=cache
+        )
+
+        # the same url path of another host is not sent as a conditional request
+        self.assertEqual(g.get_repo("akfish/PyGithub").full_name, "akfish/PyGithub")
+        self.assertEqual(other.get_repo("akfish/PyGithub").full_name, "akfish/PyGithub")
+        self.assertEqual(len(cache), 2)
+
+    def testReuseHeaders(self):
+        cache = MemoryResponseCache()
+        g = github.Github(
+            auth=self.oauth_token,
+            per_page=self.per_page,
+            seconds_between_requests=self.seconds_between_requests,
+            seconds_between_writes=self.seconds_between_writes,
+            response_cache=cache,
+        )
+
+        # the cache must not add conditional headers to the headers given by the caller
+        headers: dict[str, str] = {}
+        for _ in range(3):
+            _, data = g.requester.requestJsonAndCheck("GET", "/repos/akfish/PyGithub", headers=headers)
+            self.assertEqual(data["full_name"], "akfish/PyGithub")
+            self.assertEqual(headers, {})
+
+    def testConditionalRequestsBypassCache(self):
+        cache = MemoryResponseCache()
+        g = github.Github(
+            auth=self.oauth_token,
+            per_page=self.per_page,
+            seconds_between_requests=self.seconds_between_requests,
+            seconds_between_writes=self.seconds_between_writes,
+            response_cache=cache,
+        )
+        with self.replayData("ConditionalRequestUpdate.setUp.txt"):
+            repo = g.get_repo("akfish/PyGithub")
+        with self.replayData("ConditionalRequestUpdate.testDidNotUpdate.txt"):
+            self.assertFalse(repo.update())
+
+
+class ResponseCacheTests(abc.ABC):
+    @abc.abstractmethod
+    def create_cache(self) -> github.ResponseCache.ResponseCache:
+        """
+        Returns a new, empty cache of the tested implementation.
+        """
+
+    def testGetSetDelete(self):
+        cache = self.create_cache()
+        key = cache.key("https://api.github.com/repos/PyGithub/PyGithub", {"Authorization": "token secret"})
+        self.assertNotIn("secret", key)
+        self.assertIsNone(cache.get(key))
+
+        response = CachedResponse(200, {"etag": '"etag"', "link": "<url>"}, '{"id": 1}')
+        cache.set(key, response)
+        self.assertEqual(cache.get(key), response)
+        self.assertEqual(cache.get(key).etag, '"etag"')
+        self.assertIsNone(cache.get(key).last_modified)
+
+        cache.delete(key)
+        self.assertIsNone(cache.get(key))
+        cache.delete(key)
+
+        cache.set(key, response)
+        cache.clear()
+        self.assertIsNone(cache.get(key))
+
+    def testKey(self):
+        cache = self.create_cache()
+        url = "https://api.github.com/repos/PyGithub/PyGithub"
+        keys = {
+            cache.key(url, {}),
+            cache.key(url + "?page=2", {}),
+            cache.key(url, {"Authorization": "token secret"}),
+            cache.key(url, {"Authorization": "token other secret"}),
+            cache.key(url, {"Accept": "application/vnd.github.raw+json"}),
+            cache.key(url, {"X-GitHub-Api-Version": "2022-11-28"}),
+        }
+        self.assertEqual(len(keys), 6)
+        self.assertEqual(cache.key(url, {"User-Agent": "agent"}), cache.key(url, {}))
+
+    def testPickle(self):
+        cache = self.create_cache()
+        response = CachedResponse(200, {"etag": '"etag"'}, "{}")
+        cache.set("key", response)
+        cache2 = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(cache2.get("key"), response)
+
+
+class MemoryCache(ResponseCacheTests, unittest.TestCase):
+    def create_cache(self) -> github.ResponseCache.ResponseCache:
+        return MemoryResponseCache()
+
+    def testLeastRecentlyUsedEviction(self):
+        cache = MemoryResponseCache(max_bytes=10)
+        cache.set("a", CachedResponse(200, {}, "aaaa"))
+        cache.set("b", CachedResponse(200, {}, "bbbb"))
+        cache.get("a")
+        cache.set("c", CachedResponse(200, {}, "cccc"))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.bytes, 8)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+        # replacing an entry accounts for the replaced body
+        cache.set("a", CachedResponse(200, {}, "aa"))
+        self.assertEqual(cache.bytes, 6)
+
+        # responses larger than max_bytes are not stored
+        cache.set("d", CachedResponse(200, {}, "d" * 11))
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(cache.bytes, 6)
+
+
+class FileCache(ResponseCacheTests, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def create_cache(self) -> github.ResponseCache.ResponseCache:
+        return FileResponseCache(os.path.join(self.directory.name, "responses"))
+
+    def testSharedDirectory(self):
+        cache = self.create_cache()
+        cache2 = self.create_cache()
+        response = CachedResponse(200, {"etag": '"etag"'}, "{}")
+        cache.set("key", response)
+        self.assertEqual(cache2.get("key"), response)
+        self.assertIsNone(cache2.get("other key"))
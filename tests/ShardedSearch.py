@@ -0,0 +1,100 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from unittest import mock
+
+import github.Consts as Consts
+from github.Issue import IssueSearchResult
+from github.PaginatedList import PaginatedList
+from github.ShardedSearch import ShardedSearch as ShardedSearchImpl
+
+from . import Framework
+
+
+class ShardedSearch(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        # the search API returns at most 2 results per query in the replay data, so that few results are sharded
+        patcher = mock.patch.object(Consts, "MAX_SEARCH_RESULTS", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def issues(self, query="is:issue repo:PyGithub/PyGithub"):
+        return self.g.search_issues(query)
+
+    def testCountAndFetch(self):
+        search = self.issues().sharded("created", start=date(2020, 1, 1), end=date(2020, 1, 2), workers=1)
+        self.assertIsInstance(search, ShardedSearchImpl)
+        with self.replayData("ShardedSearch.testCountAndFetch.txt"):
+            self.assertEqual(search.totalCount, 3)
+            shards = search.shards
+            # issue 1402 is returned by both shards, results are not duplicated
+            self.assertEqual([issue.number for issue in search], [1401, 1402, 1403])
+        self.assertFalse(search.incomplete_results)
+        self.assertEqual(
+            [(shard.query, shard.total_count) for shard in shards],
+            [
+                ("is:issue repo:PyGithub/PyGithub created:2020-01-01T00:00:00Z..2020-01-01T23:59:59Z", 2),
+                ("is:issue repo:PyGithub/PyGithub created:2020-01-02T00:00:00Z..2020-01-02T23:59:59Z", 1),
+            ],
+        )
+        self.assertEqual(shards[0].start, datetime(2020, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(shards[1].end, datetime(2020, 1, 2, 23, 59, 59, tzinfo=timezone.utc))
+
+    def testIncompleteResults(self):
+        search = self.issues().sharded(
+            "created", start=datetime(2020, 1, 1, 0, 0, 0), end=datetime(2020, 1, 1, 0, 0, 1), workers=1
+        )
+        with self.replayData("ShardedSearch.testIncompleteResults.txt"):
+            self.assertTrue(search.incomplete_results)
+            self.assertEqual(search.totalCount, 3)
+            self.assertEqual(len(list(search)), 2)
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.assertEqual([(shard.start, shard.end) for shard in search.shards], [(start, start)])
+
+    def testDateEndIncludesLastDay(self):
+        search = self.issues().sharded("created", start=date(2020, 12, 31), end=date(2020, 12, 31), workers=1)
+        with self.replayData("ShardedSearch.testDateEndIncludesLastDay.txt"):
+            self.assertEqual([issue.number for issue in search], [1420])
+        self.assertEqual(search.shards[0].end, datetime(2020, 12, 31, 23, 59, 59, tzinfo=timezone.utc))
+
+    def testIntegerQualifier(self):
+        search = self.g.search_repositories("language:python org:PyGithub").sharded("stars", start=0, end=3, workers=1)
+        with self.replayData("ShardedSearch.testIntegerQualifier.txt"):
+            self.assertEqual(
+                [repo.full_name for repo in search], ["PyGithub/PyGithub", "PyGithub/Benchmarks", "PyGithub/Website"]
+            )
+        self.assertEqual(search.shards[0].query, "language:python org:PyGithub stars:0..1")
+
+    def testInvalidArguments(self):
+        with self.assertRaises(ValueError):
+            self.issues().sharded("stars")
+        with self.assertRaises(ValueError):
+            self.issues().sharded("created", start=1, end=2)
+        with self.assertRaises(ValueError):
+            self.issues("is:issue created:>2020-01-01").sharded("created")
+        with self.assertRaises(ValueError):
+            self.issues().sharded("created", start=date(2021, 1, 1), end=date(2020, 1, 1))
+        with self.assertRaises(RuntimeError):
+            PaginatedList(IssueSearchResult, self.g.requester, "/repos/PyGithub/PyGithub/issues").sharded("created")
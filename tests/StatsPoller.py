@@ -0,0 +1,100 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import time
+
+from github.GithubException import UnknownObjectException
+from github.StatsParticipation import StatsParticipation
+from github.StatsPoller import StatsPoller as StatsPollerImpl
+
+from . import Framework
+
+
+class StatsPoller(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.repo = self.g.withLazy(True).get_repo("PyGithub/PyGithub")
+
+    def testSubmit(self):
+        # same replay data as Repository.testStatisticsParticipation, computed on the second request
+        with self.replayData("Repository.testStatisticsParticipation.txt"):
+            with StatsPollerImpl(initial_wait=0) as poller:
+                future = poller.submit(self.repo, "participation")
+                stats = future.result(10)
+                self.assertEqual(poller.outstanding, 0)
+        self.assertIsInstance(stats, StatsParticipation)
+        self.assertEqual(stats.owner[:3], [1, 36, 8])
+        # the requests of the poller do not wait for 202 responses
+        self.assertEqual(self.repo.requester.processing_202_retries, 10)
+
+    def testSubmitAll(self):
+        with self.replayData("Repository.testStatisticsPunchCard.txt"):
+            with StatsPollerImpl(initial_wait=0) as poller:
+                (future,) = poller.submit_all([self.repo], "punch_card")
+        self.assertTrue(future.done())
+        self.assertEqual(future.result().get(4, 12), 7)
+
+    def testMaxAttempts(self):
+        with self.replayData("StatsPoller.testMaxAttempts.txt"):
+            with StatsPollerImpl(max_attempts=2, initial_wait=0) as poller:
+                future = poller.submit(self.repo, "participation")
+        self.assertIsNone(future.result())
+
+    def testCancel(self):
+        # replay data of the first request of testMaxAttempts, statistics are being computed
+        with self.replayData("StatsPoller.testCancel.txt"):
+            poller = StatsPollerImpl(initial_wait=60)
+            future = poller.submit(self.repo, "participation")
+            deadline = time.monotonic() + 10
+            while not poller._StatsPoller__scheduled and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # the request waits for its next attempt
+            self.assertTrue(future.cancel())
+            start = time.monotonic()
+            poller.close()
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertTrue(future.cancelled())
+        self.assertEqual(poller.outstanding, 0)
+
+    def testNotFound(self):
+        repo = self.g.withLazy(True).get_repo("PyGithub/Missing")
+        with self.replayData("StatsPoller.testNotFound.txt"):
+            with StatsPollerImpl() as poller:
+                future = poller.submit(repo, "contributors")
+        self.assertIsInstance(future.exception(), UnknownObjectException)
+
+    def testUnknownStats(self):
+        with StatsPollerImpl() as poller:
+            with self.assertRaises(ValueError) as raisedexp:
+                poller.submit(self.repo, "languages")
+        self.assertEqual(
+            raisedexp.exception.args[0],
+            "Unknown statistics languages, expected one of contributors, commit_activity, code_frequency, "
+            "participation, punch_card",
+        )
+
+    def testClosed(self):
+        poller = StatsPollerImpl()
+        poller.close()
+        with self.assertRaises(RuntimeError):
+            poller.submit(self.repo, "contributors")
@@ -0,0 +1,215 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+
+from __future__ import annotations
+
+import os
+import pickle
+import stat
+import tarfile
+import tempfile
+from unittest import mock
+
+from github.Requester import ResponseChunks
+from github.TreeSnapshot import FileBlobCache, MemoryBlobCache, SnapshotFile, blob_sha
+
+from . import Framework
+
+FILES = {
+    "README.md": (b"# readme\n", "100644"),
+    "setup.sh": (b"#!/bin/sh\n", "100755"),
+    "link": (b"README.md", "120000"),
+    "src/a.py": (b"print('a')\n", "100644"),
+    "src/b.py": (b"print('a')\n", "100644"),
+    "src/pkg/c.py": (b"print('c')\n", "100644"),
+}
+
+
+class TreeSnapshot(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.repo = self.g.withLazy(True).get_repo("PyGithub/PyGithub")
+
+    def testFiles(self):
+        snapshot = self.repo.get_tree_snapshot("main")
+
+        self.assertEqual(snapshot.ref, "main")
+        self.assertEqual(snapshot.path, "")
+        self.assertIs(snapshot.cache.__class__, MemoryBlobCache)
+        # the submodule is not a file of the snapshot
+        self.assertEqual([file.path for file in snapshot.files], list(FILES))
+        self.assertEqual(
+            snapshot.files[1], SnapshotFile("setup.sh", "100755", blob_sha(b"#!/bin/sh\n"), len(b"#!/bin/sh\n"))
+        )
+
+    def testPath(self):
+        snapshot = self.repo.get_tree_snapshot("main", path="/src/")
+
+        self.assertEqual(snapshot.path, "src")
+        self.assertEqual([file.path for file in snapshot.files], ["a.py", "b.py", "pkg/c.py"])
+        self.assertEqual(snapshot.read("pkg/c.py"), b"print('c')\n")
+        with self.assertRaises(KeyError):
+            snapshot.read("src/a.py")
+
+    def testTruncatedTree(self):
+        with self.captureRequests() as requests:
+            snapshot = self.repo.get_tree_snapshot("main")
+
+        self.assertEqual(sorted(file.path for file in snapshot.files), sorted(FILES))
+        self.assertEqual(len(requests), 4)
+
+    def testFetchBlobsDeduplicated(self):
+        snapshot = self.repo.get_tree_snapshot("main", workers=1)
+
+        with self.replayData("TreeSnapshot.testFetchBlobsDeduplicated.txt"), self.captureRequests() as requests:
+            # src/a.py and src/b.py have the same content
+            self.assertEqual(snapshot.fetch(), 5)
+            self.assertEqual(snapshot.fetch(), 0)
+            self.assertEqual(
+                {file.path: data for file, data in snapshot.contents()}, {p: d for p, (d, _) in FILES.items()}
+            )
+        self.assertEqual(len(requests), 5)
+
+    def testCacheIsShared(self):
+        cache = MemoryBlobCache()
+        with self.replayData("TreeSnapshot.testCacheIsShared.txt"):
+            self.repo.get_tree_snapshot("main", cache=cache, workers=1).fetch()
+
+            snapshot = self.repo.get_tree_snapshot("main", cache=cache)
+            with self.captureRequests() as requests:
+                self.assertIs(snapshot.cache, cache)
+                self.assertEqual(snapshot.fetch(), 0)
+                self.assertEqual(snapshot.read("README.md"), b"# readme\n")
+        self.assertEqual(requests, [])
+
+    def testFetchArchive(self):
+        snapshot = self.repo.get_tree_snapshot("main", archive_threshold=2)
+
+        with self.replayData("TreeSnapshot.testFetchArchive.txt"), self.captureRequests() as requests:
+            with mock.patch.object(ResponseChunks, "close", autospec=True, side_effect=ResponseChunks.close) as close:
+                self.assertEqual(snapshot.fetch(), 5)
+        close.assert_called_once()
+        # the tarball request is redirected, blobs missing from the archive are fetched individually
+        self.assertEqual(
+            [request.url for request in requests],
+            [
+                "/repos/PyGithub/PyGithub/tarball/main",
+                "/PyGithub/PyGithub/legacy.tar.gz/refs/heads/main",
+                f"/repos/PyGithub/PyGithub/git/blobs/{blob_sha(FILES['src/pkg/c.py'][0])}",
+            ],
+        )
+        self.assertEqual(snapshot.read("link"), b"README.md")
+        self.assertEqual(snapshot.read("setup.sh"), b"#!/bin/sh\n")
+
+    def testFetchArchiveClosesStream(self):
+        cache = MemoryBlobCache()
+        for path, (data, _) in FILES.items():
+            if path != "README.md":
+                cache.set(blob_sha(data), data)
+        snapshot = self.repo.get_tree_snapshot("main", cache=cache, archive_threshold=0)
+
+        with mock.patch.object(ResponseChunks, "close", autospec=True, side_effect=ResponseChunks.close) as close:
+            # reading the archive stops at the only missing blob
+            self.assertEqual(snapshot.fetch(), 1)
+            self.assertEqual(close.call_count, 1)
+            self.assertEqual(cache.get(blob_sha(b"# readme\n")), b"# readme\n")
+
+            snapshot = self.repo.get_tree_snapshot("main", archive_threshold=0)
+            with self.assertRaises(tarfile.ReadError):
+                snapshot.fetch()
+            self.assertEqual(close.call_count, 2)
+
+    def testReadFetchesBlob(self):
+        snapshot = self.repo.get_tree_snapshot("main")
+
+        with self.captureRequests() as requests:
+            self.assertEqual(snapshot.read("src/a.py"), b"print('a')\n")
+            self.assertEqual(snapshot.read("src/b.py"), b"print('a')\n")
+        self.assertEqual(len(requests), 1)
+
+    def testBlobShaMismatch(self):
+        snapshot = self.repo.get_tree_snapshot("main")
+
+        with self.assertRaises(RuntimeError):
+            snapshot.read("README.md")
+
+    def testWrite(self):
+        snapshot = self.repo.get_tree_snapshot("main", workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            with self.replayData("TreeSnapshot.testWrite.txt"):
+                snapshot.write(directory)
+                snapshot.write(directory)
+
+            with open(os.path.join(directory, "src", "pkg", "c.py"), "rb") as f:
+                self.assertEqual(f.read(), b"print('c')\n")
+            self.assertTrue(os.stat(os.path.join(directory, "setup.sh")).st_mode & stat.S_IXUSR)
+            self.assertFalse(os.stat(os.path.join(directory, "README.md")).st_mode & stat.S_IXUSR)
+            self.assertEqual(os.readlink(os.path.join(directory, "link")), "README.md")
+
+    def testFileBlobCache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = FileBlobCache(os.path.join(directory, "blobs"))
+            sha = blob_sha(b"content")
+            self.assertEqual(sha, "6b584e8ece562ebffc15d38808cd6b98fc3d97ea")
+            self.assertIsNone(cache.get(sha))
+
+            self.assertNotIn(sha, cache)
+            cache.set(sha, b"content")
+            self.assertEqual(cache.get(sha), b"content")
+            self.assertTrue(os.path.exists(os.path.join(cache.directory, "6b", sha[2:])))
+            # checking whether a blob is cached does not read the file
+            with mock.patch("builtins.open", side_effect=AssertionError("file read")):
+                self.assertIn(sha, cache)
+
+            # corrupted files are ignored when read
+            with open(os.path.join(cache.directory, "6b", sha[2:]), "wb") as f:
+                f.write(b"corrupted")
+            self.assertIsNone(cache.get(sha))
+
+    def testFileBlobCacheCorrupted(self):
+        sha = blob_sha(b"# readme\n")
+        with tempfile.TemporaryDirectory() as directory, self.replayData("TreeSnapshot.testFileBlobCacheCorrupted.txt"):
+            cache = FileBlobCache(directory)
+            self.repo.get_tree_snapshot("main", cache=cache, workers=1).fetch()
+            with open(os.path.join(directory, sha[:2], sha[2:]), "wb") as f:
+                f.write(b"corrupted")
+
+            snapshot = self.repo.get_tree_snapshot("main", cache=cache)
+            self.assertEqual(snapshot.fetch(), 0)
+            # the corrupted blob is fetched again when read
+            with self.captureRequests() as requests:
+                self.assertEqual(snapshot.read("README.md"), b"# readme\n")
+            self.assertEqual([request.url for request in requests], [f"/repos/PyGithub/PyGithub/git/blobs/{sha}"])
+            self.assertEqual(cache.get(sha), b"# readme\n")
+
+    def testMemoryBlobCache(self):
+        cache = MemoryBlobCache(max_bytes=10)
+        cache.set(blob_sha(b"12345"), b"12345")
+        cache.set(blob_sha(b"abcde"), b"abcde")
+        self.assertEqual((len(cache), cache.size), (2, 10))
+        cache.get(blob_sha(b"12345"))
+        cache.set(blob_sha(b"xyz"), b"xyz")
+        self.assertEqual((len(cache), cache.size), (2, 8))
+        self.assertNotIn(blob_sha(b"abcde"), cache)
+        cache.set(blob_sha(b"too large blob"), b"too large blob")
+        self.assertNotIn(blob_sha(b"too large blob"), cache)
+        self.assertEqual(pickle.loads(pickle.dumps(cache)).get(blob_sha(b"xyz")), b"xyz")
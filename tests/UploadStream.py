@@ -0,0 +1,107 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+
+import requests
+from urllib3.exceptions import UnrewindableBodyError
+from urllib3.util.request import rewind_body, set_file_position
+
+from github.UploadStream import UploadStream as Stream
+
+DATA = bytes(range(256)) * 40
+DIGEST = f"sha256:{hashlib.sha256(DATA).hexdigest()}"
+
+
+class UploadStream(unittest.TestCase):
+    def testStreamFile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "asset.bin")
+            with open(path, "wb") as f:
+                f.write(DATA)
+            progress = []
+            stream = Stream(path, chunk_size=4096, progress=lambda sent, total: progress.append((sent, total)))
+            self.assertEqual(len(stream), len(DATA))
+            self.assertEqual([len(chunk) for chunk in stream], [4096, 4096, 2048])
+            self.assertEqual(stream.digest, DIGEST)
+            self.assertEqual(progress, [(4096, 10240), (8192, 10240), (10240, 10240)])
+            stream.close()
+            self.assertTrue(stream.closed)
+
+    def testStreamFileLikeFromOffset(self):
+        file_like = io.BytesIO(b"header" + DATA)
+        file_like.seek(6)
+        stream = Stream(file_like)
+        self.assertEqual(stream.size, len(DATA))
+        self.assertEqual(stream.read(), DATA)
+        self.assertEqual(stream.digest, DIGEST)
+        # the stream does not close file-likes it did not open
+        stream.close()
+        self.assertFalse(file_like.closed)
+
+    def testStreamIterable(self):
+        chunks = (DATA[i : i + 1000] for i in range(0, len(DATA), 1000))
+        stream = Stream(chunks, size=len(DATA))
+        self.assertEqual(stream.read(300), DATA[:300])
+        self.assertEqual(stream.read(2500), DATA[300:2800])
+        self.assertEqual(stream.tell(), 2800)
+        self.assertEqual(stream.read(), DATA[2800:])
+        self.assertEqual(stream.read(10), b"")
+        self.assertEqual(stream.digest, DIGEST)
+
+    def testSizeIsRequiredForIterables(self):
+        with self.assertRaises(ValueError):
+            Stream(iter([DATA]))
+
+    def testRewindSeekableSource(self):
+        stream = Stream(io.BytesIO(DATA))
+        position = set_file_position(stream, None)
+        stream.read(5000)
+        rewind_body(stream, position)
+        self.assertEqual(stream.tell(), 0)
+        self.assertEqual(stream.read(), DATA)
+        self.assertEqual(stream.digest, DIGEST)
+
+    def testRewindNonSeekableSource(self):
+        stream = Stream(iter([DATA]), size=len(DATA))
+        self.assertFalse(stream.seekable())
+        position = set_file_position(stream, None)
+        stream.read(5000)
+        with self.assertRaises(UnrewindableBodyError):
+            rewind_body(stream, position)
+
+    def testSeekIntoContent(self):
+        stream = Stream(io.BytesIO(DATA))
+        with self.assertRaises(io.UnsupportedOperation):
+            stream.seek(10)
+
+    def testRequestBody(self):
+        stream = Stream(iter([DATA]), size=len(DATA))
+        request = requests.Request("POST", "https://uploads.github.com/", data=stream).prepare()
+        self.assertIs(request.body, stream)
+        self.assertEqual(request.headers["Content-Length"], str(len(DATA)))
+        self.assertNotIn("Transfer-Encoding", request.headers)
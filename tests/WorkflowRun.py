@@ -34,6 +34,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from unittest import mock
+
+from github import Consts
 
 from . import Framework
 
@@ -207,3 +210,22 @@ class WorkflowRun(Framework.TestCase):
         self.assertEqual(workflow_attempt.id, 26365060973)
         self.assertEqual(workflow_attempt.name, "CodeQL Advanced")
         self.assertEqual(workflow_attempt.run_attempt, 2)
+
+    def test_download_logs(self):
+        progress = mock.Mock()
+        with mock.patch.object(self.workflow_run.requester, "getFile") as getFile:
+            self.assertIsNone(self.workflow_run.download_logs("logs.zip", progress=progress))
+        getFile.assert_called_once_with(
+            "https://api.github.com/repos/PyGithub/PyGithub/actions/runs/3881497935/logs",
+            path="logs.zip",
+            chunk_size=Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+            progress=progress,
+            max_resumes=Consts.DEFAULT_DOWNLOAD_MAX_RESUMES,
+        )
+
+        with mock.patch.object(self.workflow_run.requester, "getStream", return_value=(200, {}, iter([]))) as getStream:
+            self.assertEqual(self.workflow_run.download_logs()[0], 200)
+        getStream.assert_called_once_with(
+            "https://api.github.com/repos/PyGithub/PyGithub/actions/runs/3881497935/logs",
+            chunk_size=Consts.DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        )